@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import Any
+
+from starlette_admin import BaseField, IntegerField, TextAreaField
 from starlette_admin.contrib.sqla import Admin as SQLAlchemyAdmin
 from starlette_admin.contrib.sqla import ModelView as SQLAlchemyModelView
+from starlette_admin.contrib.sqla.converters import ModelConverter
+from starlette_admin.converters import converts
 
 from orm import (
     AdminModel,
@@ -44,6 +49,27 @@ from orm import (
 from orm.core import engine
 
 
+class ApplicationModelConverter(ModelConverter):
+    @converts("sqlalchemy.dialects.postgresql.types.TSVECTOR")
+    def conv_tsvector(self, *args: Any, **kwargs: Any) -> BaseField:
+        return TextAreaField(
+            **self._field_common(*args, **kwargs) | {"required": False},
+            exclude_from_create=True,
+            exclude_from_edit=True,
+        )
+
+    @converts("sqlalchemy.sql.sqltypes.NullType")
+    def conv_query_expression(self, *args: Any, name: str, **kwargs: Any) -> BaseField:
+        # query expressions (e.g. review reaction counts) are only loaded on demand
+        return IntegerField(
+            name=name,
+            exclude_from_list=True,
+            exclude_from_detail=True,
+            exclude_from_create=True,
+            exclude_from_edit=True,
+        )
+
+
 def create_sqlalchemy_admin() -> SQLAlchemyAdmin:
     admin = SQLAlchemyAdmin(
         engine=engine,
@@ -65,11 +91,11 @@ def create_sqlalchemy_admin() -> SQLAlchemyAdmin:
     admin.add_view(SQLAlchemyModelView(OrderModel))
     admin.add_view(SQLAlchemyModelView(OrderProductVariationModel))
     admin.add_view(SQLAlchemyModelView(OrderStatusModel))
-    admin.add_view(SQLAlchemyModelView(ProductModel))
+    admin.add_view(SQLAlchemyModelView(ProductModel, converter=ApplicationModelConverter()))
     admin.add_view(SQLAlchemyModelView(ProductImageModel))
     admin.add_view(SQLAlchemyModelView(ProductPriceModel))
     admin.add_view(SQLAlchemyModelView(ProductPropertyValueModel))
-    admin.add_view(SQLAlchemyModelView(ProductReviewModel))
+    admin.add_view(SQLAlchemyModelView(ProductReviewModel, converter=ApplicationModelConverter()))
     admin.add_view(SQLAlchemyModelView(ProductReviewPhotoModel))
     admin.add_view(SQLAlchemyModelView(ProductReviewReactionModel))
     admin.add_view(SQLAlchemyModelView(ProductVariationCountModel))
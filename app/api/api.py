@@ -3,6 +3,7 @@ from __future__ import annotations
 from fastapi import APIRouter
 
 from .routers import (
+    cart_router,
     categories_router,
     common_router,
     login_router,
@@ -19,6 +20,7 @@ from .routers import (
 
 def create_api_router() -> APIRouter:
     api_router = APIRouter()
+    api_router.include_router(cart_router, tags=["cart"], prefix="/cart")
     api_router.include_router(categories_router, tags=["categories"], prefix="/categories")
     api_router.include_router(common_router, tags=["common"], prefix="/common")
     api_router.include_router(login_router, tags=["login"], prefix="/login")
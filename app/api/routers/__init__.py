@@ -1,3 +1,4 @@
+from .cart import router as cart_router
 from .categories import router as categories_router
 from .common import router as common_router
 from .login import router as login_router
@@ -11,6 +12,7 @@ from .suppliers import router as suppliers_router
 from .users import router as users_router
 
 __all__ = (
+    "cart_router",
     "categories_router",
     "common_router",
     "login_router",
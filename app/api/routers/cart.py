@@ -0,0 +1,289 @@
+from typing import Any
+
+from corecrud import Limit, OrderBy, OuterJoin, Returning, SelectFrom, Values, Where
+from fastapi import APIRouter
+from fastapi.exceptions import HTTPException
+from fastapi.param_functions import Body, Path, Query
+from sqlalchemy import func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import join
+from starlette import status
+
+from core.app import crud
+from core.depends import DatabaseSession, SellerIdAuthorization
+from core.routing import TransactionRoute
+from orm import (
+    OrderModel,
+    OrderProductVariationModel,
+    ProductListingModel,
+    ProductModel,
+    ProductPriceModel,
+    ProductVariationCountModel,
+    ProductVariationValueModel,
+)
+from schemas import ApplicationResponse, BodyCartLineRequest
+from typing_ import DictStrAny, RouteReturnT
+
+router = APIRouter(route_class=TransactionRoute)
+
+
+def in_cart(seller_id: int) -> Any:
+    return OrderProductVariationModel.order_id.in_(
+        crud.raws.select.executor.query.build(
+            Where(OrderModel.seller_id == seller_id, OrderModel.is_cart.is_(True)),
+            SelectFrom(OrderModel),
+            nested_select=[OrderModel.id],
+        )
+    )
+
+
+async def get_cart_core(session: AsyncSession, seller_id: int) -> DictStrAny:
+    """
+    Lines of all carts of the seller with the price tier that applies to the cart
+    quantity of their product, line totals and the grand total, in one statement.
+    """
+
+    build = crud.raws.select.executor.query.build
+
+    lines = build(
+        Where(in_cart(seller_id=seller_id)),
+        SelectFrom(
+            join(
+                OrderProductVariationModel,
+                ProductVariationCountModel,
+                ProductVariationCountModel.id
+                == OrderProductVariationModel.product_variation_count_id,
+            )
+            .join(
+                ProductVariationValueModel,
+                ProductVariationValueModel.id
+                == ProductVariationCountModel.product_variation_value1_id,
+            )
+            .join(ProductModel, ProductModel.id == ProductVariationValueModel.product_id)
+            .outerjoin(ProductListingModel, ProductListingModel.id == ProductModel.id)
+        ),
+        nested_select=[
+            OrderProductVariationModel.id,
+            OrderProductVariationModel.order_id,
+            OrderProductVariationModel.product_variation_count_id,
+            OrderProductVariationModel.count,
+            ProductVariationCountModel.count.label("stock_count"),
+            ProductModel.id.label("product_id"),
+            ProductModel.name.label("product_name"),
+            ProductListingModel.image_url,
+            func.sum(OrderProductVariationModel.count)
+            .over(partition_by=ProductModel.id)
+            .label("product_count"),
+        ],
+    ).cte("cart_line")
+    # the current price tier with the largest minimum the cart quantity reaches
+    price = build(
+        Where(
+            ProductPriceModel.product_id == lines.c.product_id,
+            func.now().between(ProductPriceModel.start_date, ProductPriceModel.end_date),
+            ProductPriceModel.min_quantity <= lines.c.product_count,
+        ),
+        OrderBy(ProductPriceModel.min_quantity.desc(), ProductPriceModel.id.desc()),
+        Limit(1),
+        nested_select=[
+            ProductPriceModel.value,
+            ProductPriceModel.discount,
+            ProductPriceModel.min_quantity,
+        ],
+    ).lateral("tier_price")
+    unit_price = func.round(price.c.value * (1 - func.coalesce(price.c.discount, 0)), 2)
+    line_total = unit_price * lines.c.count
+
+    rows = await crud.raws.select.many(
+        SelectFrom(lines),
+        OuterJoin(price, true()),
+        OrderBy(lines.c.id),
+        nested_select=[
+            *lines.c,
+            price.c.value.label("price_value"),
+            price.c.discount,
+            price.c.min_quantity,
+            unit_price.label("unit_price"),
+            line_total.label("line_total"),
+            func.sum(line_total).over().label("total"),
+        ],
+        session=session,
+    )
+
+    return {
+        "lines": [{key: value for key, value in row.items() if key != "total"} for row in rows],
+        "total": rows[0].total or 0 if rows else 0,
+    }
+
+
+async def add_cart_line_core(
+    session: AsyncSession,
+    seller_id: int,
+    request: BodyCartLineRequest,
+) -> None:
+    variation = await crud.products_variation_counts.select.one(
+        Where(ProductVariationCountModel.id == request.product_variation_count_id),
+        session=session,
+    )
+    if not variation:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Product variation not found",
+        )
+
+    line = await crud.orders_products_variation.select.one(
+        Where(
+            in_cart(seller_id=seller_id),
+            OrderProductVariationModel.product_variation_count_id
+            == request.product_variation_count_id,
+        ),
+        session=session,
+    )
+    if line:
+        await crud.orders_products_variation.update.one(
+            Values(
+                {
+                    OrderProductVariationModel.count: OrderProductVariationModel.count
+                    + request.count
+                }
+            ),
+            Where(OrderProductVariationModel.id == line.id),
+            Returning(OrderProductVariationModel.id),
+            session=session,
+        )
+        return
+
+    cart = await crud.orders.select.one(
+        Where(OrderModel.seller_id == seller_id, OrderModel.is_cart.is_(True)),
+        OrderBy(OrderModel.id.desc()),
+        Limit(1),
+        session=session,
+    )
+    if not cart:
+        cart = await crud.orders.insert.one(
+            Values({OrderModel.seller_id: seller_id, OrderModel.is_cart: True}),
+            Returning(OrderModel),
+            session=session,
+        )
+
+    await crud.orders_products_variation.insert.one(
+        Values(
+            {
+                OrderProductVariationModel.order_id: cart.id,
+                OrderProductVariationModel.product_variation_count_id: (
+                    request.product_variation_count_id
+                ),
+                OrderProductVariationModel.count: request.count,
+            }
+        ),
+        Returning(OrderProductVariationModel.id),
+        session=session,
+    )
+
+
+async def update_cart_line_core(
+    session: AsyncSession,
+    seller_id: int,
+    line_id: int,
+    count: int,
+) -> None:
+    line = await crud.orders_products_variation.update.one(
+        Values({OrderProductVariationModel.count: count}),
+        Where(OrderProductVariationModel.id == line_id, in_cart(seller_id=seller_id)),
+        Returning(OrderProductVariationModel.id),
+        session=session,
+    )
+    if not line:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cart line not found",
+        )
+
+
+async def remove_cart_line_core(session: AsyncSession, seller_id: int, line_id: int) -> None:
+    line = await crud.orders_products_variation.delete.one(
+        Where(OrderProductVariationModel.id == line_id, in_cart(seller_id=seller_id)),
+        Returning(OrderProductVariationModel.id),
+        session=session,
+    )
+    if not line:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Cart line not found",
+        )
+
+
+@router.get(
+    path="/",
+    summary="WORKS: Show seller cart with tier prices and totals.",
+    response_model=ApplicationResponse[RouteReturnT],
+    status_code=status.HTTP_200_OK,
+)
+async def get_cart(
+    user: SellerIdAuthorization,
+    session: DatabaseSession,
+) -> RouteReturnT:
+    return {
+        "ok": True,
+        "result": await get_cart_core(session=session, seller_id=user.seller.id),
+    }
+
+
+@router.post(
+    path="/",
+    summary="WORKS: Add product variation to cart (adds up with the existing line).",
+    response_model=ApplicationResponse[RouteReturnT],
+    status_code=status.HTTP_200_OK,
+)
+async def add_cart_line(
+    user: SellerIdAuthorization,
+    session: DatabaseSession,
+    request: BodyCartLineRequest = Body(...),
+) -> RouteReturnT:
+    await add_cart_line_core(session=session, seller_id=user.seller.id, request=request)
+
+    return {
+        "ok": True,
+        "result": await get_cart_core(session=session, seller_id=user.seller.id),
+    }
+
+
+@router.patch(
+    path="/{line_id}/",
+    summary="WORKS: Change count of cart line.",
+    response_model=ApplicationResponse[RouteReturnT],
+    status_code=status.HTTP_200_OK,
+)
+async def update_cart_line(
+    user: SellerIdAuthorization,
+    session: DatabaseSession,
+    line_id: int = Path(...),
+    count: int = Query(..., ge=1),
+) -> RouteReturnT:
+    await update_cart_line_core(
+        session=session, seller_id=user.seller.id, line_id=line_id, count=count
+    )
+
+    return {
+        "ok": True,
+        "result": await get_cart_core(session=session, seller_id=user.seller.id),
+    }
+
+
+@router.delete(
+    path="/{line_id}/",
+    summary="WORKS: Remove cart line.",
+    response_model=ApplicationResponse[RouteReturnT],
+    status_code=status.HTTP_200_OK,
+)
+async def remove_cart_line(
+    user: SellerIdAuthorization,
+    session: DatabaseSession,
+    line_id: int = Path(...),
+) -> RouteReturnT:
+    await remove_cart_line_core(session=session, seller_id=user.seller.id, line_id=line_id)
+
+    return {
+        "ok": True,
+        "result": await get_cart_core(session=session, seller_id=user.seller.id),
+    }
@@ -1,34 +1,29 @@
 from typing import List
 
-from corecrud import Options
 from fastapi import APIRouter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 from starlette import status
 
-from core.app import crud
-from core.depends import DatabaseSession
-from orm import CategoryModel
+from core.app import category_tree
+from core.depends import ReadOnlyDatabaseSession
+from core.routing import TransactionRoute
 from schemas import ApplicationResponse, Category
 from typing_ import RouteReturnT
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
-async def get_all_categories_core(session: AsyncSession) -> List[CategoryModel]:
-    return await crud.categories.select.many(
-        Options(selectinload(CategoryModel.children)),
-        session=session,
-    )
+async def get_all_categories_core(session: AsyncSession) -> List[Category]:
+    return await category_tree.categories(session=session)
 
 
 @router.get(
     path="/all/",
-    summary="WORKS: Get all categories.",
+    summary="WORKS: Get all categories with their nested children.",
     response_model=ApplicationResponse[List[Category]],
     status_code=status.HTTP_200_OK,
 )
-async def get_all_categories(session: DatabaseSession) -> RouteReturnT:
+async def get_all_categories(session: ReadOnlyDatabaseSession) -> RouteReturnT:
     return {
         "ok": True,
         "result": await get_all_categories_core(session=session),
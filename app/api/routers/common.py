@@ -5,12 +5,13 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
 from core.app import crud
-from core.depends import DatabaseSession
+from core.depends import ReadOnlyDatabaseSession
+from core.routing import TransactionRoute
 from orm import CountryModel, NumberEmployeesModel
 from schemas import ApplicationResponse, Country, NumberEmployees
 from typing_ import RouteReturnT
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 async def get_all_country_core(session: AsyncSession) -> List[CountryModel]:
@@ -23,7 +24,7 @@ async def get_all_country_core(session: AsyncSession) -> List[CountryModel]:
     response_model=ApplicationResponse[List[Country]],
     status_code=status.HTTP_200_OK,
 )
-async def get_all_country_codes(session: DatabaseSession) -> RouteReturnT:
+async def get_all_country_codes(session: ReadOnlyDatabaseSession) -> RouteReturnT:
     return {
         "ok": True,
         "result": await get_all_country_core(session=session),
@@ -40,7 +41,7 @@ async def get_number_employees_core(session: AsyncSession) -> List[NumberEmploye
     response_model=ApplicationResponse[List[NumberEmployees]],
     status_code=status.HTTP_200_OK,
 )
-async def get_number_employees(session: DatabaseSession) -> RouteReturnT:
+async def get_number_employees(session: ReadOnlyDatabaseSession) -> RouteReturnT:
     return {
         "ok": True,
         "result": await get_number_employees_core(session=session),
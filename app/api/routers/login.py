@@ -1,4 +1,4 @@
-from corecrud import Options, Where
+from corecrud import Options, Returning, Values, Where
 from fastapi import APIRouter, Depends
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Body
@@ -6,17 +6,23 @@ from fastapi.responses import Response
 from sqlalchemy.orm import selectinload
 from starlette import status
 
-from core.app import crud
-from core.depends import AuthJWT, Authorization, AuthorizationRefresh, DatabaseSession
+from core.app import crud, passwords
+from core.depends import (
+    AuthJWT,
+    Authorization,
+    AuthorizationRefresh,
+    DatabaseSession,
+    load_claims,
+)
 from core.depends.google_token import verify_google_token
-from core.security import check_hashed_password
+from core.routing import TransactionRoute
 from enums import UserType
-from orm import UserModel
+from orm import UserCredentialsModel, UserModel
 from schemas import ApplicationResponse, BodyLoginRequest, User
 from typing_ import DictStrAny, RouteReturnT
 from utils.cookies import set_and_create_tokens_cookies
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 @router.post(
@@ -36,11 +42,16 @@ async def login_user(
         Options(selectinload(UserModel.credentials)),
         session=session,
     )
+    verified, rehashed = (
+        await passwords.check_and_update(
+            password=request.password, hashed=user.credentials.password
+        )
+        if user
+        else (False, None)
+    )
     if (
         not user  # user not found
-        or not check_hashed_password(
-            password=request.password, hashed=user.credentials.password
-        )  # password doesn't  matches
+        or not verified  # password doesn't  matches
         or not user.is_verified  # user doesn't verify their email
         or user.is_deleted  # account was deleted
     ):
@@ -49,7 +60,21 @@ async def login_user(
             detail="Wrong email or password, maybe email was not confirmed or account was deleted?",
         )
 
-    set_and_create_tokens_cookies(response=response, authorize=authorize, subject=user.id)
+    if rehashed:
+        # the hash predates the current scheme and rounds policy
+        await crud.users_credentials.update.one(
+            Values({UserCredentialsModel.password: rehashed}),
+            Where(UserCredentialsModel.id == user.credentials.id),
+            Returning(UserCredentialsModel.id),
+            session=session,
+        )
+
+    set_and_create_tokens_cookies(
+        response=response,
+        authorize=authorize,
+        subject=user.id,
+        claims=await load_claims(user_id=user.id, session=session),
+    )
 
     return {
         "ok": True,
@@ -67,8 +92,14 @@ async def refresh_jwt_tokens(
     response: Response,
     authorize: AuthJWT,
     user: AuthorizationRefresh,
+    session: DatabaseSession,
 ) -> RouteReturnT:
-    set_and_create_tokens_cookies(response=response, authorize=authorize, subject=user.id)
+    set_and_create_tokens_cookies(
+        response=response,
+        authorize=authorize,
+        subject=user.id,
+        claims=await load_claims(user_id=user.id, session=session),
+    )
 
     return {
         "ok": True,
@@ -133,7 +164,12 @@ async def google_auth(
             detail="Wrong email, maybe email was not confirmed or account was deleted?",
         )
 
-    set_and_create_tokens_cookies(response=response, authorize=authorize, subject=user.id)
+    set_and_create_tokens_cookies(
+        response=response,
+        authorize=authorize,
+        subject=user.id,
+        claims=await load_claims(user_id=user.id, session=session),
+    )
 
     return {
         "ok": True,
@@ -4,11 +4,12 @@ from fastapi.responses import Response
 from starlette import status
 
 from core.depends import AuthJWT, authorization
+from core.routing import TransactionRoute
 from schemas import ApplicationResponse
 from typing_ import RouteReturnT
 from utils.cookies import unset_jwt_cookies
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 @router.delete(
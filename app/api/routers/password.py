@@ -7,9 +7,9 @@ from fastapi_mail import MessageSchema, MessageType
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from core.app import crud, fm
+from core.app import crud, fm, passwords
 from core.depends import Authorization, DatabaseSession
-from core.security import check_hashed_password, hash_password
+from core.routing import TransactionRoute
 from core.settings import application_settings
 from orm import ResetTokenModel, UserCredentialsModel, UserModel
 from schemas import (
@@ -21,14 +21,14 @@ from schemas import (
 from schemas import QueryTokenConfirmationRequest as QueryTokenRequest
 from typing_ import RouteReturnT
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 async def change_password_core(session: AsyncSession, user_id: int, password: str) -> None:
     await crud.users_credentials.update.one(
         Values(
             {
-                UserCredentialsModel.password: hash_password(password=password),
+                UserCredentialsModel.password: await passwords.hash(password=password),
             }
         ),
         Where(UserCredentialsModel.user_id == user_id),
@@ -52,7 +52,7 @@ async def change_password(
         Where(UserCredentialsModel.user_id == user.id),
         session=session,
     )
-    if not check_hashed_password(password=request.old_password, hashed=user_credentials.password):
+    if not await passwords.check(password=request.old_password, hashed=user_credentials.password):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Invalid password",
@@ -165,7 +165,7 @@ async def reset_password_core(
         Values(
             {
                 UserCredentialsModel.user_id: user_id,
-                UserCredentialsModel.password: hash_password(password=password),
+                UserCredentialsModel.password: await passwords.hash(password=password),
             }
         ),
         Where(UserCredentialsModel.user_id == user_id),
@@ -1,31 +1,57 @@
-from typing import Any, List, Optional
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
 
 from corecrud import (
-    Correlate,
-    Filter,
     GroupBy,
     Join,
     Limit,
     Offset,
     Options,
     OrderBy,
+    OuterJoin,
     Returning,
     SelectFrom,
     Values,
     Where,
 )
 from fastapi import APIRouter
+from fastapi.background import BackgroundTasks
 from fastapi.exceptions import HTTPException
-from fastapi.param_functions import Body, Depends, Path, Query
-from sqlalchemy import and_, func
+from fastapi.param_functions import Body, Depends, Header, Path, Query
+from fastapi.responses import Response
+from sqlalchemy import Integer, and_, func, or_
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import join, outerjoin, selectinload
 from starlette import status
 
-from core.app import crud
-from core.depends import DatabaseSession, SellerAuthorization
-from enums import CategoryPropertyTypeEnum, CategoryVariationTypeEnum, OrderStatus
+from core.app import (
+    category_tree,
+    crud,
+    favorites,
+    product_cache,
+    product_listing,
+    product_review_stats,
+    suggestions,
+)
+from core.depends import (
+    DatabaseSession,
+    ReadOnlyDatabaseSession,
+    SellerIdAuthorization,
+    SellerIdAuthorizationOptional,
+)
+from core.routing import TransactionRoute, isolation
+from enums import (
+    CategoryPropertyTypeEnum,
+    CategoryVariationTypeEnum,
+    FacetType,
+    Isolation,
+    OrderStatus,
+    RankingType,
+    SortType,
+)
 from orm import (
+    CategoryFacetModel,
+    CategoryModel,
     CategoryPropertyTypeModel,
     CategoryPropertyValueModel,
     CategoryVariationTypeModel,
@@ -33,118 +59,222 @@ from orm import (
     OrderModel,
     OrderProductVariationModel,
     ProductImageModel,
+    ProductListingModel,
     ProductModel,
     ProductPriceModel,
-    ProductReviewModel,
+    ProductRankingModel,
+    ProductReviewStatsModel,
     ProductVariationCountModel,
     ProductVariationValueModel,
     SellerFavoriteModel,
     SupplierModel,
+    TagsModel,
+    UserModel,
+    UserSearchModel,
 )
+from orm.core import async_sessionmaker
 from schemas import (
     ApplicationResponse,
+    BodyProductBatchRequest,
     BodyProductCompilationRequest,
     BodyProductPaginationRequest,
+    BodyProductSearchRequest,
     Product,
     ProductImage,
+    ProductListing,
+    QueryCursorPaginationRequest,
     QueryPaginationRequest,
 )
-from typing_ import RouteReturnT
+from typing_ import DictStrAny, RouteReturnT
+from utils.cursor import encode_cursor, keyset
+
+router = APIRouter(route_class=TransactionRoute)
+
+
+async def cached(
+    session: AsyncSession,
+    response: Response,
+    if_none_match: Optional[str],
+    kind: str,
+    product_id: int,
+    load: Callable[[], Awaitable[Any]],
+) -> Any:
+    version = await product_cache.version(session=session, product_id=product_id)
+    if version is None:
+        return {
+            "ok": True,
+            "result": await load(),
+        }
+
+    etag = product_cache.etag(kind=kind, product_id=product_id, version=version)
+    if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    result = product_cache.get(kind=kind, product_id=product_id, version=version)
+    if result is None:
+        result = await load()
+        product_cache.put(kind=kind, product_id=product_id, version=version, value=result)
+
+    response.headers["ETag"] = etag
+    return {
+        "ok": True,
+        "result": result,
+    }
+
+
+def sorted_by(sort_type: SortType, ascending: bool, cursor: Optional[str]) -> List[Any]:
+    columns = (sort_type.by, ProductListingModel.id)
+
+    return [
+        and_(
+            sort_type.by.is_not(None) if sort_type.by.nullable else True,
+            keyset(columns=columns, cursor=cursor, ascending=ascending, prefix=(sort_type.value,)),
+        ),
+        OrderBy(*(column.asc() if ascending else column.desc() for column in columns)),
+    ]
+
+
+async def in_category(session: AsyncSession, column: Any, category_id: Optional[int]) -> Any:
+    if not category_id:
+        return True
+
+    return column.in_(await category_tree.subtree(session=session, category_id=category_id))
+
+
+def products_page(
+    products: List[ProductListingModel], sort_type: SortType, limit: int
+) -> Tuple[List[ProductListingModel], Optional[str]]:
+    if not products or len(products) < limit:
+        return products, None
 
-router = APIRouter()
+    last = products[-1]
+    return products, encode_cursor(sort_type.value, getattr(last, sort_type.by.key), last.id)
+
+
+async def with_favorites(
+    session: AsyncSession,
+    user: Optional[UserModel],
+    products: List[ProductListingModel],
+) -> List[Any]:
+    if not user or not user.seller:
+        return products
+
+    ids = await favorites.ids(session=session, seller_id=user.seller.id)
+    listed = [ProductListing.from_orm(product) for product in products]
+    for product in listed:
+        product.is_favorite = product.id in ids
+
+    return listed
 
 
 async def get_products_list_for_category_core(
     session: AsyncSession,
-    pagination: QueryPaginationRequest,
+    pagination: QueryCursorPaginationRequest,
     filters: BodyProductCompilationRequest,
-) -> List[ProductModel]:
-    return await crud.products.select.many(
+) -> Tuple[List[ProductListingModel], Optional[str]]:
+    after, order_by = sorted_by(
+        sort_type=filters.sort_type, ascending=filters.ascending, cursor=pagination.cursor
+    )
+    products = await crud.products_listing.select.many(
         Where(
-            ProductModel.is_active.is_(True),
-            True if not filters.category_id else ProductModel.category_id == filters.category_id,
-        ),
-        Options(
-            selectinload(ProductModel.prices),
-            selectinload(ProductModel.images),
-            selectinload(ProductModel.supplier).joinedload(SupplierModel.user),
+            await in_category(
+                session=session,
+                column=ProductListingModel.category_id,
+                category_id=filters.category_id,
+            ),
+            after,
         ),
-        Offset(pagination.offset),
+        Offset(None if pagination.cursor else pagination.offset),
         Limit(pagination.limit),
-        OrderBy(filters.sort_type.by.asc() if filters.ascending else filters.sort_type.by.desc()),
+        order_by,
         session=session,
     )
 
+    return products_page(products=products, sort_type=filters.sort_type, limit=pagination.limit)
+
 
 @router.post(
     path="/compilation/",
     summary="WORKS: Get list of products",
-    description="Available filters: total_orders, date, price, rating",
-    response_model=ApplicationResponse[List[Product]],
+    description="Available filters: total_orders, date, price, rating. "
+    "Pass `detail.next_cursor` of the previous page as `cursor` to get the next one.",
+    response_model=ApplicationResponse[List[ProductListing]],
 )
+@isolation(Isolation.READ_ONLY)
 async def get_products_list_for_category(
-    session: DatabaseSession,
-    pagination: QueryPaginationRequest = Depends(QueryPaginationRequest),
+    user: SellerIdAuthorizationOptional,
+    session: ReadOnlyDatabaseSession,
+    pagination: QueryCursorPaginationRequest = Depends(QueryCursorPaginationRequest),
     filters: BodyProductCompilationRequest = Body(...),
 ) -> RouteReturnT:
+    products, next_cursor = await get_products_list_for_category_core(
+        session=session,
+        pagination=pagination,
+        filters=filters,
+    )
+
     return {
         "ok": True,
-        "result": await get_products_list_for_category_core(
-            session=session,
-            pagination=pagination,
-            filters=filters,
-        ),
+        "result": await with_favorites(session=session, user=user, products=products),
+        "detail": {
+            "next_cursor": next_cursor,
+        },
     }
 
 
-@router.get(
-    path="/{product_id}/grades/",
-    summary="WORKS: get all reviews grades information",
-    response_model=ApplicationResponse[RouteReturnT],
-    status_code=status.HTTP_200_OK,
-)
-async def get_review_grades_info(
-    session: DatabaseSession,
-    product_id: int = Path(...),
-) -> RouteReturnT:
-    grade_info = await crud.raws.select.one(
+async def get_review_grades_info_core(session: AsyncSession, product_id: int) -> DictStrAny:
+    stats = await crud.raws.select.one(
         Where(ProductModel.id == product_id),
-        GroupBy(ProductModel.grade_average),
         SelectFrom(
             outerjoin(
                 ProductModel,
-                ProductReviewModel,
-                ProductReviewModel.product_id == ProductModel.id,
+                ProductReviewStatsModel,
+                ProductReviewStatsModel.product_id == ProductModel.id,
             ),
         ),
         nested_select=[
             ProductModel.grade_average,
-            func.count(ProductReviewModel.id).label("reviews_count"),
+            func.coalesce(ProductReviewStatsModel.review_count, 0).label("review_count"),
+            *(
+                func.coalesce(column, 0).label(column.key)
+                for column in product_review_stats.histogram
+            ),
         ],
         session=session,
     )
 
-    review_details = await crud.raws.select.many(
-        Where(ProductReviewModel.product_id == product_id),
-        GroupBy(ProductReviewModel.grade_overall),
-        OrderBy(ProductReviewModel.grade_overall.desc()),
-        SelectFrom(ProductReviewModel),
-        nested_select=[
-            ProductReviewModel.grade_overall,
-            func.count(ProductReviewModel.id).label("review_count"),
+    return {
+        "grade_average": stats.grade_average,
+        "review_count": stats.review_count,
+        "details": [
+            {"grade_overall": grade, "review_count": stats[column.key]}
+            for grade, column in reversed(list(enumerate(product_review_stats.histogram, 1)))
+            if stats[column.key]
         ],
+    }
+
+
+@router.get(
+    path="/{product_id}/grades/",
+    summary="WORKS: get all reviews grades information",
+    response_model=ApplicationResponse[RouteReturnT],
+    status_code=status.HTTP_200_OK,
+)
+async def get_review_grades_info(
+    session: ReadOnlyDatabaseSession,
+    response: Response,
+    product_id: int = Path(...),
+    if_none_match: Optional[str] = Header(None),
+) -> RouteReturnT:
+    return await cached(
         session=session,
+        response=response,
+        if_none_match=if_none_match,
+        kind="grades",
+        product_id=product_id,
+        load=lambda: get_review_grades_info_core(session=session, product_id=product_id),
     )
 
-    return {
-        "ok": True,
-        "result": {
-            "grade_average": grade_info.grade_average,
-            "review_count": grade_info.reviews_count,
-            "details": review_details,
-        },
-    }
-
 
 async def add_favorite_core(product_id: int, seller_id: int, session: AsyncSession) -> None:
     seller_favorite = await crud.sellers_favorites.select.one(
@@ -174,6 +304,7 @@ async def add_favorite_core(product_id: int, seller_id: int, session: AsyncSessi
         Returning(SellerFavoriteModel.id),
         session=session,
     )
+    favorites.add(session=session, seller_id=seller_id, product_id=product_id)
 
 
 @router.post(
@@ -183,7 +314,7 @@ async def add_favorite_core(product_id: int, seller_id: int, session: AsyncSessi
     status_code=status.HTTP_200_OK,
 )
 async def add_favorite(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     product_id: int = Query(...),
 ) -> RouteReturnT:
@@ -206,6 +337,7 @@ async def remove_favorite_core(product_id: int, seller_id: int, session: AsyncSe
         Returning(SellerFavoriteModel.id),
         session=session,
     )
+    favorites.remove(session=session, seller_id=seller_id, product_id=product_id)
 
 
 @router.delete(
@@ -214,8 +346,9 @@ async def remove_favorite_core(product_id: int, seller_id: int, session: AsyncSe
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.READ_COMMITTED)
 async def remove_favorite(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     product_id: int = Query(...),
 ) -> RouteReturnT:
@@ -244,13 +377,23 @@ async def get_product_images_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_product_images(
-    session: DatabaseSession,
+    session: ReadOnlyDatabaseSession,
+    response: Response,
     product_id: int = Path(...),
+    if_none_match: Optional[str] = Header(None),
 ) -> RouteReturnT:
-    return {
-        "ok": True,
-        "result": await get_product_images_core(product_id=product_id, session=session),
-    }
+    async def load() -> List[ProductImage]:
+        images = await get_product_images_core(product_id=product_id, session=session)
+        return [ProductImage.from_orm(image) for image in images]
+
+    return await cached(
+        session=session,
+        response=response,
+        if_none_match=if_none_match,
+        kind="images",
+        product_id=product_id,
+        load=load,
+    )
 
 
 async def show_cart_core(
@@ -295,11 +438,12 @@ async def show_cart_core(
 @router.get(
     path="/showCart/",
     summary="WORKS: Show seller cart.",
+    description="Deprecated, use GET /cart/. Keeps its old response until it is removed.",
     response_model=ApplicationResponse[List[RouteReturnT]],
     status_code=status.HTTP_200_OK,
 )
 async def show_cart(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
     return {
@@ -316,50 +460,113 @@ async def create_order_core(
     seller_id: int,
     session: AsyncSession,
 ) -> None:
-    order = await crud.orders.select.one(
-        Where(and_(OrderModel.id == order_id, OrderModel.seller_id == seller_id)),
-        session=session,
-    )
-
-    if not order or not order.is_cart:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Specified invalid order id",
-        )
+    """
+    Turn the seller's cart into an order in the caller's transaction, which must run
+    at READ COMMITTED and be rolled back on error: stock of every line is decremented
+    only while it stays non-negative, so concurrent checkouts cannot oversell.
+    """
 
-    # delete order from cart
     order = await crud.orders.update.one(
         Values({OrderModel.is_cart: False}),
-        Where(OrderModel.id == order_id),
+        Where(
+            OrderModel.id == order_id,
+            OrderModel.seller_id == seller_id,
+            OrderModel.is_cart.is_(True),
+        ),
         Returning(OrderModel.id),
         session=session,
     )
+    if not order:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Specified invalid order id",
+        )
 
-    order_product_variation = await crud.orders_products_variation.select.one(
-        Where(OrderProductVariationModel.order_id == order.id),
-        session=session,
+    build = crud.raws.select.executor.query.build
+    line = build(
+        Where(OrderProductVariationModel.order_id == order_id),
+        GroupBy(OrderProductVariationModel.product_variation_count_id),
+        nested_select=[
+            OrderProductVariationModel.product_variation_count_id.label("id"),
+            func.sum(OrderProductVariationModel.count).label("count"),
+        ],
+    ).subquery("line")
+    # rows are locked product by product, variation by variation, the same order
+    # for every checkout, so that checkouts sharing products cannot deadlock
+    locked = (
+        build(
+            SelectFrom(
+                join(line, ProductVariationCountModel, ProductVariationCountModel.id == line.c.id)
+                .join(
+                    ProductVariationValueModel,
+                    ProductVariationValueModel.id
+                    == ProductVariationCountModel.product_variation_value1_id,
+                )
+                .join(ProductModel, ProductModel.id == ProductVariationValueModel.product_id)
+            ),
+            OrderBy(ProductModel.id, ProductVariationCountModel.id),
+            nested_select=[line.c.id, line.c.count, ProductModel.id.label("product_id")],
+        )
+        .with_for_update(of=[ProductVariationCountModel, ProductModel])
+        .cte("locked")
     )
-
-    # subtract ordered amount from amount in stock
-    await crud.products_variation_counts.update.one(
+    products = build(SelectFrom(locked), nested_select=[locked.c.product_id.distinct()])
+    stock = crud.products_variation_counts.update.executor.query.build(
         Values(
-            {
-                ProductVariationCountModel.count: ProductVariationCountModel.count
-                - order_product_variation.count
-            }
+            {ProductVariationCountModel.count: ProductVariationCountModel.count - locked.c.count}
+        ),
+        Where(
+            ProductVariationCountModel.id == locked.c.id,
+            ProductVariationCountModel.count >= locked.c.count,
         ),
-        Where(ProductVariationCountModel.id == order_product_variation.product_variation_count_id),
         Returning(ProductVariationCountModel.id),
-        session=session,
-    )
-
-    # change order status
-    await crud.orders_products_variation.update.one(
+    ).cte("stock")
+    paid = crud.orders_products_variation.update.executor.query.build(
         Values({OrderProductVariationModel.status_id: OrderStatus.PAID.value}),
-        Where(OrderProductVariationModel.order_id == order.id),
+        Where(OrderProductVariationModel.order_id == order_id),
         Returning(OrderProductVariationModel.id),
+    ).cte("paid")
+    # the version keys the cached product card, which shows `total_orders`
+    ordered = crud.products.update.executor.query.build(
+        Values(
+            {
+                ProductModel.total_orders: ProductModel.total_orders + 1,
+                ProductModel.version: ProductModel.version + 1,
+            }
+        ),
+        Where(ProductModel.id.in_(products)),
+        Returning(ProductModel.id),
+    ).cte("ordered")
+    listed = crud.products_listing.update.executor.query.build(
+        Values({ProductListingModel.total_orders: ProductListingModel.total_orders + 1}),
+        Where(ProductListingModel.id.in_(products)),
+        Returning(ProductListingModel.id),
+    ).cte("listed")
+
+    def count(cte: Any) -> Any:
+        return build(SelectFrom(cte), nested_select=[func.count()]).scalar_subquery()
+
+    # every data-modifying CTE has to be referenced to be part of the statement
+    checkout = await crud.raws.select.one(
+        nested_select=[
+            count(locked).label("lines"),
+            count(stock).label("decremented"),
+            count(paid).label("paid"),
+            count(ordered).label("ordered"),
+            count(listed).label("listed"),
+        ],
         session=session,
     )
+    if not checkout.lines:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Order is empty",
+        )
+    if checkout.decremented < checkout.lines:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Not enough products in stock",
+        )
 
 
 @router.post(
@@ -369,8 +576,9 @@ async def create_order_core(
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.READ_COMMITTED)
 async def create_order(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     order_id: int = Path(...),
 ) -> RouteReturnT:
@@ -429,7 +637,7 @@ async def change_order_status_core(
     status_code=status.HTTP_200_OK,
 )
 async def change_order_status(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     order_product_variation_id: int = Path(...),
     status_id: OrderStatus = Path(...),
@@ -447,114 +655,161 @@ async def change_order_status(
     }
 
 
-async def get_popular_products_core(
+async def get_ranked_products_core(
     session: AsyncSession,
     product_id: int,
-    category_id: int,
+    ranking: RankingType,
     offset: int,
     limit: int,
-    order_by: Any,
-) -> List[ProductModel]:
-    return await crud.products.select.many(
+) -> List[ProductListingModel]:
+    category_id = crud.raws.select.executor.query.build(
+        Where(ProductListingModel.id == product_id),
+        SelectFrom(ProductListingModel),
+        nested_select=[ProductListingModel.category_id],
+    ).scalar_subquery()
+
+    return await crud.products_listing.select.many(
         Where(
-            and_(
-                ProductModel.id != product_id,
-                ProductModel.category_id == category_id,
-                ProductModel.is_active.is_(True),
-            ),
-        ),
-        Join(
-            ProductPriceModel,
-            and_(
-                ProductModel.id == ProductPriceModel.product_id,
-                ProductPriceModel.min_quantity
-                == crud.raws.select.executor.query.build(
-                    Where(
-                        and_(
-                            ProductPriceModel.product_id == product_id,
-                            func.now().between(
-                                ProductPriceModel.start_date, ProductPriceModel.end_date
-                            ),
-                        ),
-                    ),
-                    SelectFrom(ProductPriceModel),
-                    Correlate(ProductModel),
-                    nested_select=[func.min(ProductPriceModel.min_quantity)],
-                ).as_scalar(),
-            ),
-        ),
-        Options(
-            selectinload(ProductModel.prices),
-            selectinload(ProductModel.images),
+            ProductRankingModel.ranking == ranking,
+            ProductRankingModel.category_id == category_id,
+            ProductRankingModel.product_id != product_id,
         ),
+        Join(ProductRankingModel, ProductRankingModel.product_id == ProductListingModel.id),
         Offset(offset),
         Limit(limit),
-        OrderBy(order_by),
-        session=session,
-    )
-
-
-async def get_category_id(session: AsyncSession, product_id: int) -> int:
-    product = await crud.raws.select.one(
-        Where(ProductModel.id == product_id),
-        SelectFrom(ProductModel),
-        nested_select=[ProductModel.category_id],
+        OrderBy(ProductRankingModel.position),
         session=session,
     )
 
-    return product.category_id
-
 
 @router.get(
     path="/popular/",
     summary="WORKS (example 1-100): Get popular products in this category.",
-    response_model=ApplicationResponse[List[Product]],
+    description="Ranked by orders, then rating and recency; rankings are refreshed periodically.",
+    response_model=ApplicationResponse[List[ProductListing]],
     status_code=status.HTTP_200_OK,
 )
 async def popular_products(
-    session: DatabaseSession,
+    user: SellerIdAuthorizationOptional,
+    session: ReadOnlyDatabaseSession,
     product_id: int = Query(...),
     pagination: QueryPaginationRequest = Depends(),
-) -> ApplicationResponse[List[Product]]:
-    category_id = await get_category_id(session=session, product_id=product_id)
+) -> ApplicationResponse[List[ProductListing]]:
+    products = await get_ranked_products_core(
+        session=session,
+        product_id=product_id,
+        ranking=RankingType.POPULAR,
+        offset=pagination.offset,
+        limit=pagination.limit,
+    )
 
     return {
         "ok": True,
-        "result": await get_popular_products_core(
-            session=session,
-            product_id=product_id,
-            category_id=category_id,
-            offset=pagination.offset,
-            limit=pagination.limit,
-            order_by=ProductModel.total_orders,
-        ),
+        "result": await with_favorites(session=session, user=user, products=products),
     }
 
 
 @router.get(
     path="/similar/",
     summary="WORKS (example 1-100): Get similar products by product_id.",
-    response_model=ApplicationResponse[List[Product]],
+    description="Ranked by rating, then recency and orders; rankings are refreshed periodically.",
+    response_model=ApplicationResponse[List[ProductListing]],
     status_code=status.HTTP_200_OK,
 )
 async def similar_products(
-    session: DatabaseSession,
+    user: SellerIdAuthorizationOptional,
+    session: ReadOnlyDatabaseSession,
     product_id: int = Query(...),
     pagination: QueryPaginationRequest = Depends(),
-) -> ApplicationResponse[List[Product]]:
-    category_id = await get_category_id(session=session, product_id=product_id)
+) -> ApplicationResponse[List[ProductListing]]:
+    products = await get_ranked_products_core(
+        session=session,
+        product_id=product_id,
+        ranking=RankingType.SIMILAR,
+        offset=pagination.offset,
+        limit=pagination.limit,
+    )
 
     return {
         "ok": True,
-        "result": await get_popular_products_core(
+        "result": await with_favorites(session=session, user=user, products=products),
+    }
+
+
+def variation_value_ids(type_name: CategoryVariationTypeEnum, values: List[str]) -> Any:
+    return func.array(
+        crud.raws.select.executor.query.build(
+            Where(
+                CategoryVariationValueModel.value.in_(values),
+                CategoryVariationTypeModel.name == type_name,
+            ),
+            Join(
+                CategoryVariationTypeModel,
+                CategoryVariationTypeModel.id == CategoryVariationValueModel.variation_type_id,
+            ),
+            nested_select=[CategoryVariationValueModel.id],
+        ).scalar_subquery()
+    )
+
+
+def property_value_ids(type_name: CategoryPropertyTypeEnum, values: List[str]) -> Any:
+    return func.array(
+        crud.raws.select.executor.query.build(
+            Where(
+                CategoryPropertyValueModel.value.in_(values),
+                CategoryPropertyTypeModel.name == type_name,
+            ),
+            Join(
+                CategoryPropertyTypeModel,
+                CategoryPropertyTypeModel.id == CategoryPropertyValueModel.property_type_id,
+            ),
+            nested_select=[CategoryPropertyValueModel.id],
+        ).scalar_subquery()
+    )
+
+
+async def listing_filters(
+    session: AsyncSession, request: BodyProductPaginationRequest
+) -> List[Any]:
+    def as_where(value: Optional[Any], condition: Any) -> Any:
+        return True if not value else condition
+
+    variations = {
+        CategoryVariationTypeEnum.SIZE: request.sizes,
+        CategoryVariationTypeEnum.COLOR: request.colors,
+    }
+    properties = {
+        CategoryPropertyTypeEnum.MATERIAL: request.materials,
+        CategoryPropertyTypeEnum.AGE_GROUP: request.age_groups,
+        CategoryPropertyTypeEnum.GENDER: request.genders,
+        CategoryPropertyTypeEnum.TECHNICS: request.technics,
+    }
+
+    return [
+        ProductListingModel.price_value.is_not(None),
+        await in_category(
             session=session,
-            product_id=product_id,
-            category_id=category_id,
-            offset=pagination.offset,
-            limit=pagination.limit,
-            order_by=ProductModel.grade_average,
+            column=ProductListingModel.category_id,
+            category_id=request.category_id,
         ),
-    }
+        True if not request.min_price else ProductListingModel.price_value >= request.min_price,
+        True if not request.max_price else ProductListingModel.price_value <= request.max_price,
+        as_where(request.with_discount, ProductListingModel.discount > 0),
+        *(
+            ProductListingModel.variation_value_ids.overlap(
+                variation_value_ids(type_name=type_name, values=values)
+            )
+            for type_name, values in variations.items()
+            if values
+        ),
+        *(
+            ProductListingModel.property_value_ids.overlap(
+                property_value_ids(type_name=type_name, values=values)
+            )
+            for type_name, values in properties.items()
+            if values
+        ),
+    ]
 
 
 async def get_products_core(
@@ -562,100 +817,247 @@ async def get_products_core(
     request: BodyProductPaginationRequest,
     offset: int,
     limit: int,
-) -> List[ProductModel]:
-    def as_where(value: Optional[Any], condition: Any) -> Any:
-        return True if not value else condition
+    cursor: Optional[str] = None,
+) -> Tuple[List[ProductListingModel], Optional[str]]:
+    after, order_by = sorted_by(
+        sort_type=request.sort_type, ascending=request.ascending, cursor=cursor
+    )
+    products = await crud.products_listing.select.many(
+        Where(after, *await listing_filters(session=session, request=request)),
+        Offset(None if cursor else offset),
+        Limit(limit),
+        order_by,
+        session=session,
+    )
 
-    return await crud.products.select.many_unique(
-        Filter(
-            ProductModel.is_active.is_(True),
-            as_where(request.category_id, ProductModel.category_id == request.category_id),
-            as_where(
-                request.sizes,
-                and_(
-                    request.sizes and CategoryVariationValueModel.value.in_(request.sizes),
-                    CategoryVariationTypeModel.name == CategoryVariationTypeEnum.SIZE,
-                ),
-            ),
-            as_where(
-                request.colors,
-                and_(
-                    request.colors and CategoryVariationValueModel.value.in_(request.colors),
-                    CategoryVariationTypeModel.name == CategoryVariationTypeEnum.COLOR,
-                ),
-            ),
-            as_where(
-                request.materials,
-                and_(
-                    request.materials and CategoryPropertyValueModel.value.in_(request.materials),
-                    CategoryPropertyTypeModel.name == CategoryPropertyTypeEnum.MATERIAL,
-                ),
+    return products_page(products=products, sort_type=request.sort_type, limit=limit)
+
+
+@router.post(
+    path="/pagination/",
+    summary="WORKS: Pagination for products list page (sort_type = rating/price/date).",
+    description="Pass `detail.next_cursor` of the previous page as `cursor` to get the next one.",
+    response_model=ApplicationResponse[List[ProductListing]],
+    status_code=status.HTTP_200_OK,
+)
+@isolation(Isolation.READ_ONLY)
+async def product_pagination(
+    user: SellerIdAuthorizationOptional,
+    session: ReadOnlyDatabaseSession,
+    pagination: QueryCursorPaginationRequest = Depends(QueryCursorPaginationRequest),
+    request: BodyProductPaginationRequest = Body(...),
+) -> ApplicationResponse[List[ProductListing]]:
+    products, next_cursor = await get_products_core(
+        session=session,
+        request=request,
+        offset=pagination.offset,
+        limit=pagination.limit,
+        cursor=pagination.cursor,
+    )
+
+    return {
+        "ok": True,
+        "result": await with_favorites(session=session, user=user, products=products),
+        "detail": {
+            "next_cursor": next_cursor,
+        },
+    }
+
+
+async def search_products_core(
+    session: AsyncSession,
+    request: BodyProductSearchRequest,
+    offset: int,
+    limit: int,
+) -> List[ProductListingModel]:
+    query = func.websearch_to_tsquery("simple", request.query)
+    if request.sort_type:
+        after, order_by = sorted_by(
+            sort_type=request.sort_type, ascending=request.ascending, cursor=None
+        )
+    else:
+        rank = func.ts_rank_cd(ProductModel.search_vector, query) + func.similarity(
+            ProductModel.name, request.query
+        )
+        after, order_by = True, OrderBy(rank.desc(), ProductListingModel.id.desc())
+
+    return await crud.products_listing.select.many(
+        Where(
+            or_(
+                ProductModel.search_vector.bool_op("@@")(query),
+                ProductModel.name.bool_op("%")(request.query),
             ),
-            as_where(
-                request.age_groups,
-                and_(
-                    request.age_groups
-                    and CategoryPropertyValueModel.value.in_(request.age_groups),
-                    CategoryPropertyTypeModel.name == CategoryPropertyTypeEnum.AGE_GROUP,
-                ),
+            after,
+            *await listing_filters(session=session, request=request),
+        ),
+        Join(ProductModel, ProductModel.id == ProductListingModel.id),
+        Offset(offset),
+        Limit(limit),
+        order_by,
+        session=session,
+    )
+
+
+async def save_search_query(user_id: int, query: str) -> None:
+    async with async_sessionmaker.begin() as session:
+        await crud.users_searches.insert.one(
+            Values(
+                {
+                    UserSearchModel.user_id: user_id,
+                    UserSearchModel.search_query: query,
+                    UserSearchModel.datetime: func.now(),
+                }
             ),
-            as_where(
-                request.genders,
-                and_(
-                    request.genders and CategoryPropertyValueModel.value.in_(request.genders),
-                    CategoryPropertyTypeModel.name == CategoryPropertyTypeEnum.GENDER,
-                ),
+            Returning(UserSearchModel.id),
+            session=session,
+        )
+
+
+@router.post(
+    path="/search/",
+    summary="WORKS: Full-text product search with typo tolerance.",
+    description="Products are ranked by relevance unless `sort_type` is given. "
+    "All filters of /products/pagination/ are supported.",
+    response_model=ApplicationResponse[List[ProductListing]],
+    status_code=status.HTTP_200_OK,
+)
+@isolation(Isolation.READ_ONLY)
+async def search_products(
+    user: SellerIdAuthorizationOptional,
+    session: ReadOnlyDatabaseSession,
+    background_tasks: BackgroundTasks,
+    pagination: QueryPaginationRequest = Depends(),
+    request: BodyProductSearchRequest = Body(...),
+) -> RouteReturnT:
+    if user:
+        background_tasks.add_task(save_search_query, user_id=user.id, query=request.query)
+
+    products = await search_products_core(
+        session=session,
+        request=request,
+        offset=pagination.offset,
+        limit=pagination.limit,
+    )
+
+    return {
+        "ok": True,
+        "result": await with_favorites(session=session, user=user, products=products),
+    }
+
+
+@router.get(
+    path="/suggest/",
+    summary="WORKS: Autocomplete product search query.",
+    description="Completions come from product names, category names and popular searches. "
+    "Served from memory, refreshed in the background.",
+    response_model=ApplicationResponse[List[str]],
+    status_code=status.HTTP_200_OK,
+)
+async def suggest(
+    query: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(10, ge=1, le=50),
+) -> RouteReturnT:
+    return {
+        "ok": True,
+        "result": suggestions.complete(prefix=query, limit=limit),
+    }
+
+
+async def get_facets_core(session: AsyncSession, category_id: Optional[int]) -> DictStrAny:
+    facets = await crud.raws.select.many(
+        Where(
+            CategoryFacetModel.count > 0,
+            await in_category(
+                session=session,
+                column=CategoryFacetModel.category_id,
+                category_id=category_id,
             ),
-            as_where(
-                request.technics,
-                and_(
-                    request.technics and CategoryPropertyValueModel.value.in_(request.technics),
-                    CategoryPropertyTypeModel.name == CategoryPropertyTypeEnum.TECHNICS,
-                ),
+        ),
+        SelectFrom(CategoryFacetModel),
+        OuterJoin(
+            CategoryPropertyValueModel,
+            and_(
+                CategoryFacetModel.facet == FacetType.PROPERTY,
+                CategoryPropertyValueModel.id == CategoryFacetModel.value_id,
             ),
         ),
-        Join(
-            ProductPriceModel,
+        OuterJoin(
+            CategoryPropertyTypeModel,
+            CategoryPropertyTypeModel.id == CategoryPropertyValueModel.property_type_id,
+        ),
+        OuterJoin(
+            CategoryVariationValueModel,
             and_(
-                ProductModel.id == ProductPriceModel.product_id,
-                func.now().between(ProductPriceModel.start_date, ProductPriceModel.end_date),
-                as_where(request.min_price, ProductPriceModel.value >= request.min_price),
-                as_where(request.max_price, ProductPriceModel.value <= request.max_price),
-                as_where(request.with_discount, func.coalesce(ProductPriceModel.discount, 0) > 0),
+                CategoryFacetModel.facet == FacetType.VARIATION,
+                CategoryVariationValueModel.id == CategoryFacetModel.value_id,
             ),
         ),
-        Options(
-            selectinload(ProductModel.prices),
-            selectinload(ProductModel.supplier).joinedload(SupplierModel.user),
-            selectinload(ProductModel.properties).joinedload(CategoryPropertyValueModel.type),
-            selectinload(ProductModel.variations).joinedload(CategoryVariationValueModel.type),
+        OuterJoin(
+            CategoryVariationTypeModel,
+            CategoryVariationTypeModel.id == CategoryVariationValueModel.variation_type_id,
         ),
-        Offset(offset),
-        Limit(limit),
-        OrderBy(request.sort_type.by.asc() if request.ascending else request.sort_type.by.desc()),
+        GroupBy(
+            CategoryFacetModel.facet,
+            CategoryFacetModel.value_id,
+            CategoryPropertyTypeModel.name,
+            CategoryPropertyValueModel.value,
+            CategoryVariationTypeModel.name,
+            CategoryVariationValueModel.value,
+        ),
+        OrderBy(CategoryFacetModel.facet, CategoryFacetModel.value_id),
+        nested_select=[
+            CategoryFacetModel.facet,
+            CategoryFacetModel.value_id,
+            func.coalesce(CategoryPropertyTypeModel.name, CategoryVariationTypeModel.name).label(
+                "type"
+            ),
+            func.coalesce(
+                CategoryPropertyValueModel.value, CategoryVariationValueModel.value
+            ).label("value"),
+            func.sum(CategoryFacetModel.count).cast(Integer).label("count"),
+        ],
         session=session,
     )
 
+    buckets = product_listing.price_buckets
+    return {
+        "properties": [
+            {"id": facet.value_id, "type": facet.type, "value": facet.value, "count": facet.count}
+            for facet in facets
+            if facet.facet == FacetType.PROPERTY
+        ],
+        "variations": [
+            {"id": facet.value_id, "type": facet.type, "value": facet.value, "count": facet.count}
+            for facet in facets
+            if facet.facet == FacetType.VARIATION
+        ],
+        "prices": [
+            {
+                "min_price": buckets[facet.value_id - 1],
+                "max_price": buckets[facet.value_id] if facet.value_id < len(buckets) else None,
+                "count": facet.count,
+            }
+            for facet in facets
+            if facet.facet == FacetType.PRICE
+        ],
+    }
+
 
-@router.post(
-    path="/pagination/",
-    summary="WORKS: Pagination for products list page (sort_type = rating/price/date).",
-    response_model=ApplicationResponse[List[Product]],
+@router.get(
+    path="/facets/",
+    summary="WORKS: Get products count per filter value (properties, variations, price ranges).",
+    description="Counts cover active products, optionally within the given category "
+    "and its subcategories.",
+    response_model=ApplicationResponse[RouteReturnT],
     status_code=status.HTTP_200_OK,
 )
-async def product_pagination(
-    session: DatabaseSession,
-    pagination: QueryPaginationRequest = Depends(QueryPaginationRequest),
-    request: BodyProductPaginationRequest = Body(...),
-) -> ApplicationResponse[List[Product]]:
+async def get_facets(
+    session: ReadOnlyDatabaseSession,
+    category_id: Optional[int] = Query(None),
+) -> RouteReturnT:
     return {
         "ok": True,
-        "result": await get_products_core(
-            session=session,
-            request=request,
-            offset=pagination.offset,
-            limit=pagination.limit,
-        ),
+        "result": await get_facets_core(session=session, category_id=category_id),
     }
 
 
@@ -677,6 +1079,113 @@ async def get_info_for_product_card_core(
     )
 
 
+def json_object(*columns: Any) -> Any:
+    return func.jsonb_build_object(
+        *(argument for column in columns for argument in (column.key, column)),
+        type_=JSONB,
+    )
+
+
+def json_array(*columns: Any, order_by: Any, where: Any) -> Any:
+    return func.coalesce(
+        crud.raws.select.executor.query.build(
+            Where(where),
+            nested_select=[
+                func.jsonb_agg(aggregate_order_by(json_object(*columns), order_by), type_=JSONB)
+            ],
+        ).scalar_subquery(),
+        func.jsonb_build_array(),
+        type_=JSONB,
+    )
+
+
+def json_row(*columns: Any, where: Any) -> Any:
+    return crud.raws.select.executor.query.build(
+        Where(where),
+        nested_select=[json_object(*columns)],
+    ).scalar_subquery()
+
+
+async def get_product_cards_core(session: AsyncSession, product_ids: List[int]) -> List[Product]:
+    """
+    Load product cards in a single statement: every relationship of the card is
+    aggregated into JSON on the database side and parsed straight into `Product`.
+    """
+
+    cards = await crud.raws.select.many(
+        Where(ProductModel.id.in_(product_ids)),
+        SelectFrom(ProductModel),
+        nested_select=[
+            ProductModel.id,
+            ProductModel.name,
+            ProductModel.description,
+            ProductModel.datetime,
+            ProductModel.grade_average,
+            ProductModel.total_orders,
+            ProductModel.uuid,
+            ProductModel.is_active,
+            json_row(
+                CategoryModel.id,
+                CategoryModel.name,
+                CategoryModel.level,
+                CategoryModel.parent_id,
+                where=CategoryModel.id == ProductModel.category_id,
+            ).label("category"),
+            json_row(
+                SupplierModel.id,
+                SupplierModel.license_number,
+                SupplierModel.grade_average,
+                SupplierModel.additional_info,
+                where=SupplierModel.id == ProductModel.supplier_id,
+            ).label("supplier"),
+            json_array(
+                ProductImageModel.id,
+                ProductImageModel.image_url,
+                ProductImageModel.order,
+                order_by=ProductImageModel.order,
+                where=ProductImageModel.product_id == ProductModel.id,
+            ).label("images"),
+            json_array(
+                TagsModel.id,
+                TagsModel.name,
+                order_by=TagsModel.id,
+                where=TagsModel.product_id == ProductModel.id,
+            ).label("tags"),
+            json_array(
+                ProductPriceModel.id,
+                ProductPriceModel.value,
+                ProductPriceModel.discount,
+                ProductPriceModel.min_quantity,
+                ProductPriceModel.start_date,
+                ProductPriceModel.end_date,
+                order_by=ProductPriceModel.min_quantity,
+                where=ProductPriceModel.product_id == ProductModel.id,
+            ).label("prices"),
+            json_array(
+                CategoryVariationValueModel.id,
+                CategoryVariationValueModel.value,
+                CategoryVariationValueModel.variation_type_id,
+                order_by=CategoryVariationValueModel.id,
+                # a value is listed once however many variation rows of the product use it
+                where=CategoryVariationValueModel.id.in_(
+                    crud.raws.select.executor.query.build(
+                        Where(ProductVariationValueModel.product_id == ProductModel.id),
+                        nested_select=[ProductVariationValueModel.variation_value_id],
+                    ).correlate(ProductModel)
+                ),
+            ).label("variations"),
+        ],
+        session=session,
+    )
+
+    return [Product.parse_obj(card) for card in cards]
+
+
+async def get_product_card_core(session: AsyncSession, product_id: int) -> Optional[Product]:
+    cards = await get_product_cards_core(session=session, product_ids=[product_id])
+    return cards[0] if cards else None
+
+
 @router.get(
     path="/productCard/{product_id}/",
     summary="WORKS (example 1-100, 1): Get info for product card p1.",
@@ -684,10 +1193,59 @@ async def get_info_for_product_card_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_info_for_product_card(
-    session: DatabaseSession,
+    session: ReadOnlyDatabaseSession,
+    response: Response,
     product_id: int = Path(...),
+    if_none_match: Optional[str] = Header(None),
 ) -> RouteReturnT:
+    return await cached(
+        session=session,
+        response=response,
+        if_none_match=if_none_match,
+        kind="card",
+        product_id=product_id,
+        load=lambda: get_product_card_core(session=session, product_id=product_id),
+    )
+
+
+async def get_products_batch_core(
+    session: AsyncSession,
+    product_ids: List[int],
+) -> Tuple[List[Product], List[int]]:
+    product_ids = list(dict.fromkeys(product_ids))
+    cards = {
+        card.id: card
+        for card in await get_product_cards_core(session=session, product_ids=product_ids)
+    }
+
+    return (
+        [cards[product_id] for product_id in product_ids if product_id in cards],
+        [product_id for product_id in product_ids if product_id not in cards],
+    )
+
+
+@router.post(
+    path="/batch/",
+    summary="WORKS: Get product cards by ids (up to 300).",
+    description="Cards are returned in the requested order, "
+    "ids of products that do not exist are listed in `detail.missing`.",
+    response_model=ApplicationResponse[List[Product]],
+    status_code=status.HTTP_200_OK,
+)
+@isolation(Isolation.READ_ONLY)
+async def get_products_batch(
+    session: ReadOnlyDatabaseSession,
+    request: BodyProductBatchRequest = Body(...),
+) -> RouteReturnT:
+    products, missing = await get_products_batch_core(
+        session=session,
+        product_ids=request.product_ids,
+    )
+
     return {
         "ok": True,
-        "result": await get_info_for_product_card_core(session=session, product_id=product_id),
+        "result": products,
+        "detail": {
+            "missing": missing,
+        },
     }
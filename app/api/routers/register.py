@@ -10,14 +10,22 @@ from fastapi_mail import MessageSchema, MessageType
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from core.app import crud, fm
-from core.depends import AuthJWT, Authorization, DatabaseSession, SupplierAuthorization
-from core.security import create_access_token, hash_password
-from core.settings import application_settings, fastapi_uvicorn_settings
-from enums import UserType
+from core.app import crud, fm, passwords, principals, product_cache
+from core.depends import (
+    AuthJWT,
+    Authorization,
+    DatabaseSession,
+    SupplierAuthorization,
+    load_claims,
+)
+from core.routing import TransactionRoute, isolation
+from core.security import create_access_token
+from core.settings import application_settings, fastapi_uvicorn_settings, jwt_settings
+from enums import Isolation, UserType
 from orm import (
     CompanyModel,
     CompanyPhoneModel,
+    ProductModel,
     SellerImageModel,
     SellerModel,
     SellerNotificationsModel,
@@ -38,7 +46,7 @@ from schemas import (
 from typing_ import RouteReturnT
 from utils.cookies import set_and_create_tokens_cookies
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 async def register_user_core(
@@ -48,7 +56,7 @@ async def register_user_core(
         Values(
             {
                 UserCredentialsModel.user_id: user.id,
-                UserCredentialsModel.password: hash_password(password=request.password),
+                UserCredentialsModel.password: await passwords.hash(password=request.password),
             }
         ),
         Returning(UserCredentialsModel.id),
@@ -171,6 +179,7 @@ async def confirm_registration(session: AsyncSession, user_id: int) -> None:
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.READ_COMMITTED)
 async def email_confirmation(
     response: Response,
     session: DatabaseSession,
@@ -189,8 +198,14 @@ async def email_confirmation(
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
 
-    set_and_create_tokens_cookies(response=response, authorize=authorize, subject=user.id)
+    set_and_create_tokens_cookies(
+        response=response,
+        authorize=authorize,
+        subject=user.id,
+        claims=await load_claims(user_id=user.id, session=session),
+    )
     await confirm_registration(session=session, user_id=user.id)
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -223,6 +238,7 @@ async def send_account_info(
     request: BodyUserDataRequest = Body(...),
 ) -> RouteReturnT:
     await send_account_info_core(session=session, user_id=user.id, request=request)
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -243,6 +259,8 @@ async def send_business_info_core(
         Returning(SupplierModel.id),
         session=session,
     )
+    # supplier fields are part of the cached cards of its products
+    await product_cache.bump(session, ProductModel.supplier_id == supplier_id)
 
     company_id = await crud.companies.insert.one(
         Values(
@@ -275,6 +293,8 @@ async def send_business_info_core(
     status_code=status.HTTP_200_OK,
 )
 async def insert_business_info(
+    response: Response,
+    authorize: AuthJWT,
     user: SupplierAuthorization,
     session: DatabaseSession,
     supplier_data_request: BodySupplierDataRequest = Body(...),
@@ -288,6 +308,15 @@ async def insert_business_info(
         company_data_request=company_data_request,
         company_phone_data_request=company_phone_data_request,
     )
+    principals.invalidate(session=session, user_id=user.id)
+    if jwt_settings.ROLE_CLAIMS:
+        # the company id claim is there from now on
+        set_and_create_tokens_cookies(
+            response=response,
+            authorize=authorize,
+            subject=user.id,
+            claims=await load_claims(user_id=user.id, session=session),
+        )
 
     return {
         "ok": True,
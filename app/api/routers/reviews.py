@@ -1,33 +1,26 @@
-from typing import List, Optional, Union
+from typing import Any, List, Optional, Tuple
 
-from corecrud import (
-    Join,
-    Limit,
-    Offset,
-    Options,
-    OrderBy,
-    Returning,
-    SelectFrom,
-    Values,
-    Where,
-)
+from corecrud import Join, Limit, Offset, Options, OrderBy, Returning, Values, Where
 from fastapi import APIRouter
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Body, Depends, Path
 from pydantic import HttpUrl
 from sqlalchemy import and_, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, with_expression
 from starlette import status
 
-from core.app import crud
-from core.depends import DatabaseSession, SellerAuthorization
+from core.app import crud, product_listing, product_review_stats
+from core.depends import DatabaseSession, ReadOnlyDatabaseSession, SellerIdAuthorization
+from core.routing import TransactionRoute, isolation
+from enums import Isolation
 from orm import (
     OrderModel,
     OrderProductVariationModel,
     ProductModel,
     ProductReviewModel,
     ProductReviewPhotoModel,
+    ProductReviewReactionModel,
     ProductVariationCountModel,
     ProductVariationValueModel,
 )
@@ -35,58 +28,12 @@ from schemas import (
     ApplicationResponse,
     BodyProductReviewRequest,
     ProductReview,
-    QueryPaginationRequest,
+    QueryCursorPaginationRequest,
 )
 from typing_ import RouteReturnT
+from utils.cursor import encode_cursor, keyset
 
-router = APIRouter()
-
-
-async def calculate_grade_average(
-    session: AsyncSession,
-    product_id: int,
-    product_review_grade: int,
-    grade_average: Optional[float] = None,
-) -> Union[int, float]:
-    if not grade_average:
-        return product_review_grade
-
-    review_count = await crud.raws.select.one(
-        Where(ProductReviewModel.product_id == product_id),
-        SelectFrom(ProductReviewModel),
-        nested_select=[func.count(ProductReviewModel.id)],
-        session=session,
-    )
-    grade_average = round(
-        (grade_average * review_count + product_review_grade) / (review_count + 1),
-        1,
-    )
-
-    return grade_average  # type: ignore[return-value]
-
-
-async def update_product_grave_average(
-    session: AsyncSession,
-    product_id: int,
-    product_review_grade: int,
-    grade_average: Optional[float] = None,
-) -> None:
-    grade_average = await calculate_grade_average(
-        session=session,
-        product_id=product_id,
-        product_review_grade=product_review_grade,
-        grade_average=grade_average,
-    )
-    await crud.products.update.one(
-        Values(
-            {
-                ProductModel.grade_average: grade_average,
-            }
-        ),
-        Where(ProductModel.id == product_id),
-        Returning(ProductModel.id),
-        session=session,
-    )
+router = APIRouter(route_class=TransactionRoute)
 
 
 async def create_product_review(
@@ -105,7 +52,7 @@ async def create_product_review(
                 ProductReviewModel.grade_overall: grade_overall,
             }
         ),
-        Returning(ProductReviewModel.id),
+        Returning(ProductReviewModel),
         session=session,
     )
 
@@ -146,6 +93,7 @@ async def fully_create_product_review(
         text=text,
         grade_overall=grade_overall,
     )
+    await product_review_stats.add(session=session, product_id=product_id, grade=grade_overall)
     if photos:
         await create_product_review_photos(
             session=session,
@@ -162,25 +110,16 @@ async def make_product_core(
     text: str,
     photos: Optional[List[HttpUrl]] = None,
 ) -> None:
-    product = await crud.products.select.one(
-        Where(ProductModel.id == product_id),
-        session=session,
-    )
-    await update_product_grave_average(
-        session=session,
-        product_id=product_id,
-        product_review_grade=review_grade,
-        grade_average=product.grade_average,
-    )
-
     await fully_create_product_review(
         session=session,
-        product_id=product.id,
+        product_id=product_id,
         seller_id=seller_id,
         text=text,
         grade_overall=review_grade,
         photos=photos,
     )
+    await product_review_stats.update_grade_average(session, ProductModel.id == product_id)
+    await product_listing.refresh_reviews(session, ProductModel.id == product_id)
 
 
 @router.post(
@@ -189,8 +128,9 @@ async def make_product_core(
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.READ_COMMITTED)
 async def make_product_review(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     request: BodyProductReviewRequest = Body(...),
     product_id: int = Path(...),
@@ -240,38 +180,68 @@ async def make_product_review(
     }
 
 
+def reactions_count(reaction: bool) -> Any:
+    return crud.raws.select.executor.query.build(
+        Where(
+            ProductReviewReactionModel.product_review_id == ProductReviewModel.id,
+            ProductReviewReactionModel.reaction.is_(reaction),
+        ),
+        nested_select=[func.count(ProductReviewReactionModel.id)],
+    ).scalar_subquery()
+
+
 async def show_product_review_core(
-    session: AsyncSession, product_id: int, offset: int, limit: int
-) -> List[ProductReviewModel]:
-    return await crud.products_reviews.select.many(
-        Where(ProductReviewModel.product_id == product_id),
+    session: AsyncSession,
+    product_id: int,
+    pagination: QueryCursorPaginationRequest,
+) -> Tuple[List[ProductReviewModel], Optional[str]]:
+    columns = (ProductReviewModel.datetime, ProductReviewModel.id)
+    reviews = await crud.products_reviews.select.many(
+        Where(
+            ProductReviewModel.product_id == product_id,
+            keyset(columns=columns, cursor=pagination.cursor, ascending=False),
+        ),
         Options(
-            selectinload(ProductReviewModel.photos), selectinload(ProductReviewModel.reactions)
+            selectinload(ProductReviewModel.photos),
+            with_expression(ProductReviewModel.likes, reactions_count(reaction=True)),
+            with_expression(ProductReviewModel.dislikes, reactions_count(reaction=False)),
         ),
-        Offset(offset),
-        Limit(limit),
-        OrderBy(ProductReviewModel.datetime.desc()),
+        Offset(None if pagination.cursor else pagination.offset),
+        Limit(pagination.limit),
+        OrderBy(*(column.desc() for column in columns)),
         session=session,
     )
+    if not reviews or len(reviews) < pagination.limit:
+        return reviews, None
+
+    last = reviews[-1]
+    return reviews, encode_cursor(last.datetime, last.id)
 
 
 @router.post(
     path="/{product_id}/showProductReview/",
     summary="WORKS: get product_id, skip(def 0), limit(def 100), returns reviews.",
-    response_model=ApplicationResponse[ProductReview],
+    description="Reviews come newest first with like/dislike counts. "
+    "Pass `detail.next_cursor` of the previous page as `cursor` to get the next one.",
+    response_model=ApplicationResponse[List[ProductReview]],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.READ_ONLY)
 async def show_product_review(
-    session: DatabaseSession,
+    session: ReadOnlyDatabaseSession,
     product_id: int = Path(...),
-    pagination: QueryPaginationRequest = Depends(),
+    pagination: QueryCursorPaginationRequest = Depends(),
 ) -> RouteReturnT:
+    reviews, next_cursor = await show_product_review_core(
+        session=session,
+        product_id=product_id,
+        pagination=pagination,
+    )
+
     return {
         "ok": True,
-        "result": await show_product_review_core(
-            session=session,
-            product_id=product_id,
-            offset=pagination.offset,
-            limit=pagination.limit,
-        ),
+        "result": reviews,
+        "detail": {
+            "next_cursor": next_cursor,
+        },
     }
@@ -10,14 +10,16 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 from starlette import status
 
-from core.app import aws_s3, crud
+from core.app import aws_s3, crud, principals
 from core.depends import (
     DatabaseSession,
     FileObjects,
     Image,
     SellerAuthorization,
-    seller,
+    SellerIdAuthorization,
+    seller_id_only,
 )
+from core.routing import TransactionRoute
 from core.settings import aws_s3_settings
 from orm import (
     OrderModel,
@@ -27,6 +29,7 @@ from orm import (
     SellerNotificationsModel,
     UserModel,
 )
+from orm.core import async_sessionmaker
 from schemas import (
     ApplicationResponse,
     BodySellerAddressRequest,
@@ -40,7 +43,7 @@ from schemas import (
 from typing_ import RouteReturnT
 from utils.thumbnail import upload_thumbnail
 
-router = APIRouter(dependencies=[Depends(seller)])
+router = APIRouter(route_class=TransactionRoute, dependencies=[Depends(seller_id_only)])
 
 
 @router.get(
@@ -50,7 +53,7 @@ router = APIRouter(dependencies=[Depends(seller)])
     status_code=status.HTTP_200_OK,
 )
 async def get_order_status(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     order_id: int = Query(...),
 ) -> RouteReturnT:
@@ -130,6 +133,8 @@ async def add_seller_address(
     session: DatabaseSession,
     request: BodySellerAddressRequest = Body(...),
 ) -> RouteReturnT:
+    principals.invalidate(session=session, user_id=user.id)
+
     return {
         "ok": True,
         "result": await add_seller_address_core(
@@ -178,6 +183,8 @@ async def update_address(
     session: DatabaseSession,
     request: BodySellerAddressUpdateRequest = Body(...),
 ) -> RouteReturnT:
+    principals.invalidate(session=session, user_id=user.id)
+
     return {
         "ok": True,
         "result": await update_address_core(
@@ -223,7 +230,7 @@ async def remove_seller_address_core(
     status_code=status.HTTP_200_OK,
 )
 async def remove_seller_address(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     address_id: int = Path(...),
 ) -> RouteReturnT:
@@ -232,6 +239,7 @@ async def remove_seller_address(
         address_id=address_id,
         seller_id=user.seller.id,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -260,7 +268,7 @@ async def update_notifications_core(
     status_code=status.HTTP_200_OK,
 )
 async def update_notifications(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     notification_data_request: Optional[BodySellerNotificationUpdateRequest] = Body(None),
 ) -> RouteReturnT:
@@ -269,6 +277,7 @@ async def update_notifications(
         seller_id=user.seller.id,
         notification_data_request=notification_data_request,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -293,7 +302,7 @@ async def get_notifications_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_notifications(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
     return {
@@ -338,6 +347,13 @@ async def upload_avatar_image_core(
     )
 
 
+async def upload_avatar_image_task(file: FileObjects, user: UserModel) -> None:
+    # runs after the request transaction has been committed
+    async with async_sessionmaker.begin() as session:
+        await upload_avatar_image_core(file=file, user=user, session=session)
+        principals.invalidate(session=session, user_id=user.id)
+
+
 async def make_upload_and_delete_seller_images(
     seller_image: Optional[SellerImageModel],
     file: FileObjects,
@@ -370,10 +386,9 @@ async def make_upload_and_delete_seller_images(
 async def upload_avatar_image(
     file: Image,
     user: SellerAuthorization,
-    session: DatabaseSession,
     background_tasks: BackgroundTasks,
 ) -> RouteReturnT:
-    background_tasks.add_task(upload_avatar_image_core, file=file, user=user, session=session)
+    background_tasks.add_task(upload_avatar_image_task, file=file, user=user)
 
     return {
         "ok": True,
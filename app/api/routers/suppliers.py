@@ -10,9 +10,17 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import join, selectinload
 from starlette import status
 
-from core.app import aws_s3, crud
-from core.depends import DatabaseSession, Image, SupplierAuthorization, supplier
+from core.app import aws_s3, crud, principals, product_cache, product_listing
+from core.depends import (
+    DatabaseSession,
+    Image,
+    SupplierAuthorization,
+    SupplierIdAuthorization,
+    supplier_id_only,
+)
+from core.routing import TransactionRoute, isolation
 from core.settings import aws_s3_settings
+from enums import Isolation
 from orm import (
     CategoryPropertyModel,
     CategoryPropertyValueModel,
@@ -49,7 +57,7 @@ from schemas import (
 )
 from typing_ import RouteReturnT
 
-router = APIRouter(dependencies=[Depends(supplier)])
+router = APIRouter(route_class=TransactionRoute, dependencies=[Depends(supplier_id_only)])
 
 
 @router.get(
@@ -194,6 +202,7 @@ async def add_product_info_core(
         Returning(ProductPriceModel.id),
         session=session,
     )
+    await product_listing.refresh(session, ProductModel.id == product.id)
 
     return product
 
@@ -205,7 +214,7 @@ async def add_product_info_core(
     status_code=status.HTTP_200_OK,
 )
 async def add_product_info(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
     request: BodyProductUploadRequest = Body(...),
 ) -> RouteReturnT:
@@ -239,7 +248,7 @@ async def manage_products_core(
     status_code=status.HTTP_200_OK,
 )
 async def manage_products(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
     pagination: QueryPaginationRequest = Depends(),
 ) -> RouteReturnT:
@@ -261,12 +270,16 @@ async def delete_products_core(
         Values(
             {
                 ProductModel.is_active: 0,
+                ProductModel.version: ProductModel.version + 1,
             }
         ),
         Where(and_(ProductModel.id.in_(products), ProductModel.supplier_id == supplier_id)),
         Returning(ProductModel.id),
         session=session,
     )
+    await product_listing.refresh(
+        session, ProductModel.id.in_(products), ProductModel.supplier_id == supplier_id
+    )
 
 
 @router.patch(
@@ -276,7 +289,7 @@ async def delete_products_core(
     status_code=status.HTTP_200_OK,
 )
 async def delete_products(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
     products: List[int] = Body(...),
 ) -> RouteReturnT:
@@ -298,9 +311,10 @@ async def delete_products(
     response_model=ApplicationResponse[ProductImage],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.SERIALIZABLE, retry=False)
 async def upload_product_image(
     file: Image,
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
     product_id: int = Query(...),
     order: int = Query(...),
@@ -347,6 +361,8 @@ async def upload_product_image(
         Returning(ProductImageModel),
         session=session,
     )
+    await product_listing.refresh(session, ProductModel.id == product_id)
+    await product_cache.bump(session, ProductModel.id == product_id)
 
     return {
         "ok": True,
@@ -360,6 +376,7 @@ async def upload_product_image(
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.SERIALIZABLE, retry=False)
 async def delete_product_image(
     session: DatabaseSession,
     product_id: int = Query(...),
@@ -375,6 +392,8 @@ async def delete_product_image(
         Returning(ProductImageModel),
         session=session,
     )
+    await product_listing.refresh(session, ProductModel.id == product_id)
+    await product_cache.bump(session, ProductModel.id == product_id)
 
     await aws_s3.delete_file_from_s3(
         bucket_name=aws_s3_settings.AWS_S3_SUPPLIERS_PRODUCT_UPLOAD_IMAGE_BUCKET,
@@ -401,6 +420,8 @@ async def update_business_info_core(
             Returning(SupplierModel.id),
             session=session,
         )
+        # supplier fields are part of the cached cards of its products
+        await product_cache.bump(session, ProductModel.supplier_id == user.supplier.id)
 
     if company_data_request:
         await crud.companies.update.one(
@@ -439,6 +460,7 @@ async def update_business_info(
         company_data_request=company_data_request,
         company_phone_data_request=company_phone_data_request,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -472,7 +494,7 @@ async def get_business_info_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_business_info(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
     return {
@@ -522,11 +544,14 @@ async def update_company_logo_core(
     response_model=ApplicationResponse[str],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.SERIALIZABLE, retry=False)
 async def update_company_logo(
     file: Image,
     user: SupplierAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
+    principals.invalidate(session=session, user_id=user.id)
+
     return {
         "ok": True,
         "result": await update_company_logo_core(
@@ -564,11 +589,14 @@ async def upload_company_image_core(
     response_model=ApplicationResponse[CompanyImage],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.SERIALIZABLE, retry=False)
 async def upload_company_image(
     file: Image,
     user: SupplierAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
+    principals.invalidate(session=session, user_id=user.id)
+
     return {
         "ok": True,
         "result": await upload_company_image_core(
@@ -585,6 +613,7 @@ async def upload_company_image(
     response_model=ApplicationResponse[bool],
     status_code=status.HTTP_200_OK,
 )
+@isolation(Isolation.SERIALIZABLE, retry=False)
 async def delete_company_image(
     user: SupplierAuthorization,
     session: DatabaseSession,
@@ -605,6 +634,7 @@ async def delete_company_image(
         bucket_name=aws_s3_settings.AWS_S3_SUPPLIERS_PRODUCT_UPLOAD_IMAGE_BUCKET,
         url=image,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -633,7 +663,7 @@ async def update_notifications_core(
     status_code=status.HTTP_200_OK,
 )
 async def update_notifications(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
     notification_data_request: Optional[BodySupplierNotificationUpdateRequest] = Body(None),
 ) -> RouteReturnT:
@@ -642,6 +672,7 @@ async def update_notifications(
         supplier_id=user.supplier.id,
         notification_data_request=notification_data_request,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -666,7 +697,7 @@ async def get_notifications_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_notifications(
-    user: SupplierAuthorization,
+    user: SupplierIdAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
     return {
@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, List, Optional, Tuple
 
 from corecrud import (
     GroupBy,
@@ -6,6 +6,7 @@ from corecrud import (
     Limit,
     Offset,
     Options,
+    OrderBy,
     OuterJoin,
     Returning,
     SelectFrom,
@@ -17,37 +18,43 @@ from fastapi.param_functions import Body, Depends, Query
 from fastapi.responses import Response
 from sqlalchemy import and_, func
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm import join, joinedload
 from starlette import status
 
-from core.app import crud
-from core.depends import AuthJWT, Authorization, DatabaseSession, SellerAuthorization
+from core.app import crud, favorites, principals, product_listing, revocations
+from core.depends import AuthJWT, Authorization, DatabaseSession, SellerIdAuthorization
+from core.routing import TransactionRoute
 from orm import (
     OrderModel,
     OrderProductVariationModel,
     OrderStatusModel,
     ProductImageModel,
+    ProductListingModel,
     ProductModel,
     ProductPriceModel,
     ProductVariationCountModel,
     ProductVariationValueModel,
     SellerFavoriteModel,
+    SupplierModel,
     UserModel,
     UserSearchModel,
 )
 from schemas import (
     ApplicationResponse,
     BodyChangeEmailRequest,
+    BodyProductBatchRequest,
     BodyUserDataUpdateRequest,
-    Product,
+    ProductListing,
+    QueryCursorPaginationRequest,
     QueryPaginationRequest,
     User,
     UserSearch,
 )
 from typing_ import RouteReturnT
 from utils.cookies import unset_jwt_cookies
+from utils.cursor import encode_cursor, keyset
 
-router = APIRouter()
+router = APIRouter(route_class=TransactionRoute)
 
 
 async def get_latest_searches_core(
@@ -86,48 +93,64 @@ async def get_latest_searches(
 async def show_favorites_core(
     session: AsyncSession,
     seller_id: int,
-    offset: int,
-    limit: int,
-) -> List[ProductModel]:
+    pagination: QueryCursorPaginationRequest,
+) -> Tuple[List[ProductListing], Optional[str]]:
+    columns = (SellerFavoriteModel.datetime, SellerFavoriteModel.id)
     favorites = await crud.raws.select.many(
-        Where(SellerFavoriteModel.seller_id == seller_id),
-        SelectFrom(SellerFavoriteModel),
-        nested_select=[SellerFavoriteModel.id],
-        session=session,
-    )
-
-    return await crud.products.select.many(
-        Where(ProductModel.id.in_(favorites)),
-        Options(
-            selectinload(ProductModel.category),
-            selectinload(ProductModel.tags),
-            selectinload(ProductModel.prices),
+        Where(
+            SellerFavoriteModel.seller_id == seller_id,
+            keyset(columns=columns, cursor=pagination.cursor, ascending=False),
         ),
-        Offset(offset),
-        Limit(limit),
+        SelectFrom(
+            join(
+                SellerFavoriteModel,
+                ProductListingModel,
+                ProductListingModel.id == SellerFavoriteModel.product_id,
+            )
+        ),
+        Offset(None if pagination.cursor else pagination.offset),
+        Limit(pagination.limit),
+        OrderBy(*(column.desc() for column in columns)),
+        nested_select=[
+            *ProductListingModel.__table__.columns,
+            SellerFavoriteModel.datetime.label("favorite_datetime"),
+            SellerFavoriteModel.id.label("favorite_id"),
+        ],
         session=session,
     )
+    products = [ProductListing.parse_obj(favorite) for favorite in favorites]
+    if not favorites or len(favorites) < pagination.limit:
+        return products, None
+
+    last = favorites[-1]
+    return products, encode_cursor(last.favorite_datetime, last.favorite_id)
 
 
 @router.get(
     path="/showFavorites/",
     summary="WORKS: Shows all favorite products",
-    response_model=ApplicationResponse[List[Product]],
+    description="Favorites come most recently added first. "
+    "Pass `detail.next_cursor` of the previous page as `cursor` to get the next one.",
+    response_model=ApplicationResponse[List[ProductListing]],
     status_code=status.HTTP_200_OK,
 )
 async def show_favorites(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
-    pagination: QueryPaginationRequest = Depends(),
+    pagination: QueryCursorPaginationRequest = Depends(),
 ) -> RouteReturnT:
+    products, next_cursor = await show_favorites_core(
+        session=session,
+        seller_id=user.seller.id,
+        pagination=pagination,
+    )
+
     return {
         "ok": True,
-        "result": await show_favorites_core(
-            session=session,
-            seller_id=user.seller.id,
-            offset=pagination.offset,
-            limit=pagination.limit,
-        ),
+        "result": products,
+        "detail": {
+            "next_cursor": next_cursor,
+        },
     }
 
 
@@ -164,6 +187,7 @@ async def change_email(
         user_id=user.id,
         email=request.confirm_email,
     )
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -178,15 +202,18 @@ async def change_email(
     status_code=status.HTTP_200_OK,
 )
 async def is_product_favorite(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
     product_id: int = Query(...),
 ) -> RouteReturnT:
-    seller_favorite = await crud.sellers_favorites.select.one(
+    # exact, unlike the per-worker favorites cache behind listings and `areFavorites`
+    seller_favorite = await crud.raws.select.one(
         Where(
             SellerFavoriteModel.seller_id == user.seller.id,
             SellerFavoriteModel.product_id == product_id,
         ),
+        SelectFrom(SellerFavoriteModel),
+        nested_select=[SellerFavoriteModel.id],
         session=session,
     )
 
@@ -196,6 +223,27 @@ async def is_product_favorite(
     }
 
 
+@router.post(
+    path="/areFavorites/",
+    summary="WORKS: returns which of the given products (up to 300) are in favorites",
+    response_model=ApplicationResponse[List[int]],
+    status_code=status.HTTP_200_OK,
+)
+async def are_products_favorite(
+    user: SellerIdAuthorization,
+    session: DatabaseSession,
+    request: BodyProductBatchRequest = Body(...),
+) -> RouteReturnT:
+    return {
+        "ok": True,
+        "result": await favorites.among(
+            session=session,
+            seller_id=user.seller.id,
+            product_ids=request.product_ids,
+        ),
+    }
+
+
 async def delete_account_core(session: AsyncSession, user_id: int) -> None:
     await crud.users.update.one(
         Values({UserModel.is_deleted: True}),
@@ -219,6 +267,8 @@ async def delete_account(
 ) -> RouteReturnT:
     await delete_account_core(session=session, user_id=user.id)
     unset_jwt_cookies(response=response, authorize=authorize)
+    principals.invalidate(session=session, user_id=user.id)
+    revocations.revoke(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -262,6 +312,9 @@ async def update_account_info_core(
         Returning(UserModel.id),
         session=session,
     )
+    await product_listing.refresh(
+        session, ProductModel.supplier.has(SupplierModel.user_id == user_id)
+    )
 
 
 @router.patch(
@@ -276,6 +329,7 @@ async def update_account_info(
     request: BodyUserDataUpdateRequest = Body(...),
 ) -> RouteReturnT:
     await update_account_info_core(session=session, user_id=user.id, request=request)
+    principals.invalidate(session=session, user_id=user.id)
 
     return {
         "ok": True,
@@ -342,7 +396,7 @@ async def get_seller_orders_core(
     status_code=status.HTTP_200_OK,
 )
 async def get_seller_orders(
-    user: SellerAuthorization,
+    user: SellerIdAuthorization,
     session: DatabaseSession,
 ) -> RouteReturnT:
     return {
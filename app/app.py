@@ -1,18 +1,29 @@
 from __future__ import annotations
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi_jwt_auth import AuthJWT
 from starlette import status
 
 from admin import create_sqlalchemy_admin
 from api import api_router
+from core.app import (
+    passwords,
+    product_listing,
+    product_ranking,
+    revocations,
+    suggestions,
+    transaction,
+)
+from core.depends import AdminAuthorization
 from core.exceptions import setup as setup_exception_handlers
 from core.middleware import setup as setup_middleware
+from core.routing import TransactionRoute
 from core.security import Settings
 from core.settings import fastapi_uvicorn_settings
 from logger import logger
+from orm.core import engine, replica_engine
 from schemas import ApplicationResponse
-from typing_ import RouteReturnT
+from typing_ import DictStrAny, RouteReturnT
 
 
 def create_application() -> FastAPI:
@@ -44,10 +55,19 @@ def create_application() -> FastAPI:
         @application.on_event("startup")
         async def startup() -> None:
             logger.info("Application startup")
+            await product_listing.start()
+            await product_ranking.start()
+            await revocations.start()
+            await suggestions.start()
 
         @application.on_event("shutdown")
         async def shutdown() -> None:
             logger.warning("Application shutdown")
+            await product_listing.stop()
+            await product_ranking.stop()
+            await revocations.stop()
+            await passwords.stop()
+            await suggestions.stop()
 
     def create_routes() -> None:
         @application.get(
@@ -63,6 +83,30 @@ def create_application() -> FastAPI:
                 "result": True,
             }
 
+        # internal counters, only for admins and out of the public schema
+        internal_router = APIRouter(route_class=TransactionRoute)
+
+        @internal_router.get(
+            path="/stats/",
+            response_model=ApplicationResponse[DictStrAny],
+            status_code=status.HTTP_200_OK,
+            include_in_schema=False,
+        )
+        async def stats(user: AdminAuthorization) -> RouteReturnT:
+            return {
+                "ok": True,
+                "result": {
+                    "transactions": transaction.stats(),
+                    "passwords": passwords.stats(),
+                    "pools": {
+                        "primary": engine.pool.stats(),
+                        "replica": replica_engine.pool.stats() if replica_engine else None,
+                    },
+                },
+            }
+
+        application.include_router(internal_router)
+
     def create_admins() -> None:
         if fastapi_uvicorn_settings.DEBUG:
             sqlalchemy_admin = create_sqlalchemy_admin()
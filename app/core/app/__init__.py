@@ -1,9 +1,31 @@
 from .aws_s3 import aws_s3
+from .category_tree import category_tree
 from .crud import crud
+from .favorites import favorites
 from .mail import fm
+from .passwords import passwords
+from .principals import principals
+from .product_cache import product_cache
+from .product_listing import product_listing
+from .product_ranking import product_ranking
+from .product_review_stats import product_review_stats
+from .revocations import revocations
+from .suggestions import suggestions
+from .transaction import transaction
 
 __all__ = (
     "aws_s3",
+    "category_tree",
     "fm",
     "crud",
+    "favorites",
+    "passwords",
+    "principals",
+    "product_cache",
+    "product_listing",
+    "product_ranking",
+    "product_review_stats",
+    "revocations",
+    "suggestions",
+    "transaction",
 )
@@ -0,0 +1,5 @@
+from .category_tree import CategoryTree
+
+category_tree = CategoryTree()
+
+__all__ = ("category_tree",)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional
+
+from corecrud import OrderBy
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from orm import CategoryModel
+from schemas import Category
+
+from ..crud import crud
+
+
+@dataclass(frozen=True)
+class CategoryTreeSnapshot:
+    categories: List[Category]
+    descendants: Dict[int, FrozenSet[int]]
+
+
+class CategoryTree:
+    """
+    In-process snapshot of the category tree: every category with its nested children,
+    and for every category the ids of its whole subtree (itself included).
+    The snapshot is reloaded after `invalidate()` or once it is older than
+    `CATEGORY_TREE_TTL` seconds, so other workers pick up category changes too.
+    """
+
+    def __init__(self) -> None:
+        self._snapshot: Optional[CategoryTreeSnapshot] = None
+        self._loaded_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def invalidate(self) -> None:
+        self._snapshot = None
+
+    async def categories(self, session: AsyncSession) -> List[Category]:
+        snapshot = await self.snapshot(session=session)
+        return snapshot.categories
+
+    async def subtree(self, session: AsyncSession, category_id: int) -> FrozenSet[int]:
+        snapshot = await self.snapshot(session=session)
+        return snapshot.descendants.get(category_id, frozenset((category_id,)))
+
+    async def snapshot(self, session: AsyncSession) -> CategoryTreeSnapshot:
+        if self._fresh():
+            return self._snapshot  # type: ignore[return-value]
+
+        async with self._lock:
+            if not self._fresh():
+                self._snapshot = await self.load(session=session)
+                self._loaded_at = time.monotonic()
+
+        return self._snapshot  # type: ignore[return-value]
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._loaded_at < cache_settings.CATEGORY_TREE_TTL
+        )
+
+    @staticmethod
+    async def load(session: AsyncSession) -> CategoryTreeSnapshot:
+        rows = await crud.categories.select.many(
+            OrderBy(CategoryModel.id),
+            session=session,
+        )
+
+        children: Dict[Optional[int], List[CategoryModel]] = {}
+        for row in rows:
+            children.setdefault(row.parent_id, []).append(row)
+
+        nodes: Dict[int, Category] = {}
+        descendants: Dict[int, FrozenSet[int]] = {}
+
+        def visit(category: CategoryModel, path: FrozenSet[int]) -> None:
+            if category.id in nodes:
+                return
+
+            kids = [kid for kid in children.get(category.id, []) if kid.id not in path]
+            for kid in kids:
+                visit(category=kid, path=path | {kid.id})
+
+            nodes[category.id] = Category(
+                id=category.id,
+                name=category.name,
+                level=category.level,
+                parent_id=category.parent_id,
+                children=[nodes[kid.id] for kid in kids],
+            )
+            descendants[category.id] = frozenset(
+                {category.id}.union(*(descendants[kid.id] for kid in kids))
+            )
+
+        for row in rows:
+            visit(category=row, path=frozenset((row.id,)))
+
+        return CategoryTreeSnapshot(
+            categories=[nodes[row.id] for row in rows],
+            descendants=descendants,
+        )
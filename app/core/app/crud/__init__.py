@@ -6,6 +6,7 @@ from corecrud import CRUD, Mappings
 
 from orm import (
     AdminModel,
+    CategoryFacetModel,
     CategoryModel,
     CategoryPropertyModel,
     CategoryPropertyTypeModel,
@@ -22,12 +23,15 @@ from orm import (
     OrderProductVariationModel,
     OrderStatusModel,
     ProductImageModel,
+    ProductListingModel,
     ProductModel,
     ProductPriceModel,
     ProductPropertyValueModel,
+    ProductRankingModel,
     ProductReviewModel,
     ProductReviewPhotoModel,
     ProductReviewReactionModel,
+    ProductReviewStatsModel,
     ProductVariationCountModel,
     ProductVariationValueModel,
     ResetTokenModel,
@@ -44,6 +48,8 @@ from orm import (
     UserSearchModel,
 )
 
+from .arguments import FromSelect, OnConflictDoUpdate
+
 
 @dataclass(init=False, eq=False, repr=False, frozen=True)
 class _CRUD:
@@ -53,6 +59,7 @@ class _CRUD:
     )
     admins: CRUD[AdminModel] = CRUD(AdminModel)
     categories: CRUD[CategoryModel] = CRUD(CategoryModel)
+    categories_facets: CRUD[CategoryFacetModel] = CRUD(CategoryFacetModel)
     categories_properties: CRUD[CategoryPropertyModel] = CRUD(CategoryPropertyModel)
     categories_property_types: CRUD[CategoryPropertyTypeModel] = CRUD(CategoryPropertyTypeModel)
     categories_property_values: CRUD[CategoryPropertyValueModel] = CRUD(CategoryPropertyValueModel)
@@ -71,12 +78,15 @@ class _CRUD:
     orders_statuses: CRUD[OrderStatusModel] = CRUD(OrderStatusModel)
     products: CRUD[ProductModel] = CRUD(ProductModel)
     products_images: CRUD[ProductImageModel] = CRUD(ProductImageModel)
+    products_listing: CRUD[ProductListingModel] = CRUD(ProductListingModel)
     products_prices: CRUD[ProductPriceModel] = CRUD(ProductPriceModel)
+    products_rankings: CRUD[ProductRankingModel] = CRUD(ProductRankingModel)
     products_property_values: CRUD[ProductPropertyValueModel] = CRUD(ProductPropertyValueModel)
     products_variation_values: CRUD[ProductVariationValueModel] = CRUD(ProductVariationValueModel)
     products_reviews: CRUD[ProductReviewModel] = CRUD(ProductReviewModel)
     products_reviews_photos: CRUD[ProductReviewPhotoModel] = CRUD(ProductReviewPhotoModel)
     products_reviews_reactions: CRUD[ProductReviewReactionModel] = CRUD(ProductReviewReactionModel)
+    products_reviews_stats: CRUD[ProductReviewStatsModel] = CRUD(ProductReviewStatsModel)
     products_variation_counts: CRUD[ProductVariationCountModel] = CRUD(ProductVariationCountModel)
     reset_tokens: CRUD[ResetTokenModel] = CRUD(ResetTokenModel)
     sellers: CRUD[SellerModel] = CRUD(SellerModel)
@@ -94,4 +104,8 @@ class _CRUD:
 
 crud = _CRUD()
 
-__all__ = ("crud",)
+__all__ = (
+    "crud",
+    "FromSelect",
+    "OnConflictDoUpdate",
+)
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+from corecrud import Argument
+
+
+class FromSelect(Argument):
+    method = "from_select"
+
+    def __init__(self, names: Sequence[Any], select: Any) -> None:
+        super(FromSelect, self).__init__(names, select)
+
+
+class OnConflictDoUpdate(Argument):
+    method = "on_conflict_do_update"
+
+    def __init__(self, **kwargs: Any) -> None:
+        super(OnConflictDoUpdate, self).__init__(**kwargs)
@@ -0,0 +1,5 @@
+from .favorites import Favorites
+
+favorites = Favorites()
+
+__all__ = ("favorites",)
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, List, Set, Tuple
+
+from corecrud import SelectFrom, Where
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from orm import SellerFavoriteModel
+
+from ..crud import crud
+
+
+class Favorites:
+    """
+    In-process LRU cache of the favorite product ids of recently active sellers.
+    `add()`/`remove()` apply the writes of this worker to a cached set once their
+    transaction commits; sets older than `FAVORITES_CACHE_TTL` seconds are reloaded,
+    so changes made through other workers show up too. At most `FAVORITES_CACHE_SIZE`
+    sellers are kept. Only listings and bulk lookups read it, single checks query the
+    database.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[int, Tuple[float, Set[int]]] = OrderedDict()
+
+    async def ids(self, session: AsyncSession, seller_id: int) -> Set[int]:
+        entry = self._entries.get(seller_id)
+        if entry is not None and time.monotonic() - entry[0] < cache_settings.FAVORITES_CACHE_TTL:
+            self._entries.move_to_end(seller_id)
+            return entry[1]
+
+        rows = await crud.raws.select.many(
+            Where(SellerFavoriteModel.seller_id == seller_id),
+            SelectFrom(SellerFavoriteModel),
+            nested_select=[SellerFavoriteModel.product_id],
+            session=session,
+        )
+        ids = {row.product_id for row in rows}
+
+        self._entries[seller_id] = (time.monotonic(), ids)
+        self._entries.move_to_end(seller_id)
+        while len(self._entries) > cache_settings.FAVORITES_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+        return ids
+
+    async def among(
+        self, session: AsyncSession, seller_id: int, product_ids: Iterable[int]
+    ) -> List[int]:
+        ids = await self.ids(session=session, seller_id=seller_id)
+        return [product_id for product_id in product_ids if product_id in ids]
+
+    def add(self, session: AsyncSession, seller_id: int, product_id: int) -> None:
+        def committed(*args: Any) -> None:
+            entry = self._entries.get(seller_id)
+            if entry is not None:
+                entry[1].add(product_id)
+
+        event.listen(session.sync_session, "after_commit", committed, once=True)
+
+    def remove(self, session: AsyncSession, seller_id: int, product_id: int) -> None:
+        def committed(*args: Any) -> None:
+            entry = self._entries.get(seller_id)
+            if entry is not None:
+                entry[1].discard(product_id)
+
+        event.listen(session.sync_session, "after_commit", committed, once=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,5 @@
+from .passwords import Passwords
+
+passwords = Passwords()
+
+__all__ = ("passwords",)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple, TypeVar
+
+from fastapi.exceptions import HTTPException
+from starlette import status
+
+from core.security import (
+    check_and_update_hashed_password,
+    check_hashed_password,
+    hash_password,
+)
+from core.settings import password_settings
+from typing_ import DictStrAny
+
+T = TypeVar("T")
+
+
+class Passwords:
+    """
+    Hashes and checks passwords on `PASSWORD_HASHING_WORKERS` threads instead of the
+    event loop; hashlib releases the GIL while it derives the key. Calls wait for a free
+    thread in submission order, once `PASSWORD_HASHING_QUEUE_SIZE` of them are waiting
+    new ones are refused with 503. Waiting times and the queue peak are kept for `stats()`.
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.pending = 0
+        self.peak = 0
+        self.calls = 0
+        self.rejected = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        # the waiting times are added up on the hashing threads
+        self._lock = threading.Lock()
+
+    @property
+    def waiting(self) -> int:
+        return max(self.pending - password_settings.PASSWORD_HASHING_WORKERS, 0)
+
+    async def run(self, function: Callable[..., T], *args: Any) -> T:
+        if self.waiting >= password_settings.PASSWORD_HASHING_QUEUE_SIZE:
+            self.rejected += 1
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password checks, try again later",
+            )
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=password_settings.PASSWORD_HASHING_WORKERS,
+                thread_name_prefix="passwords",
+            )
+
+        submitted = time.perf_counter()
+
+        def timed() -> T:
+            elapsed = time.perf_counter() - submitted
+            with self._lock:
+                self.wait_total += elapsed
+                self.wait_max = max(self.wait_max, elapsed)
+            return function(*args)
+
+        self.pending += 1
+        self.calls += 1
+        self.peak = max(self.peak, self.waiting)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self.pending -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self.run(hash_password, password)
+
+    async def check(self, password: str, hashed: str) -> bool:
+        return await self.run(check_hashed_password, password, hashed)
+
+    async def check_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        return await self.run(check_and_update_hashed_password, password, hashed)
+
+    async def stop(self) -> None:
+        if self._executor:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def stats(self) -> DictStrAny:
+        return {
+            "workers": password_settings.PASSWORD_HASHING_WORKERS,
+            "running": self.pending - self.waiting,
+            "waiting": self.waiting,
+            "peak": self.peak,
+            "calls": self.calls,
+            "rejected": self.rejected,
+            "wait_total": round(self.wait_total, 6),
+            "wait_max": round(self.wait_max, 6),
+        }
@@ -0,0 +1,5 @@
+from .principals import Principals
+
+principals = Principals()
+
+__all__ = ("principals",)
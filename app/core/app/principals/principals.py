@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from orm import UserModel
+
+
+class Principals:
+    """
+    In-process LRU cache of authenticated users as eagerly loaded by
+    `core.depends.authorization.account()`, keyed by user id and the name of the loader
+    that built them. Routes changing a user, seller, supplier or company profile
+    `invalidate()` every entry of their user, again once their transaction commits;
+    other workers catch up within `PRINCIPAL_CACHE_TTL` seconds. At most
+    `PRINCIPAL_CACHE_SIZE` users are kept.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[int, Dict[str, Tuple[float, UserModel]]] = OrderedDict()
+
+    def get(self, user_id: int, loader: str) -> Optional[UserModel]:
+        entry = self._entries.get(user_id, {}).get(loader)
+        if entry is None or time.monotonic() - entry[0] >= cache_settings.PRINCIPAL_CACHE_TTL:
+            return None
+
+        self._entries.move_to_end(user_id)
+        return entry[1]
+
+    @classmethod
+    def detach(cls, session: AsyncSession, instance: Any, seen: Set[int]) -> None:
+        """
+        Expunge `instance` with everything loaded through its relationships, so that
+        a rollback of `session` does not expire the cached graph.
+        """
+
+        state = inspect(instance)
+        if id(instance) in seen or state.session_id is None:
+            return
+
+        seen.add(id(instance))
+        session.expunge(instance)
+        for relationship in state.mapper.relationships:
+            if relationship.key in state.unloaded:
+                continue
+
+            value = state.dict[relationship.key]
+            for related in value if isinstance(value, list) else [value]:
+                if related is not None:
+                    cls.detach(session=session, instance=related, seen=seen)
+
+    def put(self, session: AsyncSession, user: UserModel, loader: str) -> None:
+        self.detach(session=session, instance=user, seen=set())
+        self._entries.setdefault(user.id, {})[loader] = (time.monotonic(), user)
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > cache_settings.PRINCIPAL_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session: AsyncSession, user_id: int) -> None:
+        def committed(*args: Any) -> None:
+            self._entries.pop(user_id, None)
+
+        # a request reading the user before the commit may have cached the old profile
+        self._entries.pop(user_id, None)
+        event.listen(session.sync_session, "after_commit", committed, once=True)
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,5 @@
+from .product_cache import ProductCache
+
+product_cache = ProductCache()
+
+__all__ = ("product_cache",)
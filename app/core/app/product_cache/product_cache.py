@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from corecrud import Returning, SelectFrom, Values, Where
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from orm import ProductModel
+
+from ..crud import crud
+
+
+class ProductCache:
+    """
+    In-process LRU cache of per-product responses (card, images, grades).
+    Entries are keyed by (kind, product id) and tagged with the `product.version`
+    they were built from. Write paths bump the version in the same transaction as
+    the change, so a stale entry is detected on the next read in every worker.
+    At most `PRODUCT_CACHE_SIZE` entries are kept; the least recently used go first.
+    """
+
+    def __init__(self) -> None:
+        self._entries: OrderedDict[Tuple[str, int], Tuple[int, Any]] = OrderedDict()
+
+    @staticmethod
+    async def version(session: AsyncSession, product_id: int) -> Optional[int]:
+        row = await crud.raws.select.one(
+            Where(ProductModel.id == product_id),
+            SelectFrom(ProductModel),
+            nested_select=[ProductModel.version],
+            session=session,
+        )
+
+        return row.version if row else None
+
+    @staticmethod
+    async def bump(session: AsyncSession, *where: Any) -> None:
+        await crud.products.update.many(
+            Values({ProductModel.version: ProductModel.version + 1}),
+            Where(*where),
+            Returning(ProductModel.id),
+            session=session,
+        )
+
+    @staticmethod
+    def etag(kind: str, product_id: int, version: int) -> str:
+        return f'W/"{kind}-{product_id}-{version}"'
+
+    def get(self, kind: str, product_id: int, version: int) -> Optional[Any]:
+        entry = self._entries.get((kind, product_id))
+        if entry is None or entry[0] != version:
+            return None
+
+        self._entries.move_to_end((kind, product_id))
+        return entry[1]
+
+    def put(self, kind: str, product_id: int, version: int, value: Any) -> None:
+        key = (kind, product_id)
+        current = self._entries.get(key)
+        if current is not None and current[0] > version:
+            return
+
+        self._entries[key] = (version, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > cache_settings.PRODUCT_CACHE_SIZE:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
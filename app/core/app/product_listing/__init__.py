@@ -0,0 +1,5 @@
+from .product_listing import ProductListing
+
+product_listing = ProductListing()
+
+__all__ = ("product_listing",)
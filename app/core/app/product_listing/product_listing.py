@@ -0,0 +1,362 @@
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from typing import Any, Optional, Tuple
+
+from corecrud import (
+    GroupBy,
+    Join,
+    Limit,
+    OrderBy,
+    OuterJoin,
+    Returning,
+    SelectFrom,
+    Values,
+    Where,
+)
+from sqlalchemy import (
+    case,
+    func,
+    literal,
+    literal_column,
+    true,
+    tuple_,
+    types,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import array, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from enums import FacetType, Isolation
+from logger import logger
+from orm import (
+    CategoryFacetModel,
+    ProductImageModel,
+    ProductListingModel,
+    ProductModel,
+    ProductPriceModel,
+    ProductPropertyValueModel,
+    ProductReviewStatsModel,
+    ProductVariationValueModel,
+    SupplierModel,
+    UserModel,
+)
+
+from ..crud import FromSelect, OnConflictDoUpdate, crud
+from ..transaction import transaction
+
+# (category_id, facet, value_id) of a `category_facet` row
+FacetKey = Tuple[int, str, int]
+
+
+class ProductListing:
+    """
+    Maintains `product_listing`: one denormalized row per active product, so that
+    catalog listings, sorting and filtering read a single indexed table.
+    Per-category facet counts (`category_facet`) are kept in step with it.
+    A background task refreshes products whose price window opened or closed.
+    """
+
+    # lower bounds of the price facet buckets, the last one is open-ended
+    price_buckets: Tuple[int, ...] = (0, 100, 500, 1_000, 5_000, 10_000)
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def refresh(self, session: AsyncSession, *where: Any) -> None:
+        """
+        Rebuild rows of the products matching `where` (conditions on `ProductModel`),
+        in the caller's transaction. Inactive products are dropped from the listing.
+        """
+
+        products = crud.raws.select.executor.query.build(
+            Where(*where),
+            SelectFrom(ProductModel),
+            nested_select=[ProductModel.id],
+        )
+
+        old = await self.facets(session=session, products=products)
+        await crud.products_listing.delete.many(
+            Where(ProductListingModel.id.in_(products)),
+            Returning(ProductListingModel.id),
+            session=session,
+        )
+        await crud.products_listing.insert.many(
+            FromSelect(self.columns(), self.query(*where)),
+            Returning(ProductListingModel.id),
+            session=session,
+        )
+        new = await self.facets(session=session, products=products)
+        await self.count_facets(session=session, old=old, new=new)
+
+    async def refresh_reviews(self, session: AsyncSession, *where: Any) -> None:
+        """
+        Copy only `grade_average` and `review_count` of the listed products matching
+        `where` (conditions on `ProductModel`), leaving the facet counts alone.
+        """
+
+        review_count = crud.raws.select.executor.query.build(
+            Where(ProductReviewStatsModel.product_id == ProductModel.id),
+            nested_select=[ProductReviewStatsModel.review_count],
+        ).scalar_subquery()
+
+        await crud.products_listing.update.many(
+            Values(
+                {
+                    ProductListingModel.grade_average: ProductModel.grade_average,
+                    ProductListingModel.review_count: func.coalesce(review_count, 0),
+                }
+            ),
+            Where(ProductListingModel.id == ProductModel.id, *where),
+            Returning(ProductListingModel.id),
+            session=session,
+        )
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        await self.refresh(session, true())
+
+    async def refresh_prices(self, session: AsyncSession) -> None:
+        """
+        Refresh the products whose current price window has opened or closed.
+        """
+
+        expired = await crud.raws.select.many(
+            Where(ProductListingModel.price_expires_at <= func.now()),
+            SelectFrom(ProductListingModel),
+            nested_select=[ProductListingModel.id],
+            session=session,
+        )
+        if expired:
+            await self.refresh(session, ProductModel.id.in_([product.id for product in expired]))
+
+    async def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        async def work(session: AsyncSession) -> None:
+            # every worker runs the loop, the one holding the lock does the refresh
+            if await transaction.try_lock(session=session, name="product_listing.prices"):
+                await self.refresh_prices(session=session)
+
+        while True:
+            try:
+                await transaction.run(
+                    work=work, isolation=Isolation.SERIALIZABLE, name="product_listing.prices"
+                )
+            except Exception as exception:
+                logger.exception(exception)
+            await asyncio.sleep(cache_settings.PRODUCT_PRICES_REFRESH_INTERVAL)
+
+    async def facets(self, session: AsyncSession, products: Any) -> Counter[FacetKey]:
+        """
+        Facet counts of the listed `products`, by category, facet type and value.
+        """
+
+        build = crud.raws.select.executor.query.build
+        listed = ProductListingModel.id.in_(products)
+        facets = union_all(
+            build(
+                Where(listed),
+                nested_select=[
+                    ProductListingModel.category_id,
+                    literal(FacetType.PROPERTY.value).label("facet"),
+                    func.unnest(ProductListingModel.property_value_ids).label("value_id"),
+                ],
+            ),
+            build(
+                Where(listed),
+                nested_select=[
+                    ProductListingModel.category_id,
+                    literal(FacetType.VARIATION.value),
+                    func.unnest(ProductListingModel.variation_value_ids),
+                ],
+            ),
+            build(
+                Where(listed, ProductListingModel.price_value.is_not(None)),
+                nested_select=[
+                    ProductListingModel.category_id,
+                    literal(FacetType.PRICE.value),
+                    func.width_bucket(
+                        ProductListingModel.price_value,
+                        array(self.price_buckets, type_=types.Numeric),
+                    ),
+                ],
+            ),
+        ).subquery()
+
+        rows = await crud.raws.select.many(
+            SelectFrom(facets),
+            GroupBy(facets.c.category_id, facets.c.facet, facets.c.value_id),
+            nested_select=[
+                facets.c.category_id,
+                facets.c.facet,
+                facets.c.value_id,
+                func.count().label("count"),
+            ],
+            session=session,
+        )
+
+        return Counter({(row.category_id, row.facet, row.value_id): row.count for row in rows})
+
+    async def count_facets(
+        self, session: AsyncSession, old: Counter[FacetKey], new: Counter[FacetKey]
+    ) -> None:
+        """
+        Move the facet counts from `old` to `new`, writing only the facets that changed
+        and deleting those no product has anymore.
+        """
+
+        changes = {key: new[key] - old[key] for key in old.keys() | new.keys()}
+        changes = {key: change for key, change in changes.items() if change}
+        if not changes:
+            return
+
+        await crud.categories_facets.insert.many(
+            Values(
+                [
+                    {
+                        CategoryFacetModel.category_id: category_id,
+                        CategoryFacetModel.facet: facet,
+                        CategoryFacetModel.value_id: value_id,
+                        CategoryFacetModel.count: change,
+                    }
+                    for (category_id, facet, value_id), change in sorted(changes.items())
+                ]
+            ),
+            OnConflictDoUpdate(
+                index_elements=[
+                    CategoryFacetModel.category_id,
+                    CategoryFacetModel.facet,
+                    CategoryFacetModel.value_id,
+                ],
+                set_={
+                    CategoryFacetModel.count: CategoryFacetModel.count
+                    + literal_column("excluded.count")
+                },
+            ),
+            Returning(CategoryFacetModel.id),
+            session=session,
+            dialect=insert,
+        )
+
+        removed = [key for key, change in changes.items() if change < 0]
+        if removed:
+            await crud.categories_facets.delete.many(
+                Where(
+                    tuple_(
+                        CategoryFacetModel.category_id,
+                        CategoryFacetModel.facet,
+                        CategoryFacetModel.value_id,
+                    ).in_(removed),
+                    CategoryFacetModel.count <= 0,
+                ),
+                Returning(CategoryFacetModel.id),
+                session=session,
+            )
+
+    @staticmethod
+    def columns() -> Any:
+        return [
+            ProductListingModel.id,
+            ProductListingModel.category_id,
+            ProductListingModel.supplier_id,
+            ProductListingModel.name,
+            ProductListingModel.datetime,
+            ProductListingModel.grade_average,
+            ProductListingModel.total_orders,
+            ProductListingModel.review_count,
+            ProductListingModel.price_value,
+            ProductListingModel.discount,
+            ProductListingModel.discounted_price,
+            ProductListingModel.min_quantity,
+            ProductListingModel.price_expires_at,
+            ProductListingModel.image_url,
+            ProductListingModel.supplier_name,
+            ProductListingModel.property_value_ids,
+            ProductListingModel.variation_value_ids,
+        ]
+
+    @staticmethod
+    def query(*where: Any) -> Any:
+        build = crud.raws.select.executor.query.build
+
+        current_price = build(
+            Where(
+                ProductPriceModel.product_id == ProductModel.id,
+                func.now().between(ProductPriceModel.start_date, ProductPriceModel.end_date),
+            ),
+            OrderBy(ProductPriceModel.min_quantity.asc(), ProductPriceModel.id.asc()),
+            Limit(1),
+            nested_select=[
+                ProductPriceModel.value,
+                ProductPriceModel.discount,
+                ProductPriceModel.min_quantity,
+            ],
+        ).lateral("current_price")
+        # the nearest moment a price window of the product opens or closes
+        price_expires_at = build(
+            Where(ProductPriceModel.product_id == ProductModel.id),
+            nested_select=[
+                func.min(
+                    case(
+                        (ProductPriceModel.start_date > func.now(), ProductPriceModel.start_date),
+                        (ProductPriceModel.end_date > func.now(), ProductPriceModel.end_date),
+                    )
+                )
+            ],
+        ).scalar_subquery()
+        first_image = build(
+            Where(ProductImageModel.product_id == ProductModel.id),
+            OrderBy(ProductImageModel.order.asc(), ProductImageModel.id.asc()),
+            Limit(1),
+            nested_select=[ProductImageModel.image_url],
+        ).scalar_subquery()
+        property_value_ids = build(
+            Where(ProductPropertyValueModel.product_id == ProductModel.id),
+            OrderBy(ProductPropertyValueModel.property_value_id),
+            nested_select=[ProductPropertyValueModel.property_value_id],
+        ).scalar_subquery()
+        variation_value_ids = build(
+            Where(ProductVariationValueModel.product_id == ProductModel.id),
+            OrderBy(ProductVariationValueModel.variation_value_id),
+            nested_select=[ProductVariationValueModel.variation_value_id],
+        ).scalar_subquery()
+
+        return build(
+            Where(ProductModel.is_active.is_(True), *where),
+            Join(SupplierModel, SupplierModel.id == ProductModel.supplier_id),
+            Join(UserModel, UserModel.id == SupplierModel.user_id),
+            OuterJoin(
+                ProductReviewStatsModel, ProductReviewStatsModel.product_id == ProductModel.id
+            ),
+            OuterJoin(current_price, true()),
+            nested_select=[
+                ProductModel.id,
+                ProductModel.category_id,
+                ProductModel.supplier_id,
+                ProductModel.name,
+                ProductModel.datetime,
+                ProductModel.grade_average,
+                ProductModel.total_orders,
+                func.coalesce(ProductReviewStatsModel.review_count, 0),
+                current_price.c.value,
+                current_price.c.discount,
+                func.round(
+                    current_price.c.value * (1 - func.coalesce(current_price.c.discount, 0)), 2
+                ),
+                current_price.c.min_quantity,
+                price_expires_at,
+                first_image,
+                func.nullif(func.concat_ws(" ", UserModel.first_name, UserModel.last_name), ""),
+                func.array(property_value_ids),
+                func.array(variation_value_ids),
+            ],
+        )
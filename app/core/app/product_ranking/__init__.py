@@ -0,0 +1,5 @@
+from .product_ranking import ProductRanking
+
+product_ranking = ProductRanking()
+
+__all__ = ("product_ranking",)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+from typing import Any, Dict, Optional, Tuple
+
+from corecrud import Returning, SelectFrom, Where
+from sqlalchemy import func, literal, over, true
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from enums import Isolation, RankingType
+from logger import logger
+from orm import ProductListingModel, ProductRankingModel
+
+from ..crud import FromSelect, crud
+from ..transaction import transaction
+
+
+class ProductRanking:
+    """
+    Periodically ranks listed products inside every category and keeps the top
+    `PRODUCT_RANKINGS_SIZE` of each ranking in `product_ranking`.
+    Scores are weighted sums of normalized orders, rating and recency,
+    computed in a single set-based statement over the whole catalog.
+    """
+
+    # weights of (orders, rating, recency)
+    weights: Dict[RankingType, Tuple[float, float, float]] = {
+        RankingType.POPULAR: (0.6, 0.25, 0.15),
+        RankingType.SIMILAR: (0.2, 0.6, 0.2),
+    }
+    # age in days at which the recency term drops to 1/e
+    recency_days: int = 30
+
+    def __init__(self) -> None:
+        self._task: Optional[asyncio.Task[None]] = None
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        await crud.products_rankings.delete.many(
+            Where(true()),
+            Returning(ProductRankingModel.id),
+            session=session,
+        )
+        for ranking in RankingType:
+            await crud.products_rankings.insert.many(
+                FromSelect(
+                    [
+                        ProductRankingModel.ranking,
+                        ProductRankingModel.category_id,
+                        ProductRankingModel.position,
+                        ProductRankingModel.product_id,
+                        ProductRankingModel.score,
+                        ProductRankingModel.ranked_at,
+                    ],
+                    self.query(ranking=ranking),
+                ),
+                Returning(ProductRankingModel.id),
+                session=session,
+            )
+
+    @staticmethod
+    async def stale(session: AsyncSession) -> bool:
+        """
+        Whether the rankings are missing or older than `PRODUCT_RANKINGS_REFRESH_INTERVAL`.
+        """
+
+        ranked = await crud.raws.select.one(
+            SelectFrom(ProductRankingModel),
+            nested_select=[
+                func.coalesce(
+                    func.max(ProductRankingModel.ranked_at)
+                    <= func.now()
+                    - timedelta(seconds=cache_settings.PRODUCT_RANKINGS_REFRESH_INTERVAL),
+                    true(),
+                ).label("stale")
+            ],
+            session=session,
+        )
+
+        return bool(ranked.stale)
+
+    def query(self, ranking: RankingType) -> Any:
+        build = crud.raws.select.executor.query.build
+        orders_weight, rating_weight, recency_weight = self.weights[ranking]
+
+        orders = func.ln(1 + ProductListingModel.total_orders)
+        age = func.extract("epoch", func.now() - ProductListingModel.datetime) / 86400
+        scores = build(
+            Where(ProductListingModel.price_value.is_not(None)),
+            SelectFrom(ProductListingModel),
+            nested_select=[
+                ProductListingModel.id,
+                ProductListingModel.category_id,
+                (
+                    orders_weight
+                    * func.coalesce(
+                        orders
+                        / func.nullif(
+                            over(func.max(orders), partition_by=ProductListingModel.category_id),
+                            0,
+                        ),
+                        0,
+                    )
+                    + rating_weight * ProductListingModel.grade_average / 5
+                    + recency_weight * func.exp(-func.greatest(age, 0) / self.recency_days)
+                ).label("score"),
+            ],
+        ).subquery()
+        positions = build(
+            SelectFrom(scores),
+            nested_select=[
+                scores.c.id,
+                scores.c.category_id,
+                scores.c.score,
+                over(
+                    func.row_number(),
+                    partition_by=scores.c.category_id,
+                    order_by=(scores.c.score.desc(), scores.c.id.desc()),
+                ).label("position"),
+            ],
+        ).subquery()
+
+        return build(
+            Where(positions.c.position <= cache_settings.PRODUCT_RANKINGS_SIZE),
+            SelectFrom(positions),
+            nested_select=[
+                literal(ranking.value),
+                positions.c.category_id,
+                positions.c.position,
+                positions.c.id,
+                positions.c.score,
+                func.now(),
+            ],
+        )
+
+    async def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        async def work(session: AsyncSession) -> None:
+            # every worker runs the loop, the one holding the lock does the rebuild unless
+            # another worker did it within the interval
+            if await transaction.try_lock(
+                session=session, name="product_ranking.rebuild"
+            ) and await self.stale(session=session):
+                await self.rebuild(session=session)
+
+        while True:
+            try:
+                await transaction.run(
+                    work=work, isolation=Isolation.SERIALIZABLE, name="product_ranking.rebuild"
+                )
+            except Exception as exception:
+                logger.exception(exception)
+            await asyncio.sleep(cache_settings.PRODUCT_RANKINGS_REFRESH_INTERVAL)
@@ -0,0 +1,5 @@
+from .product_review_stats import ProductReviewStats
+
+product_review_stats = ProductReviewStats()
+
+__all__ = ("product_review_stats",)
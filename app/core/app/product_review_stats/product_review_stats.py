@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+from corecrud import GroupBy, Returning, SelectFrom, Values, Where
+from sqlalchemy import Numeric, cast, exists, func, true
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from orm import ProductModel, ProductReviewModel, ProductReviewStatsModel
+
+from ..crud import FromSelect, OnConflictDoUpdate, crud
+from ..product_listing import product_listing
+
+
+class ProductReviewStats:
+    """
+    Maintains `product_review_stats`: per product review count, sum of grades
+    and a histogram of grades 1-5, updated in the transaction that adds a review,
+    so that rating summaries never scan `product_review`.
+    Product `grade_average` is derived from the stored sum and count by a single
+    set-based UPDATE, never read-modify-written in Python.
+    """
+
+    # histogram columns, the one at index `grade - 1` counts reviews with that grade
+    histogram: Tuple[Any, ...] = (
+        ProductReviewStatsModel.grade_1,
+        ProductReviewStatsModel.grade_2,
+        ProductReviewStatsModel.grade_3,
+        ProductReviewStatsModel.grade_4,
+        ProductReviewStatsModel.grade_5,
+    )
+
+    async def add(self, session: AsyncSession, product_id: int, grade: int) -> None:
+        bucket = self.histogram[grade - 1]
+
+        await crud.products_reviews_stats.insert.one(
+            Values(
+                {
+                    ProductReviewStatsModel.product_id: product_id,
+                    ProductReviewStatsModel.review_count: 1,
+                    ProductReviewStatsModel.grade_sum: grade,
+                    bucket: 1,
+                }
+            ),
+            OnConflictDoUpdate(
+                index_elements=[ProductReviewStatsModel.product_id],
+                set_={
+                    ProductReviewStatsModel.review_count: ProductReviewStatsModel.review_count + 1,
+                    ProductReviewStatsModel.grade_sum: ProductReviewStatsModel.grade_sum + grade,
+                    bucket: bucket + 1,
+                },
+            ),
+            Returning(ProductReviewStatsModel.id),
+            session=session,
+            dialect=insert,
+        )
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        await crud.products_reviews_stats.delete.many(
+            Where(true()),
+            Returning(ProductReviewStatsModel.id),
+            session=session,
+        )
+        await crud.products_reviews_stats.insert.many(
+            FromSelect(
+                [
+                    ProductReviewStatsModel.product_id,
+                    ProductReviewStatsModel.review_count,
+                    ProductReviewStatsModel.grade_sum,
+                    *self.histogram,
+                ],
+                crud.raws.select.executor.query.build(
+                    SelectFrom(ProductReviewModel),
+                    GroupBy(ProductReviewModel.product_id),
+                    nested_select=[
+                        ProductReviewModel.product_id,
+                        func.count(ProductReviewModel.id),
+                        func.sum(ProductReviewModel.grade_overall),
+                        *(
+                            func.count(ProductReviewModel.id).filter(
+                                ProductReviewModel.grade_overall == grade
+                            )
+                            for grade in range(1, len(self.histogram) + 1)
+                        ),
+                    ],
+                ),
+            ),
+            Returning(ProductReviewStatsModel.id),
+            session=session,
+        )
+
+    @staticmethod
+    async def update_grade_average(session: AsyncSession, *where: Any) -> None:
+        """
+        Recompute `grade_average` of the reviewed products matching `where`
+        (conditions on `ProductModel`) from their stats.
+        """
+
+        await crud.products.update.many(
+            Values(
+                {
+                    ProductModel.grade_average: func.round(
+                        cast(ProductReviewStatsModel.grade_sum, Numeric)
+                        / ProductReviewStatsModel.review_count,
+                        1,
+                    ),
+                    ProductModel.version: ProductModel.version + 1,
+                }
+            ),
+            Where(
+                ProductReviewStatsModel.product_id == ProductModel.id,
+                ProductReviewStatsModel.review_count > 0,
+                *where,
+            ),
+            Returning(ProductModel.id),
+            session=session,
+        )
+
+    async def repair(self, session: AsyncSession) -> None:
+        """
+        Rebuild the stats from `product_review` and recompute the average of every
+        product in one pass, e.g. after bulk imports. Product versions and the review
+        columns of the listing follow, so it is safe to call on its own.
+        """
+
+        await self.rebuild(session=session)
+        # products left without reviews keep no average
+        await crud.products.update.many(
+            Values(
+                {ProductModel.grade_average: 0, ProductModel.version: ProductModel.version + 1}
+            ),
+            Where(
+                ProductModel.grade_average != 0,
+                ~exists().where(
+                    ProductReviewStatsModel.product_id == ProductModel.id,
+                    ProductReviewStatsModel.review_count > 0,
+                ),
+            ),
+            Returning(ProductModel.id),
+            session=session,
+        )
+        await self.update_grade_average(session, true())
+        await product_listing.refresh_reviews(session, true())
@@ -0,0 +1,5 @@
+from .revocations import Revocations
+
+revocations = Revocations()
+
+__all__ = ("revocations",)
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Optional, Set
+
+from corecrud import SelectFrom, Where
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from logger import logger
+from orm import UserModel
+from orm.core import async_sessionmaker
+
+from ..crud import crud
+
+
+class Revocations:
+    """
+    Ids of deleted accounts, whose access tokens are not trusted by their role claims
+    anymore. A worker `revoke()`s the accounts deleted through it once their transaction
+    commits and reloads the whole list every `REVOCATIONS_REFRESH_INTERVAL` seconds.
+    """
+
+    def __init__(self) -> None:
+        self._user_ids: Set[int] = set()
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def revoked(self, user_id: int) -> bool:
+        return user_id in self._user_ids
+
+    def revoke(self, session: AsyncSession, user_id: int) -> None:
+        def committed(*args: Any) -> None:
+            self._user_ids.add(user_id)
+
+        event.listen(session.sync_session, "after_commit", committed, once=True)
+
+    async def refresh(self, session: AsyncSession) -> None:
+        deleted = await crud.raws.select.many(
+            Where(UserModel.is_deleted.is_(True)),
+            SelectFrom(UserModel),
+            nested_select=[UserModel.id],
+            session=session,
+        )
+        self._user_ids = {user.id for user in deleted}
+
+    async def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                async with async_sessionmaker.begin() as session:
+                    await self.refresh(session=session)
+            except Exception as exception:
+                logger.exception(exception)
+            await asyncio.sleep(cache_settings.REVOCATIONS_REFRESH_INTERVAL)
@@ -0,0 +1,5 @@
+from .suggestions import Suggestions
+
+suggestions = Suggestions()
+
+__all__ = ("suggestions",)
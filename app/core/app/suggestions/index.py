@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import bisect
+import heapq
+from typing import Dict, Iterable, List, Tuple
+
+
+def normalize(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class PrefixIndex:
+    """
+    Weighted completions over a sorted list of (key, term) pairs. Every word of a
+    term starts a key, so "cotton" completes "Blue cotton shirt" as well.
+    """
+
+    # prefixes this short match many keys, their top terms are memoized
+    memo_length = 2
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[str, str]] = []
+        self._texts: Dict[str, str] = {}
+        self._weights: Dict[str, int] = {}
+        self._memo: Dict[Tuple[str, int], List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._weights)
+
+    @classmethod
+    def build(cls, entries: Iterable[Tuple[str, int]]) -> PrefixIndex:
+        """
+        Index of the `(text, weight)` entries, with the keys sorted once at the end.
+        """
+
+        index = cls()
+        for text, weight in entries:
+            index._keys.extend(index._count(text=text, weight=weight))
+        index._keys.sort()
+
+        return index
+
+    def add(self, text: str, weight: int = 1) -> None:
+        for key in self._count(text=text, weight=weight):
+            bisect.insort(self._keys, key)
+        self._memo.clear()
+
+    def _count(self, text: str, weight: int) -> List[Tuple[str, str]]:
+        """
+        Add `weight` to the term of `text`, return the keys of the term if it is new.
+        """
+
+        term = normalize(text)
+        if not term:
+            return []
+
+        keys: List[Tuple[str, str]] = []
+        if term not in self._weights:
+            self._texts[term] = text.strip()
+            self._weights[term] = 0
+            words = term.split(" ")
+            keys = [(" ".join(words[position:]), term) for position in range(len(words))]
+
+        self._weights[term] += weight
+        return keys
+
+    def complete(self, prefix: str, limit: int) -> List[str]:
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+
+        memoize = len(prefix) <= self.memo_length
+        if memoize and (prefix, limit) in self._memo:
+            return self._memo[(prefix, limit)]
+
+        terms = set()
+        for key, term in self._keys[bisect.bisect_left(self._keys, (prefix,)) :]:
+            if not key.startswith(prefix):
+                break
+            terms.add(term)
+
+        completions = [
+            self._texts[term]
+            for term in heapq.nlargest(limit, terms, key=lambda term: (self._weights[term], term))
+        ]
+        if memoize:
+            self._memo[(prefix, limit)] = completions
+
+        return completions
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from typing import List, Optional, Tuple
+
+from corecrud import GroupBy, SelectFrom, Where
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import cache_settings
+from logger import logger
+from orm import CategoryModel, ProductModel, UserSearchModel
+from orm.core import async_sessionmaker
+
+from ..crud import crud
+from .index import PrefixIndex, normalize
+
+
+class Suggestions:
+    """
+    Search-as-you-type completions served from memory. A background task rebuilds the
+    index from product names, category names and popular search queries, and in between
+    adds only the products and searches created since the previous refresh.
+    """
+
+    def __init__(self) -> None:
+        self._index = PrefixIndex()
+        self._searches: Counter[str] = Counter()
+        self._last_product_id = 0
+        self._last_search_id = 0
+        self._built_at: Optional[float] = None
+        self._task: Optional[asyncio.Task[None]] = None
+
+    def complete(self, prefix: str, limit: int = 10) -> List[str]:
+        return self._index.complete(prefix=prefix, limit=limit)
+
+    async def start(self) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as exception:
+                logger.exception(exception)
+            await asyncio.sleep(cache_settings.SUGGESTIONS_REFRESH_INTERVAL)
+
+    async def refresh(self) -> None:
+        async with async_sessionmaker.begin() as session:
+            if (
+                self._built_at is None
+                or time.monotonic() - self._built_at > cache_settings.SUGGESTIONS_REBUILD_INTERVAL
+            ):
+                await self.rebuild(session=session)
+            else:
+                await self.update(session=session)
+
+    async def rebuild(self, session: AsyncSession) -> None:
+        entries: List[Tuple[str, int]] = []
+        searches: Counter[str] = Counter()
+
+        categories = await crud.raws.select.many(
+            SelectFrom(CategoryModel),
+            nested_select=[CategoryModel.name],
+            session=session,
+        )
+        for category in categories:
+            entries.append((category.name, 1))
+
+        products = await crud.raws.select.many(
+            Where(ProductModel.is_active.is_(True)),
+            SelectFrom(ProductModel),
+            GroupBy(ProductModel.name),
+            nested_select=[
+                ProductModel.name,
+                func.count().label("count"),
+                func.max(ProductModel.id).label("last_id"),
+            ],
+            session=session,
+        )
+        for product in products:
+            entries.append((product.name, product.count))
+
+        queries = await crud.raws.select.many(
+            SelectFrom(UserSearchModel),
+            GroupBy(func.lower(UserSearchModel.search_query)),
+            nested_select=[
+                func.lower(UserSearchModel.search_query).label("search_query"),
+                func.count().label("count"),
+                func.max(UserSearchModel.id).label("last_id"),
+            ],
+            session=session,
+        )
+        for query in queries:
+            searches[normalize(query.search_query)] += query.count
+        for query, count in searches.items():
+            if count >= cache_settings.SUGGESTIONS_MIN_SEARCHES:
+                entries.append((query, count))
+
+        # building is CPU-bound, keep the event loop serving requests meanwhile
+        index = await asyncio.get_running_loop().run_in_executor(None, PrefixIndex.build, entries)
+        self._index, self._searches = index, searches
+        self._last_product_id = max((product.last_id for product in products), default=0)
+        self._last_search_id = max((query.last_id for query in queries), default=0)
+        self._built_at = time.monotonic()
+
+    async def update(self, session: AsyncSession) -> None:
+        products = await crud.raws.select.many(
+            Where(ProductModel.id > self._last_product_id, ProductModel.is_active.is_(True)),
+            SelectFrom(ProductModel),
+            nested_select=[ProductModel.id, ProductModel.name],
+            session=session,
+        )
+        for product in products:
+            self._index.add(text=product.name)
+            self._last_product_id = max(self._last_product_id, product.id)
+
+        queries = await crud.raws.select.many(
+            Where(UserSearchModel.id > self._last_search_id),
+            SelectFrom(UserSearchModel),
+            nested_select=[UserSearchModel.id, UserSearchModel.search_query],
+            session=session,
+        )
+        for query in queries:
+            text = normalize(query.search_query)
+            self._searches[text] += 1
+            count = self._searches[text]
+            if count == cache_settings.SUGGESTIONS_MIN_SEARCHES:
+                self._index.add(text=text, weight=count)
+            elif count > cache_settings.SUGGESTIONS_MIN_SEARCHES:
+                self._index.add(text=text)
+            self._last_search_id = max(self._last_search_id, query.id)
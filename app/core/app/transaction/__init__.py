@@ -0,0 +1,5 @@
+from .transaction import Transaction
+
+transaction = Transaction()
+
+__all__ = ("transaction",)
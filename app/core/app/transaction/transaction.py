@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from core.settings import database_settings
+from enums import Isolation
+from logger import logger
+from orm.core import async_sessionmaker, engine, replica_engine
+from typing_ import DictStrAny
+
+T = TypeVar("T")
+
+
+class Transaction:
+    """
+    Runs a unit of work in its own transaction at the requested isolation level.
+    Transactions aborted by PostgreSQL with a serialization failure or a deadlock are
+    retried up to `TRANSACTION_RETRIES` times with exponential backoff and full jitter.
+    Retries and exhausted retries are counted per name for `stats()`.
+    Sessions of the optional replica are read-only REPEATABLE READ, the strictest
+    level a hot standby allows.
+    """
+
+    options: Dict[Isolation, DictStrAny] = {
+        Isolation.READ_ONLY: {
+            "isolation_level": "SERIALIZABLE",
+            "postgresql_readonly": True,
+            "postgresql_deferrable": True,
+        },
+        Isolation.READ_COMMITTED: {"isolation_level": "READ COMMITTED"},
+        Isolation.REPEATABLE_READ: {"isolation_level": "REPEATABLE READ"},
+        Isolation.SERIALIZABLE: {"isolation_level": "SERIALIZABLE"},
+    }
+    # serialization_failure, deadlock_detected
+    retryable: Tuple[str, ...] = ("40001", "40P01")
+
+    def __init__(self) -> None:
+        self._engines: Dict[Isolation, AsyncEngine] = {
+            isolation: engine.execution_options(**options)
+            for isolation, options in self.options.items()
+        }
+        self.replica: Optional[AsyncEngine] = (
+            replica_engine.execution_options(
+                isolation_level="REPEATABLE READ",
+                postgresql_readonly=True,
+            )
+            if replica_engine
+            else None
+        )
+        self.retries: Counter[str] = Counter()
+        self.exhausted: Counter[str] = Counter()
+
+    def session(self, isolation: Isolation) -> AsyncSession:
+        return async_sessionmaker(bind=self._engines[isolation])
+
+    def replica_session(self) -> AsyncSession:
+        return async_sessionmaker(bind=self.replica)
+
+    async def run(
+        self,
+        work: Callable[[AsyncSession], Awaitable[T]],
+        isolation: Isolation,
+        name: str,
+        retries: Optional[int] = None,
+    ) -> T:
+        """
+        Run `work`, retrying it up to `retries` times (`TRANSACTION_RETRIES` by default).
+        """
+
+        if retries is None:
+            retries = database_settings.TRANSACTION_RETRIES
+
+        attempt = 0
+        while True:
+            try:
+                async with self.session(isolation=isolation) as session, session.begin():
+                    return await work(session)
+            except DBAPIError as exception:
+                if getattr(exception.orig, "sqlstate", None) not in self.retryable:
+                    raise
+                if attempt >= retries:
+                    self.exhausted[name] += 1
+                    raise
+
+                attempt += 1
+                self.retries[name] += 1
+                delay = min(
+                    database_settings.TRANSACTION_RETRY_BACKOFF * 2 ** (attempt - 1),
+                    database_settings.TRANSACTION_RETRY_BACKOFF_MAX,
+                )
+                logger.warning(
+                    "Transaction %s aborted (%s), retry %d",
+                    name,
+                    exception.orig.sqlstate,
+                    attempt,
+                )
+                await asyncio.sleep(random.uniform(0, delay))
+
+    @staticmethod
+    async def try_lock(session: AsyncSession, name: str) -> bool:
+        """
+        Take the advisory lock `name` until the end of the transaction, `False` when
+        another transaction holds it. Lets a single worker run a periodic job.
+        """
+
+        return bool(
+            await session.scalar(select(func.pg_try_advisory_xact_lock(func.hashtext(name))))
+        )
+
+    def stats(self) -> DictStrAny:
+        return {
+            "retries": dict(self.retries),
+            "exhausted": dict(self.exhausted),
+        }
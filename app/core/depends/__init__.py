@@ -7,10 +7,16 @@ from typing_extensions import Annotated
 
 from orm import UserModel
 
-from .authorization import authorization, authorization_optional, authorization_refresh
+from .authorization import (
+    authorization,
+    authorization_optional,
+    authorization_refresh,
+    authorization_seller_id_optional,
+    load_claims,
+)
 from .files import FileObjects, image_required
-from .role import admin, seller, supplier
-from .sqlalchemy import get_session
+from .role import admin, seller, seller_id_only, supplier, supplier_id_only
+from .sqlalchemy import get_read_only_session, get_session
 
 AuthJWT = Annotated[AuthJWT, Depends()]
 Authorization = Annotated[UserModel, Depends(authorization)]
@@ -19,11 +25,21 @@ AuthorizationOptional = Annotated[Optional[UserModel], Depends(authorization_opt
 AdminAuthorization = Annotated[UserModel, Depends(admin)]
 SellerAuthorization = Annotated[UserModel, Depends(seller)]
 SupplierAuthorization = Annotated[UserModel, Depends(supplier)]
+# only `user.id` and `user.seller.id` / `user.supplier.id` are there for sure,
+# taken from the role claims of the access token when it has them
+SellerIdAuthorization = Annotated[UserModel, Depends(seller_id_only)]
+SupplierIdAuthorization = Annotated[UserModel, Depends(supplier_id_only)]
+# `None` for anonymous callers and for callers without a usable access token
+SellerIdAuthorizationOptional = Annotated[
+    Optional[UserModel], Depends(authorization_seller_id_optional)
+]
 DatabaseSession = Annotated[AsyncSession, Depends(get_session)]
+ReadOnlyDatabaseSession = Annotated[AsyncSession, Depends(get_read_only_session)]
 Image = Annotated[FileObjects, Depends(image_required)]
 
 __all__ = (
     "authorization",
+    "load_claims",
     "AuthJWT",
     "Authorization",
     "AuthorizationRefresh",
@@ -31,10 +47,16 @@ __all__ = (
     "AdminAuthorization",
     "SellerAuthorization",
     "SupplierAuthorization",
+    "SellerIdAuthorization",
+    "SupplierIdAuthorization",
+    "SellerIdAuthorizationOptional",
     "admin",
     "seller",
     "supplier",
+    "seller_id_only",
+    "supplier_id_only",
     "DatabaseSession",
+    "ReadOnlyDatabaseSession",
     "Image",
     "FileObjects",
 )
@@ -1,48 +1,158 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
-from corecrud import Options, Where
+from corecrud import Options, SelectFrom, Where
 from fastapi.exceptions import HTTPException
 from fastapi.param_functions import Depends
 from fastapi_jwt_auth import AuthJWT
+from fastapi_jwt_auth.exceptions import AuthJWTException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, outerjoin, selectinload
 from starlette import status
 
-from core.app import crud
-from orm import CompanyModel, SellerAddressModel, SellerModel, SupplierModel, UserModel
+from core.app import crud, principals, revocations
+from core.settings import jwt_settings
+from orm import (
+    AdminModel,
+    CompanyModel,
+    SellerAddressModel,
+    SellerModel,
+    SupplierModel,
+    UserModel,
+)
+from typing_ import DictStrAny
 
 from .sqlalchemy import get_session
 
+ADMIN_OPTIONS = (selectinload(UserModel.admin),)
+SELLER_OPTIONS = (
+    selectinload(UserModel.seller).selectinload(SellerModel.image),
+    selectinload(UserModel.seller)
+    .selectinload(SellerModel.addresses)
+    .selectinload(SellerAddressModel.country),
+    selectinload(UserModel.seller).selectinload(SellerModel.notifications),
+)
+SUPPLIER_OPTIONS = (
+    selectinload(UserModel.supplier)
+    .selectinload(SupplierModel.company)
+    .selectinload(CompanyModel.images),
+    selectinload(UserModel.supplier).selectinload(SupplierModel.notifications),
+)
+# what each principal loads along with the user, `*_id` ones only the id of the role
+LOADERS: Dict[str, Tuple[Any, ...]] = {
+    "account": ADMIN_OPTIONS + SELLER_OPTIONS + SUPPLIER_OPTIONS,
+    "admin": ADMIN_OPTIONS,
+    "seller": SELLER_OPTIONS,
+    "supplier": SUPPLIER_OPTIONS,
+    "seller_id": (joinedload(UserModel.seller).load_only(SellerModel.id),),
+    "supplier_id": (joinedload(UserModel.supplier).load_only(SupplierModel.id),),
+}
+# principals the role claims of an access token hold everything of
+CLAIMED_LOADERS = ("seller_id", "supplier_id")
+
+
+async def load_account(
+    user_id: int, session: AsyncSession, loader: str = "account"
+) -> Optional[UserModel]:
+    return await crud.users.select.one(
+        Where(UserModel.id == user_id),
+        Options(*LOADERS[loader]),
+        session=session,
+    )
+
 
 async def account(
     user_id: int,
     session: AsyncSession = Depends(get_session),
+    loader: str = "account",
 ) -> Optional[UserModel]:
-    user = await crud.users.select.one(
+    user = principals.get(user_id=user_id, loader=loader)
+    if user is None:
+        user = await load_account(user_id=user_id, session=session, loader=loader)
+        if user:
+            principals.put(session=session, user=user, loader=loader)
+
+    if user and user.is_deleted:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="This account was deleted.",
+        )
+
+    return user
+
+
+async def load_claims(user_id: int, session: AsyncSession) -> Optional[DictStrAny]:
+    """
+    Role flags and ids of the user to sign into their access tokens, when `ROLE_CLAIMS`
+    is on.
+    """
+
+    if not jwt_settings.ROLE_CLAIMS:
+        return None
+
+    principal = await crud.raws.select.one(
         Where(UserModel.id == user_id),
-        Options(
-            selectinload(UserModel.admin),
-            selectinload(UserModel.seller).selectinload(SellerModel.image),
-            selectinload(UserModel.seller)
-            .selectinload(SellerModel.addresses)
-            .selectinload(SellerAddressModel.country),
-            selectinload(UserModel.seller).selectinload(SellerModel.notifications),
-            selectinload(UserModel.supplier)
-            .selectinload(SupplierModel.company)
-            .selectinload(CompanyModel.images),
-            selectinload(UserModel.supplier).selectinload(SupplierModel.notifications),
+        SelectFrom(
+            outerjoin(UserModel, AdminModel, AdminModel.user_id == UserModel.id)
+            .outerjoin(SellerModel, SellerModel.user_id == UserModel.id)
+            .outerjoin(SupplierModel, SupplierModel.user_id == UserModel.id)
+            .outerjoin(CompanyModel, CompanyModel.supplier_id == SupplierModel.id)
         ),
+        nested_select=[
+            AdminModel.id.label("admin_id"),
+            SellerModel.id.label("seller_id"),
+            SupplierModel.id.label("supplier_id"),
+            CompanyModel.id.label("company_id"),
+        ],
         session=session,
     )
-    if user and user.is_deleted:
+
+    return {
+        "principal": {
+            "admin": principal.admin_id is not None,
+            "seller_id": principal.seller_id,
+            "supplier_id": principal.supplier_id,
+            "company_id": principal.company_id,
+        }
+    }
+
+
+def claimed_account(user_id: int, claims: DictStrAny) -> Optional[UserModel]:
+    """
+    Transient user with the roles the access token claims, trusted for the lifetime of
+    the token unless the account was revoked. `None` for tokens issued without claims.
+    """
+
+    principal = claims.get("principal")
+    if principal is None:
+        return None
+
+    if revocations.revoked(user_id=user_id):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="This account was deleted.",
         )
 
-    return user
+    seller_id, supplier_id, company_id = (
+        principal["seller_id"],
+        principal["supplier_id"],
+        principal["company_id"],
+    )
+
+    return UserModel(
+        id=user_id,
+        is_supplier=supplier_id is not None,
+        admin=AdminModel(user_id=user_id) if principal["admin"] else None,
+        seller=SellerModel(id=seller_id, user_id=user_id) if seller_id else None,
+        supplier=SupplierModel(
+            id=supplier_id,
+            user_id=user_id,
+            company=CompanyModel(id=company_id, supplier_id=supplier_id) if company_id else None,
+        )
+        if supplier_id
+        else None,
+    )
 
 
 async def authorization_refresh(
@@ -63,10 +173,64 @@ async def authorization(
     return await account(user_id=authorize.get_jwt_subject(), session=session)
 
 
+def authorization_loading(loader: str) -> Callable[..., Awaitable[UserModel]]:
+    """
+    `authorization` that loads only what the `loader` principal needs, taking id-only
+    principals from the role claims of the access token when it has them.
+    """
+
+    async def _authorization(
+        authorize: AuthJWT = Depends(),
+        session: AsyncSession = Depends(get_session),
+    ) -> UserModel:
+        authorize.jwt_required()
+
+        user_id = authorize.get_jwt_subject()
+        if loader in CLAIMED_LOADERS:
+            user = claimed_account(user_id=user_id, claims=authorize.get_raw_jwt())
+            if user:
+                return user
+
+        return await account(user_id=user_id, session=session, loader=loader)
+
+    return _authorization
+
+
 async def authorization_optional(
     authorize: AuthJWT = Depends(),
     session: AsyncSession = Depends(get_session),
 ) -> Optional[UserModel]:
     authorize.jwt_optional()
 
-    return await account(user_id=authorize.get_jwt_subject(), session=session)
+    user_id = authorize.get_jwt_subject()
+    if user_id is None:
+        return None
+
+    return await account(user_id=user_id, session=session)
+
+
+async def authorization_seller_id_optional(
+    authorize: AuthJWT = Depends(),
+    session: AsyncSession = Depends(get_session),
+) -> Optional[UserModel]:
+    """
+    `seller_id` principal of the caller for routes open to everyone. Callers without
+    a usable access token (missing, expired, invalid, without the CSRF header) and
+    callers whose account is gone are anonymous: `None`, never an error.
+    """
+
+    try:
+        authorize.jwt_optional()
+    except AuthJWTException:
+        return None
+
+    user_id = authorize.get_jwt_subject()
+    if user_id is None:
+        return None
+
+    try:
+        return claimed_account(user_id=user_id, claims=authorize.get_raw_jwt()) or (
+            await account(user_id=user_id, session=session, loader="seller_id")
+        )
+    except HTTPException:
+        return None
@@ -4,10 +4,10 @@ from starlette import status
 
 from orm import UserModel
 
-from .authorization import authorization
+from .authorization import authorization_loading
 
 
-async def admin(user: UserModel = Depends(authorization)) -> UserModel:
+async def admin(user: UserModel = Depends(authorization_loading("admin"))) -> UserModel:
     if not user.admin:
         raise HTTPException(
             detail="Admin not found",
@@ -17,7 +17,7 @@ async def admin(user: UserModel = Depends(authorization)) -> UserModel:
     return user
 
 
-async def seller(user: UserModel = Depends(authorization)) -> UserModel:
+async def seller(user: UserModel = Depends(authorization_loading("seller"))) -> UserModel:
     if not user.seller:
         raise HTTPException(
             detail="Seller not found",
@@ -27,7 +27,31 @@ async def seller(user: UserModel = Depends(authorization)) -> UserModel:
     return user
 
 
-async def supplier(user: UserModel = Depends(authorization)) -> UserModel:
+async def seller_id_only(
+    user: UserModel = Depends(authorization_loading("seller_id")),
+) -> UserModel:
+    if not user.seller:
+        raise HTTPException(
+            detail="Seller not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    return user
+
+
+async def supplier(user: UserModel = Depends(authorization_loading("supplier"))) -> UserModel:
+    if not user.supplier:
+        raise HTTPException(
+            detail="Supplier not found",
+            status_code=status.HTTP_404_NOT_FOUND,
+        )
+
+    return user
+
+
+async def supplier_id_only(
+    user: UserModel = Depends(authorization_loading("supplier_id")),
+) -> UserModel:
     if not user.supplier:
         raise HTTPException(
             detail="Supplier not found",
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+from fastapi.requests import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from orm.core import async_sessionmaker
 
+async def get_session(request: Request) -> AsyncSession:
+    # opened by `core.routing.TransactionRoute` for the whole request
+    return request.state.session  # type: ignore[no-any-return]
 
-async def get_session() -> AsyncSession:  # type: ignore[misc]
-    async with async_sessionmaker.begin() as session:
-        yield session
+
+async def get_read_only_session(request: Request) -> AsyncSession:
+    # the replica, unless the request is pinned to the primary
+    return request.state.read_only_session  # type: ignore[no-any-return]
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Coroutine, Final, TypeVar
+
+from fastapi.requests import Request
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.app import transaction
+from core.settings import database_settings
+from enums import Isolation
+
+EndpointT = TypeVar("EndpointT", bound=Callable[..., Any])
+
+PRIMARY_COOKIE: Final[str] = "read_primary_until"
+
+
+def isolation(level: Isolation, retry: bool = True) -> Callable[[EndpointT], EndpointT]:
+    """
+    Declare the isolation level of the endpoint transaction, placed under the route decorator.
+    Endpoints with side effects outside the database (S3 uploads, consumed request files)
+    pass `retry=False`, so that a serialization failure is raised instead of rerunning them.
+    """
+
+    def decorator(endpoint: EndpointT) -> EndpointT:
+        endpoint.__isolation__ = level  # type: ignore[attr-defined]
+        endpoint.__retry__ = retry  # type: ignore[attr-defined]
+        return endpoint
+
+    return decorator
+
+
+def reads_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def pin_primary(response: Response) -> None:
+    window = database_settings.DATABASE_REPLICA_LAG_WINDOW
+    response.set_cookie(
+        key=PRIMARY_COOKIE,
+        value=str(time.time() + window),
+        max_age=window,
+        httponly=True,
+    )
+
+
+class TransactionRoute(APIRoute):
+    """
+    Runs the endpoint together with its dependencies in one transaction, committed
+    before the response is sent and retried as a whole on serialization failures.
+    GET routes default to read-only deferrable transactions, other routes to
+    SERIALIZABLE; `isolation()` overrides the default and can disable the retry.
+
+    With a replica configured, `ReadOnlyDatabaseSession` reads from it, except for
+    `DATABASE_REPLICA_LAG_WINDOW` seconds after the client's last writing route,
+    so that clients see their own writes.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super(TransactionRoute, self).get_route_handler()
+        level = getattr(self.endpoint, "__isolation__", None) or (
+            Isolation.READ_ONLY if self.methods <= {"GET", "HEAD"} else Isolation.SERIALIZABLE
+        )
+        retries = None if getattr(self.endpoint, "__retry__", True) else 0
+        name = "%s %s" % (",".join(sorted(self.methods)), self.path)
+
+        async def route_handler(request: Request) -> Response:
+            async def work(session: AsyncSession) -> Response:
+                request.state.session = request.state.read_only_session = session
+                if transaction.replica is None or reads_primary(request=request):
+                    return await handler(request)
+
+                async with transaction.replica_session() as replica, replica.begin():
+                    request.state.read_only_session = replica
+                    return await handler(request)
+
+            response = await transaction.run(
+                work=work, isolation=level, name=name, retries=retries
+            )
+            if level is not Isolation.READ_ONLY and transaction.replica is not None:
+                pin_primary(response=response)
+
+            return response
+
+        return route_handler
@@ -1,10 +1,15 @@
-from .pwd_hashing import check_hashed_password, hash_password
+from .pwd_hashing import (
+    check_and_update_hashed_password,
+    check_hashed_password,
+    hash_password,
+)
 from .settings import Settings
 from .tokens import create_access_token, create_refresh_token
 
 __all__ = (
     "hash_password",
     "check_hashed_password",
+    "check_and_update_hashed_password",
     "Settings",
     "create_access_token",
     "create_refresh_token",
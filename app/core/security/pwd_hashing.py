@@ -1,13 +1,20 @@
 from __future__ import annotations
 
-from typing import cast
+from typing import Optional, Tuple, cast
 
 from passlib.context import CryptContext
 
+from core.settings import password_settings
+
+scheme = password_settings.PASSWORD_SCHEMES[0]
 pwd_context = CryptContext(
-    schemes=["pbkdf2_sha256"],
-    default="pbkdf2_sha256",
-    pbkdf2_sha256__default_rounds=30000,
+    schemes=password_settings.PASSWORD_SCHEMES,
+    default=scheme,
+    deprecated="auto",
+    **{
+        f"{scheme}__default_rounds": password_settings.PASSWORD_ROUNDS,
+        f"{scheme}__min_rounds": password_settings.PASSWORD_ROUNDS,
+    },
 )
 
 
@@ -17,3 +24,12 @@ def hash_password(password: str) -> str:
 
 def check_hashed_password(password: str, hashed: str) -> bool:
     return cast(bool, pwd_context.verify(password, hashed))
+
+
+def check_and_update_hashed_password(password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    """
+    Check the password like `check_hashed_password()` and also return a new hash of it
+    when `hashed` does not follow the scheme and rounds policy anymore.
+    """
+
+    return cast(Tuple[bool, Optional[str]], pwd_context.verify_and_update(password, hashed))
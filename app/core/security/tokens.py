@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-from typing import Union, cast
+from typing import Optional, Union, cast
 
 from fastapi_jwt_auth import AuthJWT
 
 from core.settings import jwt_settings
+from typing_ import DictStrAny
 
 
-def create_access_token(subject: Union[int, str], authorize: AuthJWT) -> str:
+def create_access_token(
+    subject: Union[int, str], authorize: AuthJWT, user_claims: Optional[DictStrAny] = None
+) -> str:
     return cast(
         str,
         authorize.create_access_token(
             subject=subject,
             expires_time=jwt_settings.ACCESS_TOKEN_EXPIRATION_TIME,
+            user_claims=user_claims or {},
         ),
     )
 
@@ -62,6 +62,20 @@ class DatabaseSettings(BaseSettings):
     DATABASE_HOSTNAME: str
     DATABASE_PORT: str
     DATABASE_NAME: str
+    DATABASE_REPLICA_HOSTNAME: Optional[str] = None
+    DATABASE_REPLICA_PORT: Optional[str] = None
+    DATABASE_REPLICA_LAG_WINDOW: int = 5
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_POOL_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    DATABASE_POOL_RECYCLE: int = 60 * 5
+    DATABASE_POOL_PRE_PING: bool = False
+    DATABASE_STATEMENT_CACHE_SIZE: int = 100
+    # PgBouncer in transaction pooling mode: no named prepared statements are reused
+    DATABASE_PGBOUNCER: bool = False
+    TRANSACTION_RETRIES: int = 3
+    TRANSACTION_RETRY_BACKOFF: float = 0.05
+    TRANSACTION_RETRY_BACKOFF_MAX: float = 1.0
 
     @property
     def url(self) -> str:
@@ -76,6 +90,22 @@ class DatabaseSettings(BaseSettings):
 
         return f"{driver}://{user}:{password}@{host}:{port}/{name}"
 
+    @property
+    def replica_url(self) -> Optional[str]:
+        if not self.DATABASE_REPLICA_HOSTNAME:
+            return None
+
+        driver, user, password, host, port, name = (
+            self.DATABASE_DRIVER,
+            self.DATABASE_USERNAME,
+            self.DATABASE_PASSWORD,
+            self.DATABASE_REPLICA_HOSTNAME,
+            self.DATABASE_REPLICA_PORT or self.DATABASE_PORT,
+            self.DATABASE_NAME,
+        )
+
+        return f"{driver}://{user}:{password}@{host}:{port}/{name}"
+
 
 database_settings = DatabaseSettings()
 
@@ -89,11 +119,25 @@ class JWTSettings(BaseSettings):
     COOKIE_SAMESITE: str
     COOKIE_DOMAIN: Optional[str] = None
     JWT_SECRET_KEY: str
+    # put role flags and ids of the user into access tokens, see `core.depends.authorization`
+    ROLE_CLAIMS: bool = False
 
 
 jwt_settings = JWTSettings()
 
 
+class PasswordSettings(BaseSettings):
+    # new hashes use the first scheme, hashes of the others are rehashed on login
+    PASSWORD_SCHEMES: List[str] = Field(default_factory=lambda: ["pbkdf2_sha256"])
+    # rounds of the first scheme, hashes with fewer are rehashed on login
+    PASSWORD_ROUNDS: int = 30000
+    PASSWORD_HASHING_WORKERS: int = 2
+    PASSWORD_HASHING_QUEUE_SIZE: int = 64
+
+
+password_settings = PasswordSettings()
+
+
 class CORSSettings(BaseSettings):
     ALLOW_ORIGINS: List[str] = Field(default_factory=list)
     ALLOW_CREDENTIALS: bool
@@ -154,3 +198,22 @@ class GoogleSettings(BaseSettings):
 
 
 google_settings = GoogleSettings()
+
+
+class CacheSettings(BaseSettings):
+    CATEGORY_TREE_TTL: int = 300
+    FAVORITES_CACHE_SIZE: int = 10000
+    FAVORITES_CACHE_TTL: int = 60
+    PRINCIPAL_CACHE_SIZE: int = 10000
+    PRINCIPAL_CACHE_TTL: int = 30
+    PRODUCT_CACHE_SIZE: int = 10000
+    PRODUCT_PRICES_REFRESH_INTERVAL: int = 60
+    PRODUCT_RANKINGS_REFRESH_INTERVAL: int = 900
+    PRODUCT_RANKINGS_SIZE: int = 100
+    REVOCATIONS_REFRESH_INTERVAL: int = 10
+    SUGGESTIONS_REFRESH_INTERVAL: int = 30
+    SUGGESTIONS_REBUILD_INTERVAL: int = 3600
+    SUGGESTIONS_MIN_SEARCHES: int = 2
+
+
+cache_settings = CacheSettings()
@@ -1,7 +1,10 @@
 from .category_property_type import CategoryPropertyTypeEnum
 from .category_variation_type import CategoryVariationTypeEnum
 from .currency import CurrencyEnum
+from .facet_type import FacetType
+from .isolation import Isolation
 from .order_status import OrderStatus
+from .ranking_type import RankingType
 from .sort_type import SortType
 from .user_type import UserType
 
@@ -9,7 +12,10 @@ __all__ = (
     "CategoryPropertyTypeEnum",
     "CategoryVariationTypeEnum",
     "CurrencyEnum",
+    "FacetType",
+    "Isolation",
     "OrderStatus",
+    "RankingType",
     "UserType",
     "SortType",
 )
@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class FacetType(str, Enum):
+    PROPERTY = "property"
+    VARIATION = "variation"
+    PRICE = "price"
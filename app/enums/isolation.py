@@ -0,0 +1,8 @@
+from enum import Enum
+
+
+class Isolation(str, Enum):
+    READ_ONLY = "read_only"
+    READ_COMMITTED = "read_committed"
+    REPEATABLE_READ = "repeatable_read"
+    SERIALIZABLE = "serializable"
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class RankingType(str, Enum):
+    POPULAR = "popular"
+    SIMILAR = "similar"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import Any, ClassVar
 
-from orm import ProductModel, ProductPriceModel
+from orm import ProductListingModel
 from typing_ import DictStrAny
 
 
@@ -15,11 +15,11 @@ class SortType(Enum):
     TOTAL_ORDERS = "total_orders"
 
     __table__: ClassVar[DictStrAny] = {
-        ID: ProductModel.id,
-        RATING: ProductModel.grade_average,
-        PRICE: ProductPriceModel.value,
-        DATE: ProductModel.datetime,
-        TOTAL_ORDERS: ProductModel.total_orders,
+        ID: ProductListingModel.id,
+        RATING: ProductListingModel.grade_average,
+        PRICE: ProductListingModel.price_value,
+        DATE: ProductListingModel.datetime,
+        TOTAL_ORDERS: ProductListingModel.total_orders,
     }
 
     @property
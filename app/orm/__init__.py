@@ -1,5 +1,6 @@
 from .admin import AdminModel
 from .category import CategoryModel
+from .category_facet import CategoryFacetModel
 from .category_property import CategoryPropertyModel
 from .category_property_type import CategoryPropertyTypeModel
 from .category_property_value import CategoryPropertyValueModel
@@ -16,11 +17,14 @@ from .order_product_variation import OrderProductVariationModel
 from .order_status import OrderStatusModel
 from .product import ProductModel
 from .product_image import ProductImageModel
+from .product_listing import ProductListingModel
 from .product_price import ProductPriceModel
 from .product_property_value import ProductPropertyValueModel
+from .product_ranking import ProductRankingModel
 from .product_review import ProductReviewModel
 from .product_review_photo import ProductReviewPhotoModel
 from .product_review_reaction import ProductReviewReactionModel
+from .product_review_stats import ProductReviewStatsModel
 from .product_variation_count import ProductVariationCountModel
 from .product_variation_value import ProductVariationValueModel
 from .reset_token import ResetTokenModel
@@ -39,6 +43,7 @@ from .user_search import UserSearchModel
 __all__ = (
     "AdminModel",
     "CategoryModel",
+    "CategoryFacetModel",
     "CategoryPropertyModel",
     "CategoryPropertyTypeModel",
     "CategoryPropertyValueModel",
@@ -55,11 +60,14 @@ __all__ = (
     "OrderStatusModel",
     "ProductModel",
     "ProductImageModel",
+    "ProductListingModel",
     "ProductPriceModel",
+    "ProductRankingModel",
     "ProductPropertyValueModel",
     "ProductReviewModel",
     "ProductReviewPhotoModel",
     "ProductReviewReactionModel",
+    "ProductReviewStatsModel",
     "ProductVariationCountModel",
     "ProductVariationValueModel",
     "ResetTokenModel",
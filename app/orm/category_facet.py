@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .core import ORMModel, category_id_fk, str_20
+
+
+class CategoryFacetModel(ORMModel):
+    __table_args__ = (UniqueConstraint("category_id", "facet", "value_id"),)
+
+    category_id: Mapped[category_id_fk]
+    facet: Mapped[str_20]
+    value_id: Mapped[int]
+    count: Mapped[int] = mapped_column(default=0)
@@ -1,7 +1,8 @@
 from . import mixins
 from .model import ORMModel
-from .session import async_sessionmaker, engine
+from .session import async_sessionmaker, engine, replica_engine
 from .types import (
+    bigint_array,
     bool_false,
     bool_true,
     category_id_fk,
@@ -45,6 +46,7 @@ __all__ = (
     "ORMModel",
     "mixins",
     "async_sessionmaker",
+    "bigint_array",
     "bool_false",
     "bool_true",
     "category_id_fk",
@@ -83,4 +85,5 @@ __all__ = (
     "moscow_datetime_timezone",
     "user_id_fk",
     "engine",
+    "replica_engine",
 )
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from typing_ import DictStrAny
+
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """
+    Queue pool that counts checkouts, the time spent getting a connection
+    (waiting for a free one or opening a new one), the checkout peak and timeouts.
+    The counters belong to the worker process.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super(InstrumentedPool, self).__init__(*args, **kwargs)
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak = 0
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            connection = super(InstrumentedPool, self)._do_get()
+        except TimeoutError:
+            self.timeouts += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.wait_total += elapsed
+            self.wait_max = max(self.wait_max, elapsed)
+
+        self.checkouts += 1
+        self.peak = max(self.peak, self.checkedout())
+        return connection
+
+    def stats(self) -> DictStrAny:
+        return {
+            "pid": os.getpid(),
+            "size": self.size(),
+            "checked_in": self.checkedin(),
+            "checked_out": self.checkedout(),
+            "overflow": max(self.overflow(), 0),
+            "peak": self.peak,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_total": round(self.wait_total, 6),
+            "wait_max": round(self.wait_max, 6),
+        }
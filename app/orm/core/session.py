@@ -2,20 +2,53 @@
 
 from __future__ import annotations
 
-from typing import Final
+import uuid
+from typing import Any, Optional
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from core.settings import database_settings, fastapi_uvicorn_settings
+from typing_ import DictStrAny
 
-POOL_RECYCLE: Final[int] = 60 * 5  # 300
+from .pool import InstrumentedPool
 
-engine = create_async_engine(
-    database_settings.url,
-    pool_recycle=POOL_RECYCLE,
-    isolation_level="SERIALIZABLE",
-    echo=fastapi_uvicorn_settings.DEBUG,
+
+def prepared_statement_name() -> str:
+    return f"__asyncpg_{uuid.uuid4()}__"
+
+
+def create_engine(url: str, **kwargs: Any) -> AsyncEngine:
+    connect_args: DictStrAny = {
+        "statement_cache_size": database_settings.DATABASE_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": database_settings.DATABASE_STATEMENT_CACHE_SIZE,
+    }
+    if database_settings.DATABASE_PGBOUNCER:
+        # statements prepared on one server connection must not be looked up on another
+        connect_args = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": prepared_statement_name,
+        }
+
+    return create_async_engine(
+        url,
+        poolclass=InstrumentedPool,
+        pool_size=database_settings.DATABASE_POOL_SIZE,
+        max_overflow=database_settings.DATABASE_POOL_MAX_OVERFLOW,
+        pool_timeout=database_settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=database_settings.DATABASE_POOL_RECYCLE,
+        pool_pre_ping=database_settings.DATABASE_POOL_PRE_PING,
+        connect_args=connect_args,
+        echo=fastapi_uvicorn_settings.DEBUG,
+        **kwargs,
+    )
+
+
+engine = create_engine(database_settings.url, isolation_level="SERIALIZABLE")
+# hot standby for read-only routes, see `core.routing.TransactionRoute`
+replica_engine: Optional[AsyncEngine] = (
+    create_engine(database_settings.replica_url) if database_settings.replica_url else None
 )
 async_sessionmaker = sessionmaker(  # type: ignore[call-overload]
     bind=engine,
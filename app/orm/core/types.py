@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import List
 
 import pytz
 from sqlalchemy import ForeignKey
 from sqlalchemy import text as t
 from sqlalchemy import types
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.orm import mapped_column
 from typing_extensions import Annotated
 
 __all__ = (
+    "bigint_array",
     "bool_false",
     "bool_true",
     "category_id_fk",
@@ -49,6 +52,9 @@ __all__ = (
     "user_id_fk",
 )
 
+bigint_array = Annotated[
+    List[int], mapped_column(ARRAY(types.BIGINT), nullable=False, server_default=t("'{}'"))
+]
 bool_false = Annotated[bool, mapped_column(types.Boolean, default=False, nullable=True)]
 bool_true = Annotated[bool, mapped_column(types.Boolean, default=True, nullable=True)]
 datetime_timezone = Annotated[datetime, mapped_column(types.DateTime(timezone=True))]
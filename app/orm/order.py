@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 
 from .core import ORMModel, bool_true, mixins
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class OrderModel(mixins.TimestampMixin, mixins.SellerIDMixin, mixins.StatusIDMixin, ORMModel):
+    __table_args__ = (Index("ix_order_seller_id_is_cart", "seller_id", "is_cart"),)
+
     is_cart: Mapped[bool_true]
 
     status: Mapped[Optional[OrderStatusModel]] = relationship(back_populates="orders")
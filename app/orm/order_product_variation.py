@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped
 
 from .core import ORMModel, mixins, product_variation_count_fk
 
 
 class OrderProductVariationModel(mixins.OrderIDMixin, mixins.StatusIDMixin, ORMModel):
+    __table_args__ = (Index("ix_order_product_variation_order_id", "order_id"),)
+
     count: Mapped[int]
 
     product_variation_count_id: Mapped[product_variation_count_fk]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Optional
 from uuid import UUID, uuid4
 
+from sqlalchemy import Computed, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from .core import (
@@ -28,6 +30,16 @@ if TYPE_CHECKING:
 
 
 class ProductModel(mixins.CategoryIDMixin, mixins.SupplierIDMixin, ORMModel):
+    __table_args__ = (
+        Index("ix_product_search_vector", "search_vector", postgresql_using="gin"),
+        Index(
+            "ix_product_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     name: Mapped[str_200]
     description: Mapped[Optional[text]]
     datetime: Mapped[moscow_datetime_timezone]
@@ -35,6 +47,16 @@ class ProductModel(mixins.CategoryIDMixin, mixins.SupplierIDMixin, ORMModel):
     total_orders: Mapped[int] = mapped_column(default=0)
     uuid: Mapped[UUID] = mapped_column(default=uuid4)
     is_active: Mapped[bool_true]
+    version: Mapped[int] = mapped_column(default=0)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+            "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     category: Mapped[Optional[CategoryModel]] = relationship(back_populates="products")
     supplier: Mapped[Optional[SupplierModel]] = relationship(back_populates="products")
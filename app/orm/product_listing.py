@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from sqlalchemy import ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .core import (
+    ORMModel,
+    bigint_array,
+    datetime_timezone,
+    decimal_2_1,
+    decimal_3_2,
+    decimal_10_2,
+    moscow_datetime_timezone,
+    str_200,
+    text,
+)
+
+
+class ProductListingModel(ORMModel):
+    __table_args__ = (
+        Index("ix_product_listing_category_id", "category_id"),
+        Index("ix_product_listing_supplier_id", "supplier_id"),
+        Index("ix_product_listing_grade_average_id", "grade_average", "id"),
+        Index("ix_product_listing_price_value_id", "price_value", "id"),
+        Index("ix_product_listing_datetime_id", "datetime", "id"),
+        Index("ix_product_listing_total_orders_id", "total_orders", "id"),
+        Index("ix_product_listing_price_expires_at", "price_expires_at"),
+        Index(
+            "ix_product_listing_property_value_ids",
+            "property_value_ids",
+            postgresql_using="gin",
+        ),
+        Index(
+            "ix_product_listing_variation_value_ids",
+            "variation_value_ids",
+            postgresql_using="gin",
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(ForeignKey("product.id"), primary_key=True)
+    category_id: Mapped[int]
+    supplier_id: Mapped[int]
+    name: Mapped[str_200]
+    datetime: Mapped[moscow_datetime_timezone]
+    grade_average: Mapped[decimal_2_1] = mapped_column(default=0.0)
+    total_orders: Mapped[int] = mapped_column(default=0)
+    review_count: Mapped[int] = mapped_column(default=0)
+    price_value: Mapped[Optional[decimal_10_2]]
+    discount: Mapped[Optional[decimal_3_2]]
+    discounted_price: Mapped[Optional[decimal_10_2]]
+    min_quantity: Mapped[Optional[int]]
+    price_expires_at: Mapped[Optional[datetime_timezone]]
+    image_url: Mapped[Optional[text]]
+    supplier_name: Mapped[Optional[text]]
+    property_value_ids: Mapped[bigint_array]
+    variation_value_ids: Mapped[bigint_array]
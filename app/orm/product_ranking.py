@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from sqlalchemy import Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .core import ORMModel, category_id_fk, datetime_timezone, product_id_fk, str_20
+
+
+class ProductRankingModel(ORMModel):
+    __table_args__ = (
+        Index(
+            "ix_product_ranking_ranking_category_id_position",
+            "ranking",
+            "category_id",
+            "position",
+            unique=True,
+        ),
+    )
+
+    ranking: Mapped[str_20]
+    category_id: Mapped[category_id_fk]
+    position: Mapped[int]
+    product_id: Mapped[product_id_fk]
+    score: Mapped[float]
+    ranked_at: Mapped[datetime_timezone] = mapped_column(default=func.now())
@@ -3,7 +3,8 @@ from __future__ import annotations
 import datetime as dt
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy.orm import Mapped, relationship
+from sqlalchemy import Index, func
+from sqlalchemy.orm import Mapped, mapped_column, query_expression, relationship
 
 from .core import ORMModel, mixins
 from .core import text as t
@@ -15,9 +16,15 @@ if TYPE_CHECKING:
 
 
 class ProductReviewModel(mixins.ProductIDMixin, mixins.SellerIDMixin, ORMModel):
+    __table_args__ = (
+        Index("ix_product_review_product_id_datetime_id", "product_id", "datetime", "id"),
+    )
+
     text: Mapped[t]
     grade_overall: Mapped[int]
-    datetime: Mapped[dt.datetime]
+    datetime: Mapped[dt.datetime] = mapped_column(default=func.now())
+    likes: Mapped[Optional[int]] = query_expression()
+    dislikes: Mapped[Optional[int]] = query_expression()
 
     product: Mapped[Optional[ProductModel]] = relationship(back_populates="reviews")
     photos: Mapped[List[ProductReviewPhotoModel]] = relationship(back_populates="review")
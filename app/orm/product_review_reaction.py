@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index
 from sqlalchemy.orm import Mapped, relationship
 
 from .core import ORMModel, mixins
@@ -12,6 +13,8 @@ if TYPE_CHECKING:
 
 
 class ProductReviewReactionModel(mixins.ProductReviewIDMixin, mixins.SellerIDMixin, ORMModel):
+    __table_args__ = (Index("ix_product_review_reaction_product_review_id", "product_review_id"),)
+
     reaction: Mapped[bool]
 
     review: Mapped[Optional[ProductReviewModel]] = relationship(back_populates="reactions")
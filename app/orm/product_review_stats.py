@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from sqlalchemy import UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .core import ORMModel, mixins
+
+
+class ProductReviewStatsModel(mixins.ProductIDMixin, ORMModel):
+    __table_args__ = (UniqueConstraint("product_id"),)
+
+    review_count: Mapped[int] = mapped_column(default=0)
+    grade_sum: Mapped[int] = mapped_column(default=0)
+    grade_1: Mapped[int] = mapped_column(default=0)
+    grade_2: Mapped[int] = mapped_column(default=0)
+    grade_3: Mapped[int] = mapped_column(default=0)
+    grade_4: Mapped[int] = mapped_column(default=0)
+    grade_5: Mapped[int] = mapped_column(default=0)
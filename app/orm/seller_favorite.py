@@ -1,5 +1,14 @@
-from .core import ORMModel, mixins
+from __future__ import annotations
+
+from sqlalchemy import Index, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .core import ORMModel, datetime_timezone, mixins
 
 
 class SellerFavoriteModel(mixins.SellerIDMixin, mixins.ProductIDMixin, ORMModel):
-    ...
+    __table_args__ = (
+        Index("ix_seller_favorite_seller_id_datetime_id", "seller_id", "datetime", "id"),
+    )
+
+    datetime: Mapped[datetime_timezone] = mapped_column(default=func.now())
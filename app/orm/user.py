@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
+from sqlalchemy import Index, text
 from sqlalchemy.orm import Mapped, relationship
 
 from .core import ORMModel, bool_false, mixins
@@ -17,6 +18,8 @@ if TYPE_CHECKING:
 class UserModel(
     mixins.EmailMixin, mixins.NameMixin, mixins.PhoneMixin, mixins.TimestampMixin, ORMModel
 ):
+    __table_args__ = (Index("ix_user_deleted", "id", postgresql_where=text("is_deleted")),)
+
     is_verified: Mapped[bool_false]
     is_deleted: Mapped[bool_false]
     is_supplier: Mapped[bool_false]
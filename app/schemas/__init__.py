@@ -20,6 +20,7 @@ from .orm import (
     ORMSchema,
     Product,
     ProductImage,
+    ProductListing,
     ProductPrice,
     ProductReview,
     ProductReviewPhoto,
@@ -38,6 +39,7 @@ from .orm import (
     UserSearch,
 )
 from .requests import (
+    BodyCartLineRequest,
     BodyChangeEmailRequest,
     BodyChangePasswordRequest,
     BodyCompanyDataRequest,
@@ -46,9 +48,11 @@ from .requests import (
     BodyCompanyPhoneDataUpdateRequest,
     BodyLoginRequest,
     BodyOrderStatusRequest,
+    BodyProductBatchRequest,
     BodyProductCompilationRequest,
     BodyProductPaginationRequest,
     BodyProductReviewRequest,
+    BodyProductSearchRequest,
     BodyProductUploadRequest,
     BodyRegisterRequest,
     BodyResetPasswordRequest,
@@ -60,6 +64,7 @@ from .requests import (
     BodySupplierNotificationUpdateRequest,
     BodyUserDataRequest,
     BodyUserDataUpdateRequest,
+    QueryCursorPaginationRequest,
     QueryMyEmailRequest,
     QueryPaginationRequest,
     QueryTokenConfirmationRequest,
@@ -71,6 +76,7 @@ __all__ = (
     "ApplicationResponse",
     "ApplicationSchema",
     "ApplicationORMSchema",
+    "BodyCartLineRequest",
     "BodyChangeEmailRequest",
     "BodyChangePasswordRequest",
     "BodyCompanyDataRequest",
@@ -79,7 +85,9 @@ __all__ = (
     "BodyCompanyPhoneDataUpdateRequest",
     "BodyLoginRequest",
     "BodyOrderStatusRequest",
+    "BodyProductBatchRequest",
     "BodyProductReviewRequest",
+    "BodyProductSearchRequest",
     "BodyProductCompilationRequest",
     "BodyProductUploadRequest",
     "BodyProductPaginationRequest",
@@ -111,12 +119,14 @@ __all__ = (
     "OrderStatus",
     "Product",
     "ProductImage",
+    "ProductListing",
     "ProductPrice",
     "ProductReview",
     "ProductVariationValue",
     "ProductReviewPhoto",
     "ProductReviewReaction",
     "ProductVariationCount",
+    "QueryCursorPaginationRequest",
     "QueryMyEmailRequest",
     "QueryPaginationRequest",
     "QueryTokenConfirmationRequest",
@@ -17,6 +17,7 @@ from .order_product_variation import OrderProductVariation
 from .order_status import OrderStatus
 from .product import Product
 from .product_image import ProductImage
+from .product_listing import ProductListing
 from .product_price import ProductPrice
 from .product_review import ProductReview
 from .product_review_photo import ProductReviewPhoto
@@ -54,6 +55,7 @@ __all__ = (
     "OrderStatus",
     "Product",
     "ProductImage",
+    "ProductListing",
     "ProductPrice",
     "ProductReview",
     "ProductReviewPhoto",
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import datetime as dt
+from typing import Optional
+
+from .core import ORMSchema
+
+
+class ProductListing(ORMSchema):
+    category_id: int
+    supplier_id: int
+    name: str
+    datetime: dt.datetime
+    grade_average: float = 0.0
+    total_orders: int = 0
+    review_count: int = 0
+    price_value: Optional[float] = None
+    discount: Optional[float] = None
+    discounted_price: Optional[float] = None
+    min_quantity: Optional[int] = None
+    image_url: Optional[str] = None
+    supplier_name: Optional[str] = None
+    is_favorite: Optional[bool] = None
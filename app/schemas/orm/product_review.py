@@ -15,6 +15,8 @@ class ProductReview(ORMSchema):
     text: str
     grade_overall: int
     datetime: dt.datetime
+    likes: Optional[int] = None
+    dislikes: Optional[int] = None
     product: Optional[Product] = None
     photos: Optional[List[ProductReviewPhoto]] = None
     reactions: Optional[List[ProductReviewReaction]] = None
@@ -1,3 +1,4 @@
+from .bodies import BodyCartLine as BodyCartLineRequest
 from .bodies import BodyChangeEmail as BodyChangeEmailRequest
 from .bodies import BodyChangePassword as BodyChangePasswordRequest
 from .bodies import BodyCompanyData as BodyCompanyDataRequest
@@ -6,10 +7,12 @@ from .bodies import BodyCompanyImageData as BodyCompanyImageDataRequest
 from .bodies import BodyCompanyPhoneDataUpdate as BodyCompanyPhoneDataUpdateRequest
 from .bodies import BodyLogin as BodyLoginRequest
 from .bodies import BodyOrderStatus as BodyOrderStatusRequest
+from .bodies import BodyProductBatch as BodyProductBatchRequest
 from .bodies import BodyProductCompilation as BodyProductCompilationRequest
 from .bodies import BodyProductPagination as BodyProductPaginationRequest
 from .bodies import BodyProductPriceUpload as BodyProductPriceUploadRequest
 from .bodies import BodyProductReview as BodyProductReviewRequest
+from .bodies import BodyProductSearch as BodyProductSearchRequest
 from .bodies import BodyProductUpload as BodyProductUploadRequest
 from .bodies import BodyRegister as BodyRegisterRequest
 from .bodies import BodyResetPassword as BodyResetPasswordRequest
@@ -23,11 +26,13 @@ from .bodies import (
 )
 from .bodies import BodyUserData as BodyUserDataRequest
 from .bodies import BodyUserDataUpdate as BodyUserDataUpdateRequest
+from .queries import QueryCursorPagination as QueryCursorPaginationRequest
 from .queries import QueryMyEmail as QueryMyEmailRequest
 from .queries import QueryPagination as QueryPaginationRequest
 from .queries import QueryTokenConfirmation as QueryTokenConfirmationRequest
 
 __all__ = (
+    "BodyCartLineRequest",
     "BodyChangeEmailRequest",
     "BodyChangePasswordRequest",
     "BodyCompanyDataRequest",
@@ -36,11 +41,13 @@ __all__ = (
     "BodyCompanyPhoneDataUpdateRequest",
     "BodyLoginRequest",
     "BodyOrderStatusRequest",
+    "BodyProductBatchRequest",
     "BodyProductCompilationRequest",
     "BodyProductUploadRequest",
     "BodyProductPaginationRequest",
     "BodyProductPriceUploadRequest",
     "BodyProductReviewRequest",
+    "BodyProductSearchRequest",
     "BodyRegisterRequest",
     "BodyResetPasswordRequest",
     "BodySellerAddressRequest",
@@ -51,6 +58,7 @@ __all__ = (
     "BodySupplierNotificationUpdateRequest",
     "BodyUserDataRequest",
     "BodyUserDataUpdateRequest",
+    "QueryCursorPaginationRequest",
     "QueryMyEmailRequest",
     "QueryPaginationRequest",
     "QueryTokenConfirmationRequest",
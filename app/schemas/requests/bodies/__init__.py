@@ -1,3 +1,4 @@
+from .cart_line import CartLine as BodyCartLine
 from .change_email import ChangeEmail as BodyChangeEmail
 from .change_password import ChangePassword as BodyChangePassword
 from .company_data import CompanyData as BodyCompanyData
@@ -9,10 +10,12 @@ from .company_phone_data_update import (
 from .login import Login as BodyLogin
 from .order_status_id import OrderStatus as BodyOrderStatus
 from .product import ProductUpload as BodyProductUpload
+from .product_batch import ProductBatch as BodyProductBatch
 from .product_compilation import ProductCompilation as BodyProductCompilation
 from .product_pagination import ProductPagination as BodyProductPagination
 from .product_price import ProductPriceUpload as BodyProductPriceUpload
 from .product_review import ProductReview as BodyProductReview
+from .product_search import ProductSearch as BodyProductSearch
 from .register import Register as BodyRegister
 from .reset_password import ResetPassword as BodyResetPassword
 from .seller_address import SellerAddress as BodySellerAddress
@@ -29,6 +32,7 @@ from .user_data import UserData as BodyUserData
 from .user_data_update import UserDataUpdate as BodyUserDataUpdate
 
 __all__ = (
+    "BodyCartLine",
     "BodyChangeEmail",
     "BodyChangePassword",
     "BodyCompanyData",
@@ -38,10 +42,12 @@ __all__ = (
     "BodyLogin",
     "BodyLogin",
     "BodyOrderStatus",
+    "BodyProductBatch",
     "BodyProductCompilation",
     "BodyProductUpload",
     "BodyProductPagination",
     "BodyProductReview",
+    "BodyProductSearch",
     "BodyProductPriceUpload",
     "BodyRegister",
     "BodyResetPassword",
@@ -0,0 +1,8 @@
+from pydantic import Field
+
+from ...schema import ApplicationSchema
+
+
+class CartLine(ApplicationSchema):
+    product_variation_count_id: int
+    count: int = Field(..., ge=1)
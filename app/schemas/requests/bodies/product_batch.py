@@ -0,0 +1,9 @@
+from typing import List
+
+from pydantic import Field
+
+from ...schema import ApplicationSchema
+
+
+class ProductBatch(ApplicationSchema):
+    product_ids: List[int] = Field(..., min_items=1, max_items=300)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from pydantic import HttpUrl
+from pydantic import Field, HttpUrl
 
 from ...schema import ApplicationSchema
 
@@ -10,4 +10,4 @@ from ...schema import ApplicationSchema
 class ProductReview(ApplicationSchema):
     product_review_photo: Optional[List[HttpUrl]] = None
     product_review_text: str
-    product_review_grade: float
+    product_review_grade: int = Field(..., ge=1, le=5)
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import Field
+
+from enums import SortType
+
+from .product_pagination import ProductPagination
+
+
+class ProductSearch(ProductPagination):
+    query: str = Field(..., min_length=1, max_length=200)
+    # products are ranked by relevance unless a sort type is given
+    sort_type: Optional[SortType] = None  # type: ignore[assignment]
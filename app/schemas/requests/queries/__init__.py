@@ -1,8 +1,10 @@
+from .cursor_pagination import CursorPagination as QueryCursorPagination
 from .my_email import MyEmail as QueryMyEmail
 from .pagination import Pagination as QueryPagination
 from .token_confirmation import TokenConfirmation as QueryTokenConfirmation
 
 __all__ = (
+    "QueryCursorPagination",
     "QueryMyEmail",
     "QueryPagination",
     "QueryTokenConfirmation",
@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+from typing import Optional
+
+from .pagination import Pagination
+
+
+class CursorPagination(Pagination):
+    cursor: Optional[str] = None
@@ -1,10 +1,11 @@
-from typing import Union
+from typing import Optional, Union
 
 from fastapi.responses import Response
 from fastapi_jwt_auth import AuthJWT
 
 from core.security import create_access_token, create_refresh_token
 from core.settings import jwt_settings
+from typing_ import DictStrAny
 
 
 def unset_jwt_cookies(response: Response, authorize: AuthJWT) -> None:
@@ -12,10 +13,13 @@ def unset_jwt_cookies(response: Response, authorize: AuthJWT) -> None:
 
 
 def set_and_create_tokens_cookies(
-    response: Response, authorize: AuthJWT, subject: Union[int, str]
+    response: Response,
+    authorize: AuthJWT,
+    subject: Union[int, str],
+    claims: Optional[DictStrAny] = None,
 ) -> None:
     access_token, refresh_token = (
-        create_access_token(subject=subject, authorize=authorize),
+        create_access_token(subject=subject, authorize=authorize, user_claims=claims),
         create_refresh_token(subject=subject, authorize=authorize),
     )
 
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import datetime as dt
+import json
+from typing import Any, List, Optional, Sequence
+
+from fastapi.exceptions import HTTPException
+from pydantic import ValidationError, parse_obj_as
+from sqlalchemy import literal, tuple_
+from starlette import status
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, (dt.datetime, dt.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def encode_cursor(*values: Any) -> str:
+    dumped = json.dumps(values, default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(dumped.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        values = None
+    if not isinstance(values, list):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    return values
+
+
+def keyset(
+    columns: Sequence[Any],
+    cursor: Optional[str],
+    ascending: bool,
+    prefix: Sequence[Any] = (),
+) -> Any:
+    """
+    Build a row comparison that selects rows placed after the cursor for the
+    ordering `columns` (all ascending or all descending). `prefix` is compared
+    with the head of the cursor, e.g. to reject a cursor issued for another sort type.
+    """
+
+    if not cursor:
+        return True
+
+    values = decode_cursor(cursor=cursor)
+    if len(values) != len(prefix) + len(columns) or list(prefix) != values[: len(prefix)]:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    try:
+        bound = [
+            literal(parse_obj_as(column.type.python_type, value), type_=column.type)
+            for column, value in zip(columns, values[len(prefix) :])
+        ]
+    except (ValidationError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+    if ascending:
+        return tuple_(*columns) > tuple_(*bound)
+    return tuple_(*columns) < tuple_(*bound)
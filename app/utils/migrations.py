@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from sqlalchemy import text
+
 from orm.core import ORMModel, engine
 
 
@@ -7,5 +9,6 @@ async def migrations() -> None:
     engine.echo = False
 
     async with engine.begin() as connection:
+        await connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await connection.run_sync(ORMModel.metadata.drop_all)
         await connection.run_sync(ORMModel.metadata.create_all)
@@ -1,10 +1,24 @@
+from core.app import (
+    category_tree,
+    product_listing,
+    product_ranking,
+    product_review_stats,
+)
+from orm.core import async_sessionmaker
+
 from .csv_loader import csv_loader
 from .generator import generator
 
 
 async def setup() -> None:
     await csv_loader.setup()
+    category_tree.invalidate()
     await generator.setup()
 
+    async with async_sessionmaker.begin() as session:
+        await product_review_stats.repair(session=session)
+        await product_listing.rebuild(session=session)
+        await product_ranking.rebuild(session=session)
+
 
 __all__ = ("setup",)
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi.exceptions import HTTPException
+from starlette import status
+
+from core.app import passwords
+from core.settings import password_settings
+
+
+async def test_passwords_queue_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(password_settings, "PASSWORD_HASHING_WORKERS", 1)
+    monkeypatch.setattr(password_settings, "PASSWORD_HASHING_QUEUE_SIZE", 1)
+    rejected = passwords.rejected
+
+    results = await asyncio.gather(
+        *(passwords.hash(password="Password1!") for _ in range(3)), return_exceptions=True
+    )
+
+    assert [isinstance(result, str) for result in results] == [True, True, False]
+    assert isinstance(results[2], HTTPException)
+    assert results[2].status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+    assert passwords.rejected == rejected + 1
+    assert passwords.stats()["peak"] >= 1
+    assert passwords.stats()["waiting"] == 0
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.app import transaction
+from core.settings import database_settings
+from enums import Isolation
+
+SERIALIZATION_FAILURE = text(
+    "DO $$ BEGIN RAISE EXCEPTION 'conflict' USING ERRCODE = 'serialization_failure'; END $$"
+)
+
+
+async def test_transaction_retries_serialization_failures() -> None:
+    attempts = []
+
+    async def work(session: AsyncSession) -> int:
+        attempts.append(session)
+        if len(attempts) < 3:
+            await session.execute(SERIALIZATION_FAILURE)
+        return len(attempts)
+
+    assert await transaction.run(work=work, isolation=Isolation.SERIALIZABLE, name="retried") == 3
+    assert transaction.retries["retried"] == 2
+
+
+async def test_transaction_retries_exhausted() -> None:
+    async def work(session: AsyncSession) -> None:
+        await session.execute(SERIALIZATION_FAILURE)
+
+    with pytest.raises(DBAPIError):
+        await transaction.run(work=work, isolation=Isolation.SERIALIZABLE, name="exhausted")
+
+    assert transaction.retries["exhausted"] == database_settings.TRANSACTION_RETRIES
+    assert transaction.exhausted["exhausted"] == 1
+
+
+async def test_transaction_without_retries() -> None:
+    attempts = []
+
+    async def work(session: AsyncSession) -> None:
+        attempts.append(session)
+        await session.execute(SERIALIZATION_FAILURE)
+
+    with pytest.raises(DBAPIError):
+        await transaction.run(
+            work=work, isolation=Isolation.SERIALIZABLE, name="not_retried", retries=0
+        )
+
+    assert len(attempts) == 1
+    assert not transaction.retries["not_retried"]
+    assert transaction.exhausted["not_retried"] == 1
+
+
+async def test_transaction_read_only() -> None:
+    async def work(session: AsyncSession) -> None:
+        await session.execute(text("CREATE TEMPORARY TABLE read_only (id int)"))
+
+    with pytest.raises(DBAPIError, match="read-only transaction"):
+        await transaction.run(work=work, isolation=Isolation.READ_ONLY, name="read_only")
+
+    assert not transaction.retries["read_only"]
+
+
+async def test_transaction_try_lock() -> None:
+    session = transaction.session(isolation=Isolation.READ_COMMITTED)
+    other = transaction.session(isolation=Isolation.READ_COMMITTED)
+    async with session, session.begin():
+        assert await transaction.try_lock(session=session, name="locked")
+
+        async with other, other.begin():
+            assert not await transaction.try_lock(session=other, name="locked")
+            assert await transaction.try_lock(session=other, name="unlocked")
+
+    async with other, other.begin():
+        assert await transaction.try_lock(session=other, name="locked")
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from decimal import ROUND_HALF_UP, Decimal
+
+import httpx
+from corecrud import Where
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from core.app import crud
+from orm import (
+    ProductPriceModel,
+    ProductVariationCountModel,
+    ProductVariationValueModel,
+)
+from tests.endpoints import Route
+from typing_ import DictStrAny
+
+PRODUCT_VARIATION_COUNT_ID = 3
+
+
+def cart_line(cart: DictStrAny) -> DictStrAny:
+    (line,) = [
+        line
+        for line in cart["lines"]
+        if line["product_variation_count_id"] == PRODUCT_VARIATION_COUNT_ID
+    ]
+    return line
+
+
+class TestCartRoute(Route[DictStrAny]):
+    __url__ = "/cart/"
+    __method__ = "POST"
+    __response__ = DictStrAny
+
+    async def test_unauthorized_unsuccessfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client,
+            json={"product_variation_count_id": PRODUCT_VARIATION_COUNT_ID, "count": 1},
+        )
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_missing_variation_unsuccessfully(self, seller: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=seller, json={"product_variation_count_id": 10**9, "count": 1}
+        )
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_seller_successfully(
+        self, seller: httpx.AsyncClient, session: AsyncSession
+    ) -> None:
+        variation = await crud.products_variation_counts.select.one(
+            Where(ProductVariationCountModel.id == PRODUCT_VARIATION_COUNT_ID),
+            session=session,
+        )
+        value = await crud.products_variation_values.select.one(
+            Where(ProductVariationValueModel.id == variation.product_variation_value1_id),
+            session=session,
+        )
+        price = await crud.products_prices.select.one(
+            Where(
+                ProductPriceModel.product_id == value.product_id,
+                func.now().between(ProductPriceModel.start_date, ProductPriceModel.end_date),
+            ),
+            session=session,
+        )
+
+        counts = []
+        for count in (2, 3):
+            response, httpx_response = await self.response(
+                client=seller,
+                json={"product_variation_count_id": PRODUCT_VARIATION_COUNT_ID, "count": count},
+            )
+            assert response.ok
+            assert httpx_response.status_code == status.HTTP_200_OK
+            counts.append(cart_line(response.result)["count"])
+
+        # the populated cart of the seller may already hold the variation
+        populated = counts[0] - 2
+
+        line = cart_line(response.result)
+        assert counts == [populated + 2, populated + 5]
+
+        count = max(price.min_quantity, 1)
+        httpx_response = await seller.patch(url=f"/cart/{line['id']}/", params={"count": count})
+        cart = httpx_response.json()["result"]
+        line = cart_line(cart)
+        # PostgreSQL rounds numeric halves away from zero, `round()` to even
+        unit_price = (price.value * (1 - (price.discount or 0))).quantize(
+            Decimal("0.01"), rounding=ROUND_HALF_UP
+        )
+
+        assert line["count"] == count
+        assert Decimal(str(line["unit_price"])) == unit_price
+        assert Decimal(str(line["line_total"])) == unit_price * count
+        assert Decimal(str(cart["total"])) == sum(
+            Decimal(str(line["line_total"] or 0)) for line in cart["lines"]
+        )
+
+        httpx_response = await seller.delete(url=f"/cart/{line['id']}/")
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert not [
+            line
+            for line in httpx_response.json()["result"]["lines"]
+            if line["product_variation_count_id"] == PRODUCT_VARIATION_COUNT_ID
+        ]
+
+        httpx_response = await seller.delete(url=f"/cart/{line['id']}/")
+        assert httpx_response.status_code == status.HTTP_404_NOT_FOUND
+
+        if populated:
+            await seller.post(
+                url="/cart/",
+                json={
+                    "product_variation_count_id": PRODUCT_VARIATION_COUNT_ID,
+                    "count": populated,
+                },
+            )
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
-from typing import List
+from typing import List, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.routers.categories import get_all_categories_core
+from core.app import category_tree
+from schemas import Category
 
 
 async def test_get_all_categories_core(session: AsyncSession) -> None:
     result = await get_all_categories_core(session=session)
 
     assert isinstance(result, List)
+
+
+async def test_get_all_categories_core_nests_subtree(session: AsyncSession) -> None:
+    result = await get_all_categories_core(session=session)
+    root = next(category for category in result if category.parent_id is None)
+
+    def ids(category: Category) -> Set[int]:
+        return {category.id}.union(*(ids(child) for child in category.children or []))
+
+    assert ids(root) == await category_tree.subtree(session=session, category_id=root.id)
@@ -2,8 +2,14 @@ from __future__ import annotations
 
 import httpx
 import pytest
+from corecrud import Returning, Values, Where
+from passlib.context import CryptContext
 from starlette import status
 
+from core.app import crud
+from core.settings import password_settings
+from orm import UserCredentialsModel, UserModel
+from orm.core import async_sessionmaker
 from tests.endpoints import Route
 from typing_ import DictStrAny
 
@@ -41,3 +47,28 @@ class TestLoginRoute(Route[bool]):
         assert httpx_response.status_code == status.HTTP_403_FORBIDDEN
         assert isinstance(response.error, str)
         assert response.error_code == status.HTTP_403_FORBIDDEN
+
+    async def test_outdated_hash_rehashed_successfully(
+        self, client: httpx.AsyncClient, _seller_json: DictStrAny
+    ) -> None:
+        outdated = CryptContext(schemes=["pbkdf2_sha256"], pbkdf2_sha256__default_rounds=1000)
+        async with async_sessionmaker.begin() as session:
+            user = await crud.users.select.one(
+                Where(UserModel.email == _seller_json["email"]), session=session
+            )
+            await crud.users_credentials.update.one(
+                Values({UserCredentialsModel.password: outdated.hash(_seller_json["password"])}),
+                Where(UserCredentialsModel.user_id == user.id),
+                Returning(UserCredentialsModel.id),
+                session=session,
+            )
+
+        response, httpx_response = await self.response(client=client, json=_seller_json)
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        async with async_sessionmaker.begin() as session:
+            credentials = await crud.users_credentials.select.one(
+                Where(UserCredentialsModel.user_id == user.id), session=session
+            )
+        assert credentials.password.split("$")[2] == str(password_settings.PASSWORD_ROUNDS)
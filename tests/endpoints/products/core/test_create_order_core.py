@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List
+
+import pytest
+from corecrud import Returning, SelectFrom, Values, Where
+from fastapi.exceptions import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from api.routers.products import create_order_core
+from core.app import crud, transaction
+from enums import Isolation
+from orm import (
+    OrderModel,
+    OrderProductVariationModel,
+    ProductListingModel,
+    ProductModel,
+    ProductVariationCountModel,
+    ProductVariationValueModel,
+)
+
+SELLER_ID = 1
+PRODUCT_VARIATION_COUNT_IDS = (4, 5)
+CONCURRENCY = 5
+
+
+@asynccontextmanager
+async def read_committed() -> AsyncIterator[AsyncSession]:
+    async with transaction.session(isolation=Isolation.READ_COMMITTED) as session:
+        async with session.begin():
+            yield session
+
+
+@pytest.fixture
+async def orders() -> AsyncIterator[List[int]]:
+    """
+    Orders the test creates, deleted afterwards together with the stock and order
+    counts of the products, which are shared with the other tests.
+    """
+
+    created: List[int] = []
+    async with read_committed() as session:
+        counts = await crud.raws.select.many(
+            Where(ProductVariationCountModel.id.in_(PRODUCT_VARIATION_COUNT_IDS)),
+            SelectFrom(ProductVariationCountModel),
+            nested_select=[ProductVariationCountModel.id, ProductVariationCountModel.count],
+            session=session,
+        )
+        products = await crud.raws.select.many(
+            Where(
+                ProductModel.id == ProductVariationValueModel.product_id,
+                ProductVariationValueModel.id
+                == ProductVariationCountModel.product_variation_value1_id,
+                ProductVariationCountModel.id.in_(PRODUCT_VARIATION_COUNT_IDS),
+            ),
+            SelectFrom(ProductModel),
+            nested_select=[ProductModel.id, ProductModel.total_orders],
+            session=session,
+        )
+    try:
+        yield created
+    finally:
+        async with read_committed() as session:
+            for count in counts:
+                await crud.products_variation_counts.update.one(
+                    Values({ProductVariationCountModel.count: count.count}),
+                    Where(ProductVariationCountModel.id == count.id),
+                    Returning(ProductVariationCountModel.id),
+                    session=session,
+                )
+            for product in products:
+                await crud.products.update.one(
+                    Values(
+                        {
+                            ProductModel.total_orders: product.total_orders,
+                            ProductModel.version: ProductModel.version + 1,
+                        }
+                    ),
+                    Where(ProductModel.id == product.id),
+                    Returning(ProductModel.id),
+                    session=session,
+                )
+                await crud.products_listing.update.many(
+                    Values({ProductListingModel.total_orders: product.total_orders}),
+                    Where(ProductListingModel.id == product.id),
+                    Returning(ProductListingModel.id),
+                    session=session,
+                )
+            if created:
+                await crud.orders_products_variation.delete.many(
+                    Where(OrderProductVariationModel.order_id.in_(created)),
+                    Returning(OrderProductVariationModel.id),
+                    session=session,
+                )
+                await crud.orders.delete.many(
+                    Where(OrderModel.id.in_(created)),
+                    Returning(OrderModel.id),
+                    session=session,
+                )
+
+
+async def stock(count: int) -> None:
+    async with read_committed() as session:
+        for product_variation_count_id in PRODUCT_VARIATION_COUNT_IDS:
+            await crud.products_variation_counts.update.one(
+                Values({ProductVariationCountModel.count: count}),
+                Where(ProductVariationCountModel.id == product_variation_count_id),
+                Returning(ProductVariationCountModel.id),
+                session=session,
+            )
+
+
+async def cart(orders: List[int], counts: Dict[int, int]) -> int:
+    async with read_committed() as session:
+        order = await crud.orders.insert.one(
+            Values({OrderModel.seller_id: SELLER_ID, OrderModel.is_cart: True}),
+            Returning(OrderModel.id),
+            session=session,
+        )
+        await crud.orders_products_variation.insert.many(
+            Values(
+                [
+                    {
+                        OrderProductVariationModel.order_id: order,
+                        OrderProductVariationModel.product_variation_count_id: variation,
+                        OrderProductVariationModel.count: count,
+                    }
+                    for variation, count in counts.items()
+                ]
+            ),
+            Returning(OrderProductVariationModel.id),
+            session=session,
+        )
+
+    orders.append(order)
+    return order
+
+
+async def checkout(order_id: int) -> int:
+    try:
+        async with read_committed() as session:
+            await create_order_core(order_id=order_id, seller_id=SELLER_ID, session=session)
+    except HTTPException as exc:
+        return exc.status_code
+
+    return status.HTTP_200_OK
+
+
+async def state() -> Dict[str, List[int]]:
+    async with read_committed() as session:
+        counts = await crud.products_variation_counts.select.many(
+            Where(ProductVariationCountModel.id.in_(PRODUCT_VARIATION_COUNT_IDS)),
+            session=session,
+        )
+        orders = await crud.products.select.many(
+            Where(
+                ProductModel.id == ProductVariationValueModel.product_id,
+                ProductVariationValueModel.id.in_(
+                    [count.product_variation_value1_id for count in counts]
+                ),
+            ),
+            session=session,
+        )
+
+    return {
+        "stock": [count.count for count in sorted(counts, key=lambda count: count.id)],
+        "total_orders": sorted(product.total_orders for product in orders),
+        "versions": [
+            product.version for product in sorted(orders, key=lambda product: product.id)
+        ],
+    }
+
+
+async def test_create_order_core_all_lines(orders: List[int]) -> None:
+    await stock(count=10)
+    before = await state()
+    order_id = await cart(orders=orders, counts={4: 3, 5: 7})
+
+    assert await checkout(order_id=order_id) == status.HTTP_200_OK
+
+    after = await state()
+    assert after["stock"] == [7, 3]
+    assert after["total_orders"] == [count + 1 for count in before["total_orders"]]
+    assert after["versions"] == [version + 1 for version in before["versions"]]
+    assert await checkout(order_id=order_id) == status.HTTP_400_BAD_REQUEST
+
+
+async def test_create_order_core_insufficient_stock(orders: List[int]) -> None:
+    await stock(count=5)
+    before = await state()
+    order_id = await cart(orders=orders, counts={4: 3, 5: 6})
+
+    assert await checkout(order_id=order_id) == status.HTTP_409_CONFLICT
+    assert await state() == before
+
+
+async def test_create_order_core_concurrent(orders: List[int]) -> None:
+    await stock(count=5)
+    before = await state()
+    created = [await cart(orders=orders, counts={4: 2, 5: 2}) for _ in range(CONCURRENCY)]
+
+    results = await asyncio.gather(*(checkout(order_id=order_id) for order_id in created))
+
+    assert sorted(results) == [status.HTTP_200_OK] * 2 + [status.HTTP_409_CONFLICT] * 3
+    after = await state()
+    assert after["stock"] == [1, 1]
+    assert after["total_orders"] == [count + 2 for count in before["total_orders"]]
+    assert after["versions"] == [version + 2 for version in before["versions"]]
@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from typing import Final
+
+from api.routers.products import add_favorite_core, remove_favorite_core
+from core.app import favorites
+from orm.core import async_sessionmaker
+
+# not a favorite of the seller in other tests
+PRODUCT_ID: Final[int] = 24
+
+
+async def test_favorites_change_after_commit(seller_id: int) -> None:
+    async with async_sessionmaker.begin() as session:
+        await remove_favorite_core(product_id=PRODUCT_ID, seller_id=seller_id, session=session)
+        ids = await favorites.ids(session=session, seller_id=seller_id)
+
+    async with async_sessionmaker() as session, session.begin():
+        await add_favorite_core(product_id=PRODUCT_ID, seller_id=seller_id, session=session)
+        assert PRODUCT_ID not in ids
+        await session.rollback()
+    assert PRODUCT_ID not in ids
+
+    async with async_sessionmaker.begin() as session:
+        await add_favorite_core(product_id=PRODUCT_ID, seller_id=seller_id, session=session)
+        assert PRODUCT_ID not in ids
+    assert PRODUCT_ID in ids
+
+    async with async_sessionmaker.begin() as session:
+        await remove_favorite_core(product_id=PRODUCT_ID, seller_id=seller_id, session=session)
+        assert PRODUCT_ID in ids
+    assert PRODUCT_ID not in ids
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from corecrud import SelectFrom, Where
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import get_facets_core
+from core.app import category_tree, crud
+from orm import ProductListingModel
+
+
+async def test_get_facets_core(session: AsyncSession) -> None:
+    category_id = 1
+    result = await get_facets_core(session=session, category_id=category_id)
+    priced = await crud.raws.select.one(
+        Where(
+            ProductListingModel.category_id.in_(
+                await category_tree.subtree(session=session, category_id=category_id)
+            ),
+            ProductListingModel.price_value.is_not(None),
+        ),
+        SelectFrom(ProductListingModel),
+        nested_select=[func.count().label("count")],
+        session=session,
+    )
+
+    assert set(result) == {"properties", "variations", "prices"}
+    assert sum(bucket["count"] for bucket in result["prices"]) == priced["count"]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Awaitable, Callable, Iterator, List
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import get_info_for_product_card_core, get_product_card_core
+from logger import logger
+from orm.core.session import engine
+from schemas import Product
+
+BENCHMARK_ROUNDS = 50
+
+
+@pytest.fixture()
+def statements() -> Iterator[List[str]]:
+    executed: List[str] = []
+
+    def count(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+
+def by_id(card: Product) -> Any:
+    dumped = card.dict()
+    for key, value in dumped.items():
+        if isinstance(value, list):
+            dumped[key] = sorted(value, key=lambda item: item["id"])
+
+    return dumped
+
+
+async def test_get_product_card_core_matches_orm(session: AsyncSession) -> None:
+    card = await get_product_card_core(session=session, product_id=1)
+    orm = await get_info_for_product_card_core(session=session, product_id=1)
+
+    assert card is not None
+    assert by_id(card) == by_id(Product.from_orm(orm))
+
+
+async def test_get_product_card_core_missing(session: AsyncSession) -> None:
+    assert await get_product_card_core(session=session, product_id=10**9) is None
+
+
+async def test_get_product_card_core_single_statement(
+    session: AsyncSession, statements: List[str]
+) -> None:
+    await get_product_card_core(session=session, product_id=1)
+
+    assert len(statements) == 1
+
+
+@pytest.mark.benchmark
+async def test_product_card_benchmark(session: AsyncSession, statements: List[str]) -> None:
+    async def measure(loader: Callable[..., Awaitable[Any]]) -> float:
+        await loader(session=session, product_id=1)
+        statements.clear()
+        start = time.perf_counter()
+        for _ in range(BENCHMARK_ROUNDS):
+            await loader(session=session, product_id=1)
+            session.expunge_all()
+        return (time.perf_counter() - start) / BENCHMARK_ROUNDS
+
+    orm_elapsed = await measure(get_info_for_product_card_core)
+    orm_statements = len(statements) // BENCHMARK_ROUNDS
+    json_elapsed = await measure(get_product_card_core)
+    json_statements = len(statements) // BENCHMARK_ROUNDS
+
+    logger.info(
+        "Product card: selectinload %d statements %.2f ms, json aggregation %d statements %.2f ms",
+        orm_statements,
+        orm_elapsed * 1000,
+        json_statements,
+        json_elapsed * 1000,
+    )
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import get_products_core
+from core.app import category_tree
+from enums import SortType
+from schemas import BodyProductPaginationRequest
+
+
+async def test_get_products_core(session: AsyncSession) -> None:
+    result, next_cursor = await get_products_core(
+        session=session,
+        request=BodyProductPaginationRequest(),
+        offset=0,
+        limit=100,
+    )
+
+    assert isinstance(result, List)
+
+
+async def test_get_products_core_cursor_continues_offset(session: AsyncSession) -> None:
+    request = BodyProductPaginationRequest(sort_type=SortType.DATE, ascending=True)
+
+    first_page, next_cursor = await get_products_core(
+        session=session, request=request, offset=0, limit=5
+    )
+    by_cursor, _ = await get_products_core(
+        session=session, request=request, offset=0, limit=5, cursor=next_cursor
+    )
+    by_offset, _ = await get_products_core(session=session, request=request, offset=5, limit=5)
+
+    assert next_cursor
+    assert [product.id for product in by_cursor] == [product.id for product in by_offset]
+
+
+async def test_get_products_core_price_bounds(session: AsyncSession) -> None:
+    result, _ = await get_products_core(
+        session=session,
+        request=BodyProductPaginationRequest(min_price=10, max_price=500),
+        offset=0,
+        limit=100,
+    )
+
+    assert all(10 <= product.price_value <= 500 for product in result)
+
+
+async def test_get_products_core_includes_subcategories(session: AsyncSession) -> None:
+    subtree = await category_tree.subtree(session=session, category_id=1)
+    result, _ = await get_products_core(
+        session=session,
+        request=BodyProductPaginationRequest(category_id=1),
+        offset=0,
+        limit=100,
+    )
+
+    assert result
+    assert all(product.category_id in subtree for product in result)
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import pytest
+from corecrud import Limit, OrderBy, Where
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import get_ranked_products_core
+from core.app import crud, product_ranking
+from core.settings import cache_settings
+from enums import RankingType
+from orm import ProductRankingModel
+
+
+async def test_get_ranked_products_core(session: AsyncSession) -> None:
+    top = await crud.products_rankings.select.one(
+        Where(
+            ProductRankingModel.ranking == RankingType.POPULAR, ProductRankingModel.position == 1
+        ),
+        OrderBy(ProductRankingModel.category_id),
+        Limit(1),
+        session=session,
+    )
+    result = await get_ranked_products_core(
+        session=session,
+        product_id=top.product_id,
+        ranking=RankingType.POPULAR,
+        offset=0,
+        limit=100,
+    )
+    rankings = await crud.products_rankings.select.many(
+        Where(
+            ProductRankingModel.ranking == RankingType.POPULAR,
+            ProductRankingModel.category_id == top.category_id,
+            ProductRankingModel.position > 1,
+        ),
+        OrderBy(ProductRankingModel.position),
+        session=session,
+    )
+
+    assert [product.id for product in result] == [ranking.product_id for ranking in rankings]
+    assert all(product.category_id == top.category_id for product in result)
+
+
+async def test_rebuilt_rankings_are_not_stale(
+    session: AsyncSession, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    await product_ranking.rebuild(session=session)
+
+    assert not await product_ranking.stale(session=session)
+
+    monkeypatch.setattr(cache_settings, "PRODUCT_RANKINGS_REFRESH_INTERVAL", 0)
+    assert await product_ranking.stale(session=session)
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+from corecrud import OrderBy, Returning, SelectFrom, Values, Where
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import get_review_grades_info_core
+from api.routers.reviews import make_product_core
+from core.app import crud, product_cache, product_review_stats
+from orm import CategoryFacetModel, ProductListingModel, ProductModel
+
+PRODUCT_ID = 7
+SELLER_ID = 1
+
+
+async def facets(session: AsyncSession) -> List[Any]:
+    return await crud.raws.select.many(
+        SelectFrom(CategoryFacetModel),
+        OrderBy(CategoryFacetModel.id),
+        nested_select=[CategoryFacetModel.id, CategoryFacetModel.count],
+        session=session,
+    )
+
+
+async def test_get_review_grades_info_core(session: AsyncSession) -> None:
+    before = await facets(session=session)
+    for grade in (5, 3, 5):
+        await make_product_core(
+            session=session,
+            product_id=PRODUCT_ID,
+            review_grade=grade,
+            seller_id=SELLER_ID,
+            text="Review",
+        )
+
+    result = await get_review_grades_info_core(session=session, product_id=PRODUCT_ID)
+    listed = await crud.products_listing.select.one(
+        Where(ProductListingModel.id == PRODUCT_ID),
+        session=session,
+    )
+
+    assert result["review_count"] == 3
+    assert float(result["grade_average"]) == 4.3
+    assert result["details"] == [
+        {"grade_overall": 5, "review_count": 2},
+        {"grade_overall": 3, "review_count": 1},
+    ]
+    assert listed.review_count == 3
+    assert float(listed.grade_average) == 4.3
+    assert await facets(session=session) == before
+
+
+async def test_repair_grade_average(session: AsyncSession) -> None:
+    await crud.products.update.one(
+        Values({ProductModel.grade_average: 1.0}),
+        Where(ProductModel.id == PRODUCT_ID),
+        Returning(ProductModel.id),
+        session=session,
+    )
+    await crud.products_listing.update.one(
+        Values({ProductListingModel.grade_average: 1.0, ProductListingModel.review_count: 0}),
+        Where(ProductListingModel.id == PRODUCT_ID),
+        Returning(ProductListingModel.id),
+        session=session,
+    )
+    version = await product_cache.version(session=session, product_id=PRODUCT_ID)
+
+    await product_review_stats.repair(session=session)
+    result = await get_review_grades_info_core(session=session, product_id=PRODUCT_ID)
+    listed = await crud.raws.select.one(
+        Where(ProductListingModel.id == PRODUCT_ID),
+        SelectFrom(ProductListingModel),
+        nested_select=[ProductListingModel.grade_average, ProductListingModel.review_count],
+        session=session,
+    )
+
+    assert float(result["grade_average"]) == 4.3
+    assert float(listed.grade_average) == 4.3
+    assert listed.review_count == result["review_count"]
+    assert await product_cache.version(session=session, product_id=PRODUCT_ID) > version
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+from corecrud import SelectFrom
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.app import crud, product_listing
+from orm import CategoryFacetModel, ProductListingModel, ProductModel
+from orm.core import engine
+
+
+async def test_refresh_unchanged_skips_facets(session: AsyncSession) -> None:
+    executed: List[str] = []
+
+    def count(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    try:
+        await product_listing.refresh(session, ProductModel.id == 2)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", count)
+
+    assert not [statement for statement in executed if "INTO category_facet" in statement]
+    assert not [statement for statement in executed if "FROM category_facet" in statement]
+
+
+async def test_facets_match_listing(session: AsyncSession) -> None:
+    await product_listing.refresh(session, ProductModel.id.in_([1, 2, 3]))
+
+    listed = crud.raws.select.executor.query.build(
+        SelectFrom(ProductListingModel), nested_select=[ProductListingModel.id]
+    )
+    rows = await crud.raws.select.many(
+        SelectFrom(CategoryFacetModel),
+        nested_select=[
+            CategoryFacetModel.category_id,
+            CategoryFacetModel.facet,
+            CategoryFacetModel.value_id,
+            CategoryFacetModel.count,
+        ],
+        session=session,
+    )
+
+    assert {(row.category_id, row.facet, row.value_id): row.count for row in rows} == dict(
+        await product_listing.facets(session=session, products=listed)
+    )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from corecrud import Limit, Returning, SelectFrom, Values, Where
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.app import crud, product_listing
+from orm import ProductListingModel, ProductPriceModel
+
+EXPIRED = timedelta(seconds=1)
+
+
+async def expire_listing(session: AsyncSession, product_id: int) -> None:
+    await crud.products_listing.update.one(
+        Values({ProductListingModel.price_expires_at: func.now() - EXPIRED}),
+        Where(ProductListingModel.id == product_id),
+        Returning(ProductListingModel.id),
+        session=session,
+    )
+
+
+async def test_refresh_prices_closes_expired_window(session: AsyncSession) -> None:
+    product = await crud.products_listing.select.one(
+        Where(ProductListingModel.price_value.is_not(None)),
+        Limit(1),
+        session=session,
+    )
+    prices = await crud.raws.select.many(
+        Where(ProductPriceModel.product_id == product.id),
+        SelectFrom(ProductPriceModel),
+        nested_select=[ProductPriceModel.id, ProductPriceModel.end_date],
+        session=session,
+    )
+    await crud.products_prices.update.many(
+        Values({ProductPriceModel.end_date: func.now() - EXPIRED}),
+        Where(ProductPriceModel.product_id == product.id),
+        Returning(ProductPriceModel.id),
+        session=session,
+    )
+    await expire_listing(session=session, product_id=product.id)
+
+    await product_listing.refresh_prices(session=session)
+    refreshed = await crud.raws.select.one(
+        Where(ProductListingModel.id == product.id),
+        SelectFrom(ProductListingModel),
+        nested_select=[ProductListingModel.price_value, ProductListingModel.price_expires_at],
+        session=session,
+    )
+
+    assert refreshed.price_value is None
+    assert refreshed.price_expires_at is None
+
+    # the session commits, give the product its prices back for the other tests
+    for price in prices:
+        await crud.products_prices.update.one(
+            Values({ProductPriceModel.end_date: price.end_date}),
+            Where(ProductPriceModel.id == price.id),
+            Returning(ProductPriceModel.id),
+            session=session,
+        )
+    await expire_listing(session=session, product_id=product.id)
+    await product_listing.refresh_prices(session=session)
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from corecrud import Limit, SelectFrom
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.products import search_products_core
+from core.app import crud
+from enums import SortType
+from orm import ProductListingModel
+from schemas import BodyProductSearchRequest
+
+
+async def product_name(session: AsyncSession) -> str:
+    product = await crud.raws.select.one(
+        SelectFrom(ProductListingModel),
+        Limit(1),
+        nested_select=[ProductListingModel.name],
+        session=session,
+    )
+
+    return product.name
+
+
+async def test_search_products_core(session: AsyncSession) -> None:
+    name = await product_name(session=session)
+    result = await search_products_core(
+        session=session,
+        request=BodyProductSearchRequest(query=name),
+        offset=0,
+        limit=10,
+    )
+
+    assert result[0].name == name
+
+
+async def test_search_products_core_with_typo(session: AsyncSession) -> None:
+    name = await product_name(session=session)
+    result = await search_products_core(
+        session=session,
+        request=BodyProductSearchRequest(query=name[:-1] + "x"),
+        offset=0,
+        limit=10,
+    )
+
+    assert name in {product.name for product in result}
+
+
+async def test_search_products_core_sorted(session: AsyncSession) -> None:
+    name = await product_name(session=session)
+    result = await search_products_core(
+        session=session,
+        request=BodyProductSearchRequest(
+            query=name.split()[0], sort_type=SortType.PRICE, ascending=True
+        ),
+        offset=0,
+        limit=10,
+    )
+
+    prices = [product.price_value for product in result]
+    assert prices == sorted(prices)
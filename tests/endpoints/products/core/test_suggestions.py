@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from corecrud import Limit, Returning, SelectFrom, Values
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.app import crud, suggestions
+from core.app.suggestions.index import PrefixIndex
+from orm import ProductListingModel, UserSearchModel
+
+
+async def test_suggestions_complete_product_name(session: AsyncSession) -> None:
+    product = await crud.raws.select.one(
+        SelectFrom(ProductListingModel),
+        Limit(1),
+        nested_select=[ProductListingModel.name],
+        session=session,
+    )
+    await suggestions.rebuild(session=session)
+
+    assert product.name in suggestions.complete(prefix=product.name[:-1], limit=50)
+    assert product.name in suggestions.complete(prefix=product.name.split()[-1], limit=50)
+
+
+async def test_suggestions_update_popular_search(session: AsyncSession) -> None:
+    user = await crud.users.select.one(Limit(1), session=session)
+    await suggestions.rebuild(session=session)
+    await crud.users_searches.insert.many(
+        Values(
+            [
+                {
+                    UserSearchModel.user_id: user.id,
+                    UserSearchModel.search_query: "Unique autocomplete query",
+                    UserSearchModel.datetime: func.now(),
+                }
+                for _ in range(2)
+            ]
+        ),
+        Returning(UserSearchModel.id),
+        session=session,
+    )
+    await suggestions.update(session=session)
+
+    assert suggestions.complete(prefix="Unique autoc") == ["unique autocomplete query"]
+
+
+def test_prefix_index_build_matches_add() -> None:
+    entries = [("Red Dress", 3), ("red dress", 2), ("Dress Shoes", 4), ("Blue Shoes", 1)]
+    index = PrefixIndex()
+    for text, weight in entries:
+        index.add(text=text, weight=weight)
+
+    built = PrefixIndex.build(entries)
+
+    for prefix in ("d", "dress", "red", "shoes", "blue s"):
+        assert built.complete(prefix=prefix, limit=10) == index.complete(prefix=prefix, limit=10)
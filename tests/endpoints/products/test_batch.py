@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from schemas import Product
+from tests.endpoints import Route
+
+
+class TestProductBatchRoute(Route[List[Product]]):
+    __url__ = "/products/batch/"
+    __method__ = "POST"
+    __response__ = List[Product]
+
+    async def test_ordered_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client, json={"product_ids": [5, 10**9, 3, 5, 1]}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert [product.id for product in response.result] == [5, 3, 1]
+        assert response.detail == {"missing": [10**9]}
+        assert all(product.prices is not None for product in response.result)
+
+    async def test_too_many_ids_failed(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client, json={"product_ids": list(range(1, 302))}
+        )
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
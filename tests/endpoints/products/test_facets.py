@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import httpx
+from starlette import status
+
+from tests.endpoints import Route
+from typing_ import DictStrAny
+
+
+class TestFacetsRoute(Route[DictStrAny]):
+    __url__ = "/products/facets/"
+    __method__ = "GET"
+    __response__ = DictStrAny
+
+    async def test_unauthorized_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, params={"category_id": 1})
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert all(facet["count"] > 0 for facet in response.result["variations"])
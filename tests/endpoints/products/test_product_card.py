@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import httpx
+from starlette import status
+
+from core.app import product_cache
+from orm import ProductModel
+from orm.core import async_sessionmaker
+from schemas import Product
+from tests.endpoints import Route
+
+
+class TestProductCardRoute(Route[Product]):
+    __url__ = "/products/productCard/2/"
+    __method__ = "GET"
+    __response__ = Product
+
+    async def test_etag_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client)
+
+        assert response.ok
+        assert response.result.id == 2
+        assert httpx_response.headers["ETag"]
+
+        not_modified = await client.get(
+            url=self.__url__, headers={"If-None-Match": httpx_response.headers["ETag"]}
+        )
+
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["ETag"] == httpx_response.headers["ETag"]
+
+    async def test_version_bump_successfully(self, client: httpx.AsyncClient) -> None:
+        _, before = await self.response(client=client)
+        async with async_sessionmaker.begin() as session:
+            await product_cache.bump(session, ProductModel.id == 2)
+
+        response, after = await self.response(
+            client=client, headers={"If-None-Match": before.headers["ETag"]}
+        )
+
+        assert response.ok
+        assert after.status_code == status.HTTP_200_OK
+        assert after.headers["ETag"] != before.headers["ETag"]
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from schemas import ProductListing
+from tests.endpoints import Route
+
+
+class TestProductPaginationRoute(Route[List[ProductListing]]):
+    __url__ = "/products/pagination/"
+    __method__ = "POST"
+    __response__ = List[ProductListing]
+
+    async def test_unauthorized_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client, json={}, params={"limit": 10}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert isinstance(response.result, List)
+        assert isinstance(response.detail, dict) and response.detail["next_cursor"]
+
+    async def test_next_cursor_successfully(self, client: httpx.AsyncClient) -> None:
+        first, _ = await self.response(client=client, json={}, params={"limit": 10})
+        response, httpx_response = await self.response(
+            client=client,
+            json={},
+            params={"limit": 10, "cursor": first.detail["next_cursor"]},
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert not {product.id for product in first.result} & {
+            product.id for product in response.result
+        }
+
+    async def test_invalid_cursor_failed(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client, json={}, params={"cursor": "invalid"}
+        )
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.error_code == status.HTTP_400_BAD_REQUEST
+
+    async def test_seller_is_favorite_successfully(self, seller: httpx.AsyncClient) -> None:
+        first, _ = await self.response(client=seller, json={}, params={"limit": 10})
+        favorite = first.result[0].id
+        await seller.post(url="/products/addFavorite/", params={"product_id": favorite})
+
+        response, httpx_response = await self.response(
+            client=seller, json={}, params={"limit": 10}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert {product.id for product in response.result if product.is_favorite} >= {favorite}
+        assert all(product.is_favorite is not None for product in response.result)
+
+    async def test_invalid_token_anonymous_successfully(self, client: httpx.AsyncClient) -> None:
+        client.cookies.set("access_token_cookie", "invalid")
+        response, httpx_response = await self.response(
+            client=client, json={}, params={"limit": 10}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert all(product.is_favorite is None for product in response.result)
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from schemas import ProductListing, UserSearch
+from tests.endpoints import Route
+
+
+class TestProductSearchRoute(Route[List[ProductListing]]):
+    __url__ = "/products/search/"
+    __method__ = "POST"
+    __response__ = List[ProductListing]
+
+    async def test_unauthorized_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, json={"query": "shirt"})
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert isinstance(response.result, List)
+
+    async def test_seller_query_saved_successfully(self, seller: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=seller, json={"query": "remembered query"}
+        )
+        searches = await seller.get("/users/latestSearches/", params={"limit": 100})
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert "remembered query" in {
+            UserSearch.parse_obj(search).search_query for search in searches.json()["result"]
+        }
+
+    async def test_empty_query_failed(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, json={"query": ""})
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from tests.endpoints import Route
+from typing_ import DictStrAny
+
+PRODUCT_VARIATION_COUNT_ID = 3
+
+
+class TestShowCartRoute(Route[List[DictStrAny]]):
+    __url__ = "/products/showCart/"
+    __method__ = "GET"
+    __response__ = List[DictStrAny]
+
+    async def test_unauthorized_unsuccessfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client)
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_seller_old_shape_successfully(self, seller: httpx.AsyncClient) -> None:
+        cart = await seller.post(
+            url="/cart/",
+            json={"product_variation_count_id": PRODUCT_VARIATION_COUNT_ID, "count": 1},
+        )
+        (line,) = [
+            line
+            for line in cart.json()["result"]["lines"]
+            if line["product_variation_count_id"] == PRODUCT_VARIATION_COUNT_ID
+        ]
+        try:
+            response, httpx_response = await self.response(client=seller)
+        finally:
+            # back to the populated count, if the cart held the variation already
+            if line["count"] > 1:
+                await seller.patch(url=f"/cart/{line['id']}/", params={"count": line["count"] - 1})
+            else:
+                await seller.delete(url=f"/cart/{line['id']}/")
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert response.result
+        assert set(response.result[0]) >= {"order_id", "cart_count", "stock_count", "price_value"}
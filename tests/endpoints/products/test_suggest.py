@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from tests.endpoints import Route
+
+
+class TestSuggestRoute(Route[List[str]]):
+    __url__ = "/products/suggest/"
+    __method__ = "GET"
+    __response__ = List[str]
+
+    async def test_unauthorized_successfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, params={"query": "sh"})
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert isinstance(response.result, List)
+
+    async def test_empty_query_failed(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, params={"query": ""})
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from corecrud import Returning, Values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.reviews import create_product_review, show_product_review_core
+from core.app import crud
+from orm import ProductReviewReactionModel
+from schemas import QueryCursorPaginationRequest
+
+PRODUCT_ID = 9
+SELLER_ID = 1
+
+
+async def test_show_product_review_core(session: AsyncSession) -> None:
+    reviews = [
+        await create_product_review(
+            session=session,
+            product_id=PRODUCT_ID,
+            seller_id=SELLER_ID,
+            text=f"Review {number}",
+            grade_overall=5,
+        )
+        for number in range(3)
+    ]
+    await crud.products_reviews_reactions.insert.many(
+        Values(
+            [
+                {
+                    ProductReviewReactionModel.product_review_id: reviews[-1].id,
+                    ProductReviewReactionModel.seller_id: SELLER_ID,
+                    ProductReviewReactionModel.reaction: reaction,
+                }
+                for reaction in (True, True, False)
+            ]
+        ),
+        Returning(ProductReviewReactionModel.id),
+        session=session,
+    )
+
+    first, cursor = await show_product_review_core(
+        session=session,
+        product_id=PRODUCT_ID,
+        pagination=QueryCursorPaginationRequest(limit=2),
+    )
+    second, last_cursor = await show_product_review_core(
+        session=session,
+        product_id=PRODUCT_ID,
+        pagination=QueryCursorPaginationRequest(limit=2, cursor=cursor),
+    )
+
+    assert [review.id for review in first + second] == [review.id for review in reviews[::-1]]
+    assert (first[0].likes, first[0].dislikes) == (2, 1)
+    assert (second[0].likes, second[0].dislikes) == (0, 0)
+    assert last_cursor is None
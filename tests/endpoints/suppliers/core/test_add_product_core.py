@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.routers.products import get_facets_core
 from api.routers.suppliers import add_product_info_core
 from orm import ProductModel, UserModel
 from schemas import BodyProductUploadRequest
@@ -20,3 +21,23 @@ async def test_add_product_info_core(
     )
 
     assert isinstance(result, ProductModel)
+
+
+async def test_add_product_info_core_counts_facets(
+    session: AsyncSession,
+    add_product_request: DictStrAny,
+    pure_supplier: UserModel,
+) -> None:
+    request = BodyProductUploadRequest.parse_obj(add_product_request)
+    before = await get_facets_core(session=session, category_id=request.category_id)
+
+    await add_product_info_core(
+        request=request,
+        supplier_id=pure_supplier.supplier.id,
+        session=session,
+    )
+    after = await get_facets_core(session=session, category_id=request.category_id)
+
+    assert sum(bucket["count"] for bucket in after["prices"]) == (
+        sum(bucket["count"] for bucket in before["prices"]) + 1
+    )
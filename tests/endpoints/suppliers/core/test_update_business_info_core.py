@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.routers.suppliers import add_product_info_core, update_business_info_core
+from core.app import product_cache
+from orm import UserModel
+from schemas import BodyProductUploadRequest, BodySupplierDataUpdateRequest
+from typing_ import DictStrAny
+
+
+async def test_update_business_info_core_bumps_product_versions(
+    session: AsyncSession,
+    add_product_request: DictStrAny,
+    pure_supplier: UserModel,
+) -> None:
+    product = await add_product_info_core(
+        request=BodyProductUploadRequest.parse_obj(add_product_request),
+        supplier_id=pure_supplier.supplier.id,
+        session=session,
+    )
+    before = await product_cache.version(session=session, product_id=product.id)
+
+    await update_business_info_core(
+        session=session,
+        user=pure_supplier,
+        supplier_data_request=BodySupplierDataUpdateRequest(license_number="1234567890"),
+        company_data_request=None,
+        company_phone_data_request=None,
+    )
+
+    assert await product_cache.version(session=session, product_id=product.id) == before + 1
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+from typing import Any, AsyncIterator, List
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from core.app import principals, revocations
+from core.settings import jwt_settings
+from orm.core import async_sessionmaker, engine
+from typing_ import DictStrAny
+
+SELLER_USER_EMAIL = "seller@mail.ru"
+
+
+@pytest.fixture()
+async def statements() -> AsyncIterator[List[str]]:
+    executed: List[str] = []
+
+    def count(*args: Any) -> None:
+        executed.append(args[2])
+
+    principals.clear()
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+    principals.clear()
+
+
+def loads(executed: List[str], table: str) -> int:
+    return sum(f"FROM {table}" in statement for statement in executed)
+
+
+def loads_user(executed: List[str]) -> bool:
+    return bool(loads(executed=executed, table='"user"'))
+
+
+async def test_cached_principal_skips_load(
+    seller: httpx.AsyncClient, statements: List[str]
+) -> None:
+    httpx_response = await seller.get(url="/login/current/")
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert loads_user(statements)
+
+    statements.clear()
+    httpx_response = await seller.get(url="/login/current/")
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert httpx_response.json()["result"]["email"] == SELLER_USER_EMAIL
+    assert not loads_user(statements)
+
+
+async def test_invalidate_after_commit(
+    seller: httpx.AsyncClient, statements: List[str], session: AsyncSession
+) -> None:
+    httpx_response = await seller.get(url="/login/current/")
+    user_id = httpx_response.json()["result"]["id"]
+    user = principals.get(user_id=user_id, loader="account")
+    assert user is not None
+
+    principals.invalidate(session=session, user_id=user_id)
+    assert principals.get(user_id=user_id, loader="account") is None
+
+    # a concurrent request caches the profile before the change is committed
+    principals.put(session=session, user=user, loader="account")
+    await session.commit()
+    assert principals.get(user_id=user_id, loader="account") is None
+
+
+async def test_seller_id_principal_loads_seller_id_only(
+    seller: httpx.AsyncClient, statements: List[str]
+) -> None:
+    httpx_response = await seller.get(url="/cart/")
+
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert loads(executed=statements, table='"user"') == 1
+    assert not loads(executed=statements, table="seller_address")
+    assert not loads(executed=statements, table="supplier")
+
+
+async def test_supplier_principal_skips_seller_branch(
+    supplier: httpx.AsyncClient, statements: List[str]
+) -> None:
+    httpx_response = await supplier.get(url="/suppliers/hasCompanyInfo/")
+
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert loads(executed=statements, table="company")
+    assert not loads(executed=statements, table="seller")
+    assert not loads(executed=statements, table="admin")
+
+
+async def test_role_claims_skip_load(
+    client: httpx.AsyncClient,
+    _seller_json: DictStrAny,
+    statements: List[str],
+    session: AsyncSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(jwt_settings, "ROLE_CLAIMS", True)
+    await client.post(url="/login/", json=_seller_json)
+    user_id = (await client.get(url="/login/current/")).json()["result"]["id"]
+
+    statements.clear()
+    httpx_response = await client.get(url="/cart/")
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert not loads_user(statements)
+
+    revocations.revoke(session=session, user_id=user_id)
+    await session.commit()
+    try:
+        httpx_response = await client.get(url="/cart/")
+        assert httpx_response.status_code == status.HTTP_403_FORBIDDEN
+    finally:
+        async with async_sessionmaker.begin() as _session:
+            await revocations.refresh(session=_session)
+
+    assert not revocations.revoked(user_id=user_id)
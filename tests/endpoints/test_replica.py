@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from typing import Any, AsyncIterator, List
+
+import httpx
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette import status
+
+from core.app import transaction
+from core.routing import PRIMARY_COOKIE
+from core.settings import database_settings
+
+# not a favorite of the seller in other tests
+PRODUCT_ID = 97
+
+
+@pytest.fixture()
+async def replica(monkeypatch: pytest.MonkeyPatch) -> AsyncIterator[List[str]]:
+    # the primary database stands in for its replica
+    engine = create_async_engine(database_settings.url)
+    executed: List[str] = []
+
+    def count(*args: Any) -> None:
+        executed.append(args[2])
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    monkeypatch.setattr(
+        transaction,
+        "replica",
+        engine.execution_options(isolation_level="REPEATABLE READ", postgresql_readonly=True),
+    )
+    yield executed
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+    await engine.dispose()
+
+
+async def test_read_only_route_reads_replica(
+    client: httpx.AsyncClient, replica: List[str]
+) -> None:
+    httpx_response = await client.get(url="/common/country/")
+
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert httpx_response.json()["result"]
+    assert replica
+    assert PRIMARY_COOKIE not in httpx_response.cookies
+
+
+async def test_write_pins_primary(seller: httpx.AsyncClient, replica: List[str]) -> None:
+    httpx_response = await seller.delete(
+        url="/products/removeFavorite/", params={"product_id": PRODUCT_ID}
+    )
+
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert float(httpx_response.cookies[PRIMARY_COOKIE]) > time.time()
+
+    replica.clear()
+    httpx_response = await seller.get(url="/common/country/")
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert not replica
+
+    seller.cookies.delete(PRIMARY_COOKIE)
+    httpx_response = await seller.get(url="/common/country/")
+    assert httpx_response.status_code == status.HTTP_200_OK
+    assert replica
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import httpx
+from corecrud import Returning, Values, Where
+from starlette import status
+
+from core.app import crud, principals, transaction
+from orm import AdminModel
+from orm.core import async_sessionmaker
+from tests.endpoints import Route
+from typing_ import DictStrAny
+
+
+class TestStatsRoute(Route[DictStrAny]):
+    __url__ = "/stats/"
+    __method__ = "GET"
+    __response__ = DictStrAny
+
+    async def test_unauthorized_failed(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client)
+
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_not_admin_failed(self, seller: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=seller)
+
+        assert httpx_response.status_code == status.HTTP_404_NOT_FOUND
+
+    async def test_admin_successfully(self, seller: httpx.AsyncClient) -> None:
+        user_id = (await seller.get(url="/login/current/")).json()["result"]["id"]
+        async with async_sessionmaker.begin() as session:
+            await crud.admins.insert.one(
+                Values({AdminModel.user_id: user_id}), Returning(AdminModel.id), session=session
+            )
+            principals.invalidate(session=session, user_id=user_id)
+        try:
+            response, httpx_response = await self.response(client=seller)
+        finally:
+            async with async_sessionmaker.begin() as session:
+                await crud.admins.delete.many(
+                    Where(AdminModel.user_id == user_id), Returning(AdminModel.id), session=session
+                )
+                principals.invalidate(session=session, user_id=user_id)
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert response.result["transactions"] == transaction.stats()
+        assert response.result["pools"]["primary"]["checkouts"]
+        assert response.result["pools"]["replica"] is None
+        assert response.result["passwords"]["calls"]
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from tests.endpoints import Route
+
+
+class TestAreFavoritesRoute(Route[List[int]]):
+    __url__ = "/users/areFavorites/"
+    __method__ = "POST"
+    __response__ = List[int]
+
+    async def test_unauthorized_unsuccessfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client, json={"product_ids": [1]})
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_seller_successfully(self, seller: httpx.AsyncClient) -> None:
+        for product_id in (21, 22):
+            await seller.post(url="/products/addFavorite/", params={"product_id": product_id})
+        # other tests may have added any of them
+        for product_id in (23, 21, 20):
+            await seller.delete(url="/products/removeFavorite/", params={"product_id": product_id})
+
+        response, httpx_response = await self.response(
+            client=seller, json={"product_ids": [23, 22, 21, 20]}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert response.result == [22]
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import Final
+
+import httpx
+from corecrud import Returning, Values, Where
+from starlette import status
+
+from core.app import crud
+from orm import SellerFavoriteModel
+from orm.core import async_sessionmaker
+from tests.endpoints import Route
+
+# not a favorite of the seller in other tests
+PRODUCT_ID: Final[int] = 26
+
+
+class TestIsFavoriteRoute(Route[bool]):
+    __url__ = "/users/isFavorite/"
+    __method__ = "GET"
+    __response__ = bool
+
+    async def test_unauthorized_unsuccessfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(
+            client=client, params={"product_id": PRODUCT_ID}
+        )
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_added_by_another_worker_successfully(
+        self, seller: httpx.AsyncClient, seller_id: int
+    ) -> None:
+        # loads the per-worker favorites cache of the seller
+        await seller.post(url="/users/areFavorites/", json={"product_ids": [PRODUCT_ID]})
+        async with async_sessionmaker.begin() as session:
+            await crud.sellers_favorites.insert.one(
+                Values(
+                    {
+                        SellerFavoriteModel.seller_id: seller_id,
+                        SellerFavoriteModel.product_id: PRODUCT_ID,
+                    }
+                ),
+                Returning(SellerFavoriteModel.id),
+                session=session,
+            )
+        try:
+            response, httpx_response = await self.response(
+                client=seller, params={"product_id": PRODUCT_ID}
+            )
+        finally:
+            async with async_sessionmaker.begin() as session:
+                await crud.sellers_favorites.delete.many(
+                    Where(
+                        SellerFavoriteModel.seller_id == seller_id,
+                        SellerFavoriteModel.product_id == PRODUCT_ID,
+                    ),
+                    Returning(SellerFavoriteModel.id),
+                    session=session,
+                )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert response.result is True
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+from starlette import status
+
+from schemas import ProductListing
+from tests.endpoints import Route
+
+
+class TestShowFavoritesRoute(Route[List[ProductListing]]):
+    __url__ = "/users/showFavorites/"
+    __method__ = "GET"
+    __response__ = List[ProductListing]
+
+    async def test_unauthorized_unsuccessfully(self, client: httpx.AsyncClient) -> None:
+        response, httpx_response = await self.response(client=client)
+
+        assert not response.ok
+        assert httpx_response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    async def test_seller_successfully(self, seller: httpx.AsyncClient) -> None:
+        for product_id in (11, 12, 13):
+            await seller.post(url="/products/addFavorite/", params={"product_id": product_id})
+
+        response, httpx_response = await self.response(client=seller, params={"limit": 2})
+        next_response, _ = await self.response(
+            client=seller, params={"limit": 2, "cursor": response.detail["next_cursor"]}
+        )
+
+        assert response.ok
+        assert httpx_response.status_code == status.HTTP_200_OK
+        assert [product.id for product in response.result] == [13, 12]
+        assert [product.id for product in next_response.result][:1] == [11]
@@ -0,0 +1 @@
+# ORM tests module
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import pytest
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.settings import database_settings
+from orm.core.pool import InstrumentedPool
+
+
+async def test_pool_stats() -> None:
+    engine = create_async_engine(
+        database_settings.url,
+        poolclass=InstrumentedPool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.1,
+    )
+    try:
+        async with engine.connect():
+            with pytest.raises(TimeoutError):
+                async with engine.connect():
+                    pass
+
+            stats = engine.pool.stats()
+            assert stats["checked_out"] == 1
+    finally:
+        await engine.dispose()
+
+    assert stats["checkouts"] == 1
+    assert stats["peak"] == 1
+    assert stats["timeouts"] == 1
+    assert stats["wait_max"] >= 0.1